@@ -1,6 +1,7 @@
 from core.game import Game
 from entities.player import Player
-from entities.weapons.weapon import Gun
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15, GLOCK_17
 
 
 if __name__ == "__main__":
@@ -9,8 +10,8 @@ if __name__ == "__main__":
     hunter = Player("Hunter 1", "hunter", game)
     prop = Player("Prop 1", "prop", game)
 
-    glock = Gun("Glock 17")
-    ar15 = Gun("AR-15")
+    glock = Gun(GLOCK_17)
+    ar15 = Gun(AR_15)
 
     hunter.attempt_pickup_weapon(glock)
     hunter.attempt_use_weapon()
@@ -20,4 +21,7 @@ if __name__ == "__main__":
     hunter.attempt_use_weapon()
 
     game.switch_state(game.playing_state)
+    # Let the AR-15 cycle after its blank before the live shot.
+    game.update(0.1)
     hunter.attempt_use_weapon()
+    game.update(0.1)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from core.events import ActionDenied
 from entities.player import Player
 from entities.weapons.weapon import Weapon
 
@@ -13,39 +14,92 @@ class ActionRouter:
     def __init__(self, game: "Game"):
         self.game = game
 
-    def attempt_move(self, player: Player, new_position):
-        if player.status.blocks("move"):
-            self.game.notify_player(player, "Denied: you can't move right now.")
+    def attempt_move(
+        self,
+        player: Player,
+        new_position,
+        seq: Optional[int] = None,
+        predicted_position=None,
+    ):
+        if not self.game.inputs.accept(player, seq):
             return None
-        return self.game.state.handle_move(player, new_position)
+
+        if player.status.blocks("move"):
+            self.game.emit(ActionDenied(player, "move", "Denied: you can't move right now."))
+            result = None
+        else:
+            result = self.game.state.handle_move(player, new_position)
+
+        if seq is None:
+            return result
+        if predicted_position is None:
+            predicted_position = new_position
+        movement = self.game.movement
+        if movement.pending(player):
+            # Queued in a movement batch; reconciled when the batch lands.
+            movement.defer_reconcile(player, seq, predicted_position)
+            return True
+        return self.game.inputs.reconcile(player, seq, predicted_position)
 
     def attempt_pickup_weapon(self, player: Player, weapon: Weapon):
         if player.status.blocks("pickup_weapon"):
-            self.game.notify_player(player, "Denied: you can't pick up weapons right now.")
+            self.game.emit(
+                ActionDenied(player, "pickup_weapon", "Denied: you can't pick up weapons right now.")
+            )
             return None
         return self.game.state.handle_pickup_weapon(player, weapon)
 
     def attempt_switch_slot(self, player: Player, slot_name: str):
         if player.status.blocks("switch_slot"):
-            self.game.notify_player(player, "Denied: you can't switch weapons right now.")
+            self.game.emit(
+                ActionDenied(player, "switch_slot", "Denied: you can't switch weapons right now.")
+            )
             return None
         return self.game.state.handle_switch_slot(player, slot_name)
 
-    def attempt_use_weapon(self, player: Player):
+    def attempt_use_weapon(
+        self,
+        player: Player,
+        client_time: Optional[float] = None,
+        seq: Optional[int] = None,
+    ):
+        if not self.game.inputs.accept(player, seq):
+            return None
         if player.status.blocks("use_weapon"):
-            self.game.notify_player(player, "Denied: you can't use weapons right now.")
+            self.game.emit(
+                ActionDenied(player, "use_weapon", "Denied: you can't use weapons right now.")
+            )
+            return None
+        return self.game.state.handle_use_weapon(player, client_time)
+
+    def attempt_hold_trigger(self, player: Player, held: bool):
+        if held and player.status.blocks("use_weapon"):
+            self.game.emit(
+                ActionDenied(player, "use_weapon", "Denied: you can't use weapons right now.")
+            )
+            return None
+        return self.game.state.handle_hold_trigger(player, held)
+
+    def attempt_reload(self, player: Player):
+        if player.status.blocks("reload"):
+            self.game.emit(ActionDenied(player, "reload", "Denied: you can't reload right now."))
+            return None
+        return self.game.state.handle_reload(player)
+
+    def attempt_steal(self, player: Player):
+        if player.status.blocks("steal"):
+            self.game.emit(ActionDenied(player, "steal", "Denied: you can't steal right now."))
             return None
-        return self.game.state.handle_use_weapon(player)
+        return self.game.state.handle_steal(player)
 
     def attempt_possess(self, player: Player, obj_name: str):
         return self.game.state.handle_possess(player, obj_name)
 
     def attempt_add_effect(self, player, effect):
         if player.status.blocks("add_effect"):
-            self.game.notify_player(
-            player,
-            "Denied: you can't receive an effect right now.",
-        ) 
+            self.game.emit(
+                ActionDenied(player, "add_effect", "Denied: you can't receive an effect right now.")
+            )
             return None
 
         return self.game.state.handle_add_effect(player, effect)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.weapons.bullet import Bullet
+    from entities.weapons.impact.area_impact import AreaImpact
+
+
+class AreaController:
+    """
+    Resolves every area-of-effect impact of a tick in one batched pass.
+
+    AreaImpacts only queue themselves when a bullet hits. resolve() then
+    builds one spatial hash of the live players and answers all radius
+    queries against it, instead of scanning every player per explosion.
+    """
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+        self._impacts: list["AreaImpact"] = []
+        self._bullets: list["Bullet"] = []
+        self._origins: list[tuple[float, float]] = []
+
+    def queue(self, impact: "AreaImpact", bullet: "Bullet", origin: tuple[float, float]) -> None:
+        self._impacts.append(impact)
+        self._bullets.append(bullet)
+        self._origins.append(origin)
+
+    def reset(self) -> None:
+        self._impacts.clear()
+        self._bullets.clear()
+        self._origins.clear()
+
+    def resolve(self) -> None:
+        if not self._impacts:
+            return
+
+        grid: SpatialHash = SpatialHash(max(impact.radius for impact in self._impacts))
+        for player in self.game.hunters + self.game.props:
+            x, y = player.position
+            grid.insert(player, x, y)
+
+        for impact, bullet, origin in zip(self._impacts, self._bullets, self._origins):
+            targets = []
+            scales = []
+            for player, distance in grid.query_radius(origin[0], origin[1], impact.radius):
+                if impact.affects(bullet, player):
+                    targets.append(player)
+                    scales.append(impact.falloff_scale(distance))
+
+            if targets:
+                impact.resolve(self.game, bullet, origin, targets, scales)
+
+        self._impacts.clear()
+        self._bullets.clear()
+        self._origins.clear()
@@ -0,0 +1,414 @@
+# checkpoint.py
+#
+# Crash-safe periodic checkpoints of running matches.
+#
+# Design notes:
+# - The tick thread only captures: plain copies of per-player scalars, gun
+#   state, effect tables, bullets and pending timers. Anything immutable
+#   (effects, behaviors, specs) is shared, not copied.
+# - Encoding (pickle), writing and fsync run on one background thread.
+#   Each match keeps only its newest pending capture, so a slow disk drops
+#   intermediate checkpoints instead of queueing memory or blocking ticks.
+# - Files are written to a temp name, fsynced, renamed over the previous
+#   checkpoint, and the directory is fsynced, so a crash leaves either the
+#   old or the new checkpoint, never a torn one.
+# - Timers are stored as (controller attribute, method name, args) with
+#   players and owned weapons stored by reference, and are rebound on
+#   restore. Held-trigger shots aren't stored; re-holding the trigger
+#   reschedules them at the gun's next fire time.
+# - Not captured: the level's geometry (it is reloaded from its path),
+#   possession, objectives, navigation caches and lag-compensation history.
+#
+# Checkpoints are pickles and must only be loaded from trusted local disk.
+
+from __future__ import annotations
+
+import copy
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from core.status import Status
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_catalog import GunCatalog, default_catalog
+from entities.weapons.weapon import Weapon
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.effects.active_effects import ActiveEffects
+    from entities.weapons.bullet import Bullet
+    from entities.weapons.gun_spec import GunSpec
+
+MAGIC = b"CTCK\x01"
+SUFFIX = ".ckpt"
+_STATES = ("lobby_state", "preparing_state", "playing_state")
+
+
+@dataclass(slots=True)
+class GunState:
+    # Catalog guns are stored by name and catalog path so a restore picks
+    # up the current spec from the catalog the gun came from.
+    spec: "str | GunSpec"
+    catalog: Optional[str]
+    ammo: int
+    next_fire_time: float
+    reloading: bool
+
+
+@dataclass(slots=True)
+class PlayerState:
+    name: str
+    role: str
+    position: tuple
+    direction: tuple
+    health: float
+    velocity: tuple
+    height: float
+    vertical_velocity: float
+    current_weapon_slot: str
+    status: tuple
+    active_effects: "ActiveEffects"
+    loadout: dict[str, Optional[GunState]]
+
+
+@dataclass(slots=True)
+class MatchSnapshot:
+    time: float
+    state: str
+    level_path: Optional[str]
+    teams: tuple[list[PlayerState], list[PlayerState], list[PlayerState]]
+    bullets: list["Bullet"]
+    timers: list[tuple[float, tuple[str, str, tuple]]]
+    held_triggers: list[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _PlayerRef:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class _WeaponRef:
+    owner: str
+    slot: str
+
+
+# ============================================================
+# Capture (tick thread) and restore
+# ============================================================
+
+
+def capture(game: "Game") -> MatchSnapshot:
+    """Cheap in-memory copy of the match; call between ticks."""
+    teams = tuple(
+        [_capture_player(player) for player in roster]
+        for roster in (game.hunters, game.props, game.guardian_angels)
+    )
+    state = next(name for name in _STATES if getattr(game, name) is game.state)
+
+    owners = {id(value): name for name, value in vars(game).items()}
+    fire_held = game.weapons._fire_held_trigger
+    timers = []
+    for due, (callback, args) in game.timers.entries():
+        if callback == fire_held:
+            continue
+        timers.append(
+            (due, (owners[id(callback.__self__)], callback.__name__, tuple(_ref(arg) for arg in args)))
+        )
+
+    return MatchSnapshot(
+        time=game.time,
+        state=state,
+        level_path=None if game.level is None else game.level.path,
+        teams=teams,
+        bullets=[copy.copy(bullet) for bullet in game.bullets],
+        timers=timers,
+        held_triggers=[player.name for player in game.weapons.held_triggers()],
+    )
+
+
+def restore(snapshot: MatchSnapshot, game: Optional["Game"] = None) -> "Game":
+    """Rebuild the match in game (reset first) or in a new headless Game."""
+    if game is None:
+        from core.game import Game
+
+        game = Game(text_output=False)
+    else:
+        game.reset()
+
+    if snapshot.level_path is not None:
+        game.load_level(snapshot.level_path)
+    game.state = getattr(game, snapshot.state)
+    game.time = snapshot.time
+    game.timers.reset(snapshot.time)
+
+    players: dict[str, Player] = {}
+    catalogs: dict[str, GunCatalog] = {}
+    for states in snapshot.teams:
+        for state in states:
+            players[state.name] = _restore_player(game, state, catalogs)
+    # Constructing players files them by role; dead players belong elsewhere.
+    for roster, states in zip((game.hunters, game.props, game.guardian_angels), snapshot.teams):
+        roster[:] = [players[state.name] for state in states]
+
+    game.bullets = list(snapshot.bullets)
+
+    def deref(arg):
+        if isinstance(arg, _PlayerRef):
+            return players[arg.name]
+        if isinstance(arg, _WeaponRef):
+            return players[arg.owner].loadout[arg.slot]
+        return arg
+
+    for due, (owner, method, args) in snapshot.timers:
+        callback = getattr(getattr(game, owner), method)
+        game.timers.schedule(due, (callback, tuple(deref(arg) for arg in args)))
+    for name in snapshot.held_triggers:
+        game.weapons.hold_trigger(players[name], True)
+
+    # Joins and the like emitted while rebuilding aren't news to anyone.
+    game.events.clear()
+    return game
+
+
+def _capture_player(player: Player) -> PlayerState:
+    status = player.status
+    loadout = {}
+    for slot, weapon in player.loadout.items():
+        if isinstance(weapon, Gun):
+            spec = weapon.spec
+            if spec.spec_id is None:
+                weapon = GunState(spec, None, weapon.ammo, weapon.next_fire_time, weapon.reloading)
+            else:
+                weapon = GunState(
+                    spec.name, str(spec.catalog.path),
+                    weapon.ammo, weapon.next_fire_time, weapon.reloading,
+                )
+        else:
+            weapon = None
+        loadout[slot] = weapon
+    return PlayerState(
+        name=player.name,
+        role=player.role,
+        position=player.position,
+        direction=player.direction,
+        health=player.health,
+        velocity=player.velocity,
+        height=player.height,
+        vertical_velocity=player.vertical_velocity,
+        current_weapon_slot=player.current_weapon_slot,
+        # Field by field: copy.copy would be most of the capture cost.
+        status=(status.stunned, status.ragdolled, status.ragdoll_time),
+        active_effects=player.active_effects.copy(),
+        loadout=loadout,
+    )
+
+
+def _restore_player(game: "Game", state: PlayerState, catalogs: dict[str, GunCatalog]) -> Player:
+    player = Player(state.name, state.role, game)
+    player.position = state.position
+    player.direction = state.direction
+    player.health = state.health
+    player.velocity = state.velocity
+    player.height = state.height
+    player.vertical_velocity = state.vertical_velocity
+    player.current_weapon_slot = state.current_weapon_slot
+    player.status = Status(*state.status)
+    player.active_effects = state.active_effects
+    for slot, gun_state in state.loadout.items():
+        if gun_state is None:
+            continue
+        spec = gun_state.spec
+        if isinstance(spec, str):
+            spec = _catalog(gun_state.catalog, catalogs).by_name(spec)
+        gun = Gun(spec, starting_ammo=gun_state.ammo)
+        gun.next_fire_time = gun_state.next_fire_time
+        gun.reloading = gun_state.reloading
+        gun.owner = player
+        player.loadout[slot] = gun
+    return player
+
+
+def _catalog(path: str, catalogs: dict[str, GunCatalog]) -> GunCatalog:
+    catalog = catalogs.get(path)
+    if catalog is None:
+        catalog = default_catalog()
+        if Path(path) != catalog.path:
+            catalog = GunCatalog(path)
+        catalogs[path] = catalog
+    return catalog
+
+
+def _ref(arg):
+    if isinstance(arg, Player):
+        return _PlayerRef(arg.name)
+    if isinstance(arg, Weapon) and arg.owner is not None:
+        for slot, weapon in arg.owner.loadout.items():
+            if weapon is arg:
+                return _WeaponRef(arg.owner.name, slot)
+    return arg
+
+
+# ============================================================
+# Files
+# ============================================================
+
+
+def write(path: os.PathLike | str, snapshot: MatchSnapshot) -> None:
+    """Atomically replace path with snapshot, durably."""
+    path = Path(path)
+    data = MAGIC + pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_directory(path.parent)
+
+
+def read(path: os.PathLike | str) -> MatchSnapshot:
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a match checkpoint")
+    return pickle.loads(data[len(MAGIC):])
+
+
+def _fsync_directory(directory: Path) -> None:
+    # Makes the rename itself durable. Not every platform can open a
+    # directory for fsync; there the rename is as durable as the OS makes it.
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class Checkpointer:
+    """
+    Periodic checkpoints for the matches of one host process.
+
+    Call tick() after each Game.update; every interval seconds of match time
+    it captures the match on the calling thread and hands the capture to the
+    background writer. The tick-thread cost of each capture is recorded in
+    costs, and captures over budget seconds are counted in over_budget.
+    """
+
+    interval = 5.0
+    budget = 0.002
+
+    def __init__(self, directory: os.PathLike | str, interval: Optional[float] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if interval is not None:
+            self.interval = interval
+
+        self.costs: deque[float] = deque(maxlen=1024)
+        self.over_budget = 0
+        self.written = 0
+        self._last: dict[str, float] = {}
+
+        self._pending: dict[str, MatchSnapshot] = {}
+        self._writing = False
+        self._closing = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._write_loop, name="checkpoints", daemon=True)
+        self._thread.start()
+
+    def path_for(self, match_id: str) -> Path:
+        return self.directory / (match_id + SUFFIX)
+
+    def saved_matches(self) -> list[str]:
+        return sorted(path.name[: -len(SUFFIX)] for path in self.directory.glob("*" + SUFFIX))
+
+    def tick(self, game: "Game", match_id: str) -> bool:
+        """Checkpoint if interval has passed since this match's last one."""
+        last = self._last.get(match_id)
+        if last is not None and game.time - last < self.interval:
+            return False
+        self.checkpoint(game, match_id)
+        return True
+
+    def checkpoint(self, game: "Game", match_id: str) -> None:
+        started = time.perf_counter()
+        snapshot = capture(game)
+        with self._cond:
+            # A capture still waiting for the writer is superseded.
+            self._pending[match_id] = snapshot
+            self._cond.notify_all()
+        self._last[match_id] = game.time
+
+        cost = time.perf_counter() - started
+        self.costs.append(cost)
+        if cost > self.budget:
+            self.over_budget += 1
+
+    def restore(self, match_id: str, game: Optional["Game"] = None) -> "Game":
+        """The restart path: rebuild a match from its newest checkpoint."""
+        return restore(read(self.path_for(match_id)), game)
+
+    def forget(self, match_id: str) -> None:
+        """A finished match: stop tracking it and remove its checkpoint."""
+        self._last.pop(match_id, None)
+        with self._cond:
+            self._pending.pop(match_id, None)
+            while self._writing:
+                self._cond.wait()
+            try:
+                os.remove(self.path_for(match_id))
+            except FileNotFoundError:
+                pass
+
+    def flush(self) -> None:
+        """Wait until every capture taken so far is on disk."""
+        with self._cond:
+            while self._pending or self._writing:
+                self._cond.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        self.flush()
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def __enter__(self) -> "Checkpointer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_loop(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._pending and not self._closing:
+                    cond.wait()
+                if not self._pending:
+                    return
+                match_id, snapshot = self._pending.popitem()
+                self._writing = True
+            try:
+                write(self.path_for(match_id), snapshot)
+                self.written += 1
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                with cond:
+                    self._writing = False
+                    cond.notify_all()
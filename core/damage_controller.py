@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from core.events import PlayerHit
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class DamageController:
+    """
+    Per-tick damage accumulator.
+
+    Impacts record hits here instead of calling Player.take_damage directly.
+    At the end of the tick resolve() applies one total per target and then
+    handles each death once, in the order targets were first hit, so roster
+    mutation and death broadcasts never happen inside the bullet loop.
+    """
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+        # Parallel per-tick buffers; cleared (not reallocated) on resolve.
+        self._targets: list["Player"] = []
+        self._amounts: list[float] = []
+        self._sources: list[Optional[str]] = []
+
+    def record(self, target: "Player", amount: float, source: Optional[str] = None) -> None:
+        self._targets.append(target)
+        self._amounts.append(amount)
+        self._sources.append(source)
+
+    def reset(self) -> None:
+        self._targets.clear()
+        self._amounts.clear()
+        self._sources.clear()
+
+    def copy_from(self, source: "DamageController", players: dict) -> None:
+        self._targets = [players.get(p, p) for p in source._targets]
+        self._amounts = list(source._amounts)
+        self._sources = list(source._sources)
+
+    def pending(self) -> int:
+        return len(self._targets)
+
+    def resolve(self) -> list["Player"]:
+        """Apply this tick's damage and return the players that died, in order."""
+        if not self._targets:
+            return []
+
+        emit = self.game.emit
+        totals: dict["Player", float] = {}
+        last_source: dict["Player", Optional[str]] = {}
+        for target, amount, source in zip(self._targets, self._amounts, self._sources):
+            emit(PlayerHit(target, amount, source))
+            totals[target] = totals.get(target, 0) + amount
+            last_source[target] = source
+
+        self._targets.clear()
+        self._amounts.clear()
+        self._sources.clear()
+
+        dead: list["Player"] = []
+        for target, total in totals.items():
+            if target.health <= 0:
+                continue
+            target.health -= total
+            if target.health <= 0:
+                target.health = 0
+                dead.append(target)
+
+        for target in dead:
+            self.game._handle_player_death(target, killer=last_source[target])
+
+        return dead
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from core.events import EffectApplied
+
 if TYPE_CHECKING:
     from core.game import Game
     from entities.effects.active_effect import ActiveEffect
@@ -13,4 +15,5 @@ class EffectController:
 
     def add_effect(self, player, effect):
         player.active_effects.add_effect(effect)
+        self.game.emit(EffectApplied(player, type(effect).__name__))
         return effect
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from core.events import GameEvent
+    from core.game import Game
+
+
+EventSink = Callable[[Sequence["GameEvent"]], None]
+
+
+class _Window(Sequence):
+    """Read-only view of the first count slots of a buffer, without copying."""
+
+    __slots__ = ("_buffer", "_count")
+
+    def __init__(self, buffer: list):
+        self._buffer = buffer
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._buffer[: self._count][index]
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("event index out of range")
+        return self._buffer[index]
+
+    def __iter__(self):
+        return islice(self._buffer, self._count)
+
+
+class EventStream:
+    """
+    Per-tick event buffer with pluggable sinks.
+
+    emit() stores the event in a preallocated slot; the buffer only grows
+    if a tick emits more than it has ever held. flush() hands the tick's
+    events to every sink in order and then resets the buffer for reuse.
+
+    Sinks are handed a view over the buffer, not a copy: it is only valid
+    for the duration of the call, and a sink that keeps events around must
+    copy them. Flushed slots are cleared so delivered events are not kept
+    alive until they happen to be overwritten.
+
+    Each event is stored with the match time it happened at. While sinks
+    run, times holds those times, aligned with the events they were given.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._buffer: list = [None] * capacity
+        self._times: list[float] = [0.0] * capacity
+        self._count = 0
+        self._sinks: list[EventSink] = []
+        self._events = _Window(self._buffer)
+        self._window = _Window(self._times)
+        self.times: Sequence[float] = ()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator["GameEvent"]:
+        buffer = self._buffer
+        for i in range(self._count):
+            yield buffer[i]
+
+    def emit(self, event: "GameEvent", time: float = 0.0) -> None:
+        count = self._count
+        buffer = self._buffer
+        if count == len(buffer):
+            buffer.extend([None] * len(buffer))
+            self._times.extend([0.0] * len(self._times))
+        buffer[count] = event
+        self._times[count] = time
+        self._count = count + 1
+
+    def clear(self) -> None:
+        """Discard this tick's events without delivering them."""
+        buffer = self._buffer
+        for i in range(self._count):
+            buffer[i] = None
+        self._count = 0
+
+    def subscribe(self, sink: EventSink) -> EventSink:
+        self._sinks.append(sink)
+        return sink
+
+    def unsubscribe(self, sink: EventSink) -> None:
+        self._sinks.remove(sink)
+
+    def flush(self) -> None:
+        count = self._count
+        if count == 0:
+            return
+
+        events = self._events
+        events._count = count
+        self._window._count = count
+        self.times = self._window
+        try:
+            for sink in self._sinks:
+                sink(events)
+        finally:
+            events._count = 0
+            self._window._count = 0
+            self.times = ()
+            self._recycle(count)
+
+    def _recycle(self, count: int) -> None:
+        # Events a sink emitted during delivery belong to the next flush;
+        # move them to the front and clear every other delivered slot.
+        buffer = self._buffer
+        times = self._times
+        end = self._count
+        kept = end - count
+        for i in range(kept):
+            buffer[i] = buffer[count + i]
+            times[i] = times[count + i]
+        for i in range(kept, end):
+            buffer[i] = None
+        self._count = kept
+
+
+class PlayerTextSink:
+    """
+    Renders events as text and delivers them through Player.update.
+
+    Broadcast events go to everyone who was on the roster when the event
+    was emitted, so Game.emit hands every event to capture() first; silent
+    events are skipped.
+    """
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self._audiences: dict[int, list] = {}
+
+    def capture(self, event: "GameEvent") -> None:
+        if event.silent or event.recipient is not None:
+            return
+        game = self.game
+        self._audiences[id(event)] = game.hunters + game.props + game.guardian_angels
+
+    def __call__(self, events: Sequence["GameEvent"]) -> None:
+        audiences = self._audiences
+        for event in events:
+            if event.silent:
+                continue
+            recipient = event.recipient
+            message = event.render()
+            if recipient is not None:
+                recipient.update(message)
+                continue
+
+            audience = audiences.get(id(event), ())
+            exclude = getattr(event, "exclude", None)
+            for p in audience:
+                if p is not exclude:
+                    p.update(message)
+        audiences.clear()
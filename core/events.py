@@ -0,0 +1,312 @@
+"""
+Typed game events.
+
+Game code emits these into the per-tick EventStream instead of formatting
+notification strings. Each event names its recipient (None = everyone) and
+only renders human-readable text when a sink asks for it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from entities.player import Player
+
+
+class GameEvent:
+    __slots__ = ()
+
+    # Silent events are records for tools (telemetry, replays); text sinks
+    # don't deliver them to players.
+    silent = False
+
+    @property
+    def recipient(self) -> Optional["Player"]:
+        return None
+
+    def render(self) -> str:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerJoined(GameEvent):
+    player: "Player"
+    team: str
+
+    def render(self) -> str:
+        return f"{self.player.name} has joined the {self.team}!"
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerLeft(GameEvent):
+    player: "Player"
+
+    def render(self) -> str:
+        return f"{self.player.name} has left the game."
+
+
+@dataclass(frozen=True, slots=True)
+class StateSwitched(GameEvent):
+    state_name: str
+
+    def render(self) -> str:
+        return f"Game state switched to {self.state_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class ShotFired(GameEvent):
+    player: "Player"
+    shot_name: str
+    blank: bool = False
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        if self.blank:
+            return f"{self.player.name} fired a blank!"
+        return f"Fired {self.shot_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponPickedUp(GameEvent):
+    player: "Player"
+    weapon_name: str
+    slot_name: str
+
+    def render(self) -> str:
+        return f"{self.player.name} picked up {self.weapon_name} into {self.slot_name}."
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponDropped(GameEvent):
+    player: "Player"
+    weapon_name: str
+
+    def render(self) -> str:
+        return f"{self.player.name} dropped {self.weapon_name}."
+
+
+@dataclass(frozen=True, slots=True)
+class SlotSwitched(GameEvent):
+    player: "Player"
+    slot_name: str
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"Switched to {self.slot_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerHit(GameEvent):
+    player: "Player"
+    damage: float
+    source: Optional[str] = None
+
+    silent = True
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        if self.source is None:
+            return f"Took {self.damage:g} damage"
+        return f"Hit by {self.source} for {self.damage:g} damage"
+
+
+@dataclass(frozen=True, slots=True)
+class EffectApplied(GameEvent):
+    player: "Player"
+    effect_name: str
+
+    silent = True
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"{self.effect_name} applied"
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerDied(GameEvent):
+    player: "Player"
+    killer: Optional[str] = None
+
+    def render(self) -> str:
+        if self.killer is not None and self.killer != self.player.name:
+            return f"{self.player.name} was killed by {self.killer}!"
+        return f"{self.player.name} has died!"
+
+
+@dataclass(frozen=True, slots=True)
+class PropsRevealed(GameEvent):
+    player: "Player"
+    props: tuple
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        names = ", ".join(prop.name for prop in self.props)
+        return f"Pulse revealed: {names}"
+
+
+@dataclass(frozen=True, slots=True)
+class PropPossessed(GameEvent):
+    player: "Player"
+    prop_name: str
+    phase: str
+
+    def render(self) -> str:
+        return f"{self.player.name} possessed {self.prop_name} ({self.phase})"
+
+
+@dataclass(frozen=True, slots=True)
+class NoiseHeard(GameEvent):
+    """
+    Everything one hunter heard in a tick. position is where the loudest
+    noise came from; the sources themselves are not revealed.
+    """
+
+    player: "Player"
+    position: tuple[float, float]
+    intensity: float
+    count: int = 1
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        x, y = self.position
+        return f"You hear something near ({x:.0f}, {y:.0f})"
+
+
+@dataclass(frozen=True, slots=True)
+class FlagStolen(GameEvent):
+    player: "Player"
+    victim: Optional["Player"] = None
+
+    def render(self) -> str:
+        if self.victim is None:
+            return f"{self.player.name} picked up a dropped flag!"
+        return f"{self.player.name} stole {self.victim.name}'s flag!"
+
+
+@dataclass(frozen=True, slots=True)
+class FlagDropped(GameEvent):
+    player: "Player"
+    killer: Optional[str] = None
+
+    def render(self) -> str:
+        return f"{self.player.name} dropped a flag!"
+
+
+@dataclass(frozen=True, slots=True)
+class FlagCaptured(GameEvent):
+    player: "Player"
+    zone_name: str
+
+    def render(self) -> str:
+        return f"{self.player.name} captured a flag at {self.zone_name}!"
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneEntered(GameEvent):
+    player: "Player"
+    zone_name: str
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"Entered {self.zone_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneExited(GameEvent):
+    player: "Player"
+    zone_name: str
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"Left {self.zone_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class ReloadStarted(GameEvent):
+    player: "Player"
+    weapon_name: str
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"Reloading {self.weapon_name}..."
+
+
+@dataclass(frozen=True, slots=True)
+class ReloadFinished(GameEvent):
+    player: "Player"
+    weapon_name: str
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return f"{self.weapon_name} reloaded."
+
+
+@dataclass(frozen=True, slots=True)
+class ActionDenied(GameEvent):
+    """
+    An intent was refused. template is a constant format string; args are
+    only interpolated when the event is rendered.
+    """
+
+    player: "Player"
+    action: str
+    template: str
+    args: tuple = ()
+
+    @property
+    def recipient(self):
+        return self.player
+
+    def render(self) -> str:
+        return self.template.format(*self.args)
+
+
+@dataclass(frozen=True, slots=True)
+class Notice(GameEvent):
+    """Free-form text for anything without a dedicated event type yet."""
+
+    to: Optional["Player"]
+    template: str
+    args: tuple = ()
+    exclude: Optional["Player"] = None
+
+    @property
+    def recipient(self):
+        return self.to
+
+    def render(self) -> str:
+        return self.template.format(*self.args)
+
+
@@ -1,8 +1,25 @@
 from typing import Optional, TYPE_CHECKING
 
 from core.action_router import ActionRouter
+from core.area_controller import AreaController
+from core.damage_controller import DamageController
 from core.effect_controller import EffectController
+from core.event_stream import EventStream, PlayerTextSink
+from core.events import (
+    GameEvent,
+    Notice,
+    PlayerDied,
+    PlayerJoined,
+    PlayerLeft,
+    StateSwitched,
+)
+from core.hit_controller import HitController
+from core.input_sequencer import InputSequencer
+from core.lag_compensation import LagCompensation
 from core.states import LobbyState, PreparingState, PlayingState
+from core.system_scheduler import SystemScheduler
+from core.timing_wheel import TimingWheel
+from core.visibility_controller import VisibilityController
 from core.weapon_controller import WeaponController
 from core.world_controller import WorldController
 from entities.player import Player
@@ -10,9 +27,16 @@ from entities.weapons.weapon import Weapon
 from entities.weapons.shot_intent import ShotIntent
 from entities.weapons.bullet import Bullet
 from core.movement_controller import MovementController
+from core.noise_controller import NoiseController
+from core.objective_controller import ObjectiveController
+from core.physics_controller import PhysicsController
 
 if TYPE_CHECKING:
+    from core.game_pool import GamePool
+    from core.navigation_controller import NavigationController
+    from core.possession_controller import PossessionController
     from entities.effects.active_effect import ActiveEffect
+    from level.level import Level
 
 
 class Game:
@@ -25,7 +49,14 @@ class Game:
     For now, Game also acts as the World (ticks bullets).
     """
 
-    def __init__(self):
+    def __init__(self, text_output: bool = True):
+        # Per-tick typed events. Text is only rendered if a text sink is
+        # subscribed (headless servers and tools pass text_output=False).
+        self.events = EventStream()
+        self.text_sink: Optional[PlayerTextSink] = None
+        if text_output:
+            self.text_sink = self.events.subscribe(PlayerTextSink(self))
+
         # Teams
         self.hunters: list[Player] = []
         self.props: list[Player] = []
@@ -42,23 +73,116 @@ class Game:
         # World-simulated entities
         self.bullets: list[Bullet] = []
 
+        # Static geometry; None means an open, wall-less world.
+        self.level: Optional["Level"] = None
+
+        # Simulation clock, in seconds since the match was created, and the
+        # match-wide timers (shots, reloads) that run against it.
+        self.time = 0.0
+        self.timers = TimingWheel()
+
         self.actions = ActionRouter(self)
+        self.inputs = InputSequencer(self)
         self.effects = EffectController(self)
+        self.damage = DamageController(self)
+        self.areas = AreaController(self)
         self.weapons = WeaponController(self)
         self.world = WorldController(self)
         self.movement = MovementController(self)
+        self.physics = PhysicsController(self)
+        self.lag = LagCompensation(self)
+        self.hits = HitController(self)
+        self.visibility = VisibilityController(self)
+        self.objectives = ObjectiveController(self)
+        self.noise = NoiseController(self)
+        # Built on first use (see the properties below): most matches never
+        # place possessable objects or steer bots.
+        self._possession: Optional["PossessionController"] = None
+        self._navigation: Optional["NavigationController"] = None
+
+        self.systems = SystemScheduler()
+        self._register_systems()
+
+    def reset(self) -> None:
+        """
+        Return to a fresh, empty match in the preparing state.
+
+        Controllers, buffers and the tick plan are kept and cleared in
+        place, so a rematch or a pooled Game skips rebuilding the object
+        graph. Event sinks stay subscribed; pending events are discarded.
+        """
+        self.events.clear()
+        self.hunters.clear()
+        self.props.clear()
+        self.guardian_angels.clear()
+        self.state = self.preparing_state
+        self.bullets.clear()
+        self.level = None
+        self.time = 0.0
+        self.timers.reset()
+
+        for controller in (
+            self.inputs,
+            self.damage,
+            self.areas,
+            self.weapons,
+            self.world,
+            self.physics,
+            self.lag,
+            self.visibility,
+            self._possession,
+            self.objectives,
+            self.noise,
+            self._navigation,
+        ):
+            if controller is not None:
+                controller.reset()
+
+    @property
+    def possession(self) -> "PossessionController":
+        if self._possession is None:
+            from core.possession_controller import PossessionController
+
+            self._possession = PossessionController(self)
+        return self._possession
+
+    @property
+    def navigation(self) -> "NavigationController":
+        if self._navigation is None:
+            from core.navigation_controller import NavigationController
+
+            self._navigation = NavigationController(self)
+        return self._navigation
+
+    def fork(self, pool: Optional["GamePool"] = None) -> "Game":
+        """
+        Cheap copy-on-write copy of the match for speculative simulation
+        (bot lookahead, "would this shot hit in N ticks"). Step it with
+        update() and throw it away; nothing it does reaches this game.
+        Call between ticks. Players the fork hasn't touched read through
+        to this game, so use the fork before this game ticks again.
+        With a pool the fork reuses a pooled Game.
+        """
+        from core.game_fork import fork_game
+
+        return fork_game(self, pool)
 
     # ============================================================
-    # Notifications (TEMPORARY / DEBUG-ORIENTED)
+    # Events / notifications
     # ============================================================
 
+    def emit(self, event: GameEvent) -> None:
+        # Timer-driven actions (held triggers, reloads) happen at their
+        # own sub-tick time, which weapons.now() reports.
+        if self.text_sink is not None:
+            self.text_sink.capture(event)
+        self.events.emit(event, self.weapons.now())
+
     def notify_all(self, message: str, exclude: Optional[Player] = None):
-        for p in self.hunters + self.props + self.guardian_angels:
-            if p is not exclude:
-                p.update(message)
+        self.emit(Notice(None, "{}", (message,), exclude=exclude))
 
     def notify_player(self, player: Player, message: str):
-        player.update(message)
+        self.emit(Notice(player, "{}", (message,)))
 
     # ============================================================
     # Registration
@@ -66,15 +190,40 @@ class Game:
 
     def add_hunter(self, player: Player):
         self.hunters.append(player)
-        self.notify_all(f"{player.name} has joined the Hunters!")
+        self.emit(PlayerJoined(player, "Hunters"))
 
     def add_prop(self, player: Player):
         self.props.append(player)
-        self.notify_all(f"{player.name} has joined the Props!")
+        self.emit(PlayerJoined(player, "Props"))
 
     def add_guardian(self, player: Player):
         self.guardian_angels.append(player)
-        self.notify_all(f"{player.name} has joined the Guardian Angels!")
+        self.emit(PlayerJoined(player, "Guardian Angels"))
+
+    def find_player(self, name: str) -> Optional[Player]:
+        for p in self.hunters + self.props + self.guardian_angels:
+            if p.name == name:
+                return p
+        return None
+
+    def load_level(self, path, sdf_cache_dir=None, sdf_cell_size: float = 0.25) -> "Level":
+        """
+        Load static geometry and bake its distance field for movement.
+        With sdf_cache_dir the field is cached on disk by level hash.
+        """
+        # Imported on first use; open-world matches never need the loaders.
+        from level.distance_field import DistanceField
+        from level.level import Level
+
+        level = Level.load(path)
+        if sdf_cache_dir is None:
+            level.distance_field = DistanceField.bake(level, sdf_cell_size)
+        else:
+            level.distance_field = DistanceField.load_or_bake(
+                level, sdf_cache_dir, sdf_cell_size
+            )
+        self.level = level
+        return level
 
     def switch_state(self, new_state):
         """
@@ -82,14 +231,20 @@ class Game:
         States control *policy*, not mechanics.
         """
         self.state = new_state
-        self.notify_all(f"Game state switched to {type(new_state).__name__}")
+        self.emit(StateSwitched(type(new_state).__name__))
 
     # ============================================================
     # ATTEMPT ROUTERS (PLAYER INTENT)
     # ============================================================
 
-    def attempt_move(self, player: Player, new_position):
-        return self.actions.attempt_move(player, new_position)
+    def attempt_move(
+        self,
+        player: Player,
+        new_position,
+        seq: Optional[int] = None,
+        predicted_position=None,
+    ):
+        return self.actions.attempt_move(player, new_position, seq, predicted_position)
 
     def attempt_pickup_weapon(self, player: Player, weapon: Weapon):
         return self.actions.attempt_pickup_weapon(player, weapon)
@@ -97,8 +252,22 @@ class Game:
     def attempt_switch_slot(self, player: Player, slot_name: str):
         return self.actions.attempt_switch_slot(player, slot_name)
 
-    def attempt_use_weapon(self, player: Player):
-        return self.actions.attempt_use_weapon(player)
+    def attempt_use_weapon(
+        self,
+        player: Player,
+        client_time: Optional[float] = None,
+        seq: Optional[int] = None,
+    ):
+        return self.actions.attempt_use_weapon(player, client_time, seq)
+
+    def attempt_hold_trigger(self, player: Player, held: bool = True):
+        return self.actions.attempt_hold_trigger(player, held)
+
+    def attempt_reload(self, player: Player):
+        return self.actions.attempt_reload(player)
+
+    def attempt_steal(self, player: Player):
+        return self.actions.attempt_steal(player)
 
     def attempt_possess(self, player: Player, obj_name: str):
         return self.actions.attempt_possess(player, obj_name)
@@ -115,27 +284,139 @@ class Game:
     def _move_core(self, player: Player, new_position):
         return self.movement.move(player, new_position)
 
+    def _possess_core(self, player: Player, obj_name: str):
+        return self.possession.possess(player, obj_name)
+
+    def _steal_core(self, player: Player):
+        return self.objectives.steal(player)
+
     def _switch_slot_core(self, player: Player, slot_name: str):
         return self.weapons.switch_slot(player, slot_name)
 
     def _pickup_weapon_into_slot_core(self, player: Player, weapon: Weapon, slot_name: str):
         return self.weapons.pickup_into_slot(player, weapon, slot_name)
 
-    def _handle_player_death(self, player: Player):
-        self.notify_all(f"{player.name} has died!")
+    def _hold_trigger_core(self, player: Player, held: bool):
+        return self.weapons.hold_trigger(player, held)
+
+    def _reload_core(self, player: Player):
+        return self.weapons.start_reload(player)
+
+    def _handle_player_death(self, player: Player, killer: Optional[str] = None):
+        self.emit(PlayerDied(player, killer))
+        self.objectives.on_death(player, killer)
         if player in self.hunters:
             self.hunters.remove(player)
         elif player in self.props:
             self.props.remove(player)
+        self.lag.forget(player)
+        if player.possessed is not None:
+            self.possession.release(player)
         self.add_guardian(player)  # For now, dead players become guardian angels
         # Additional death handling logic can be added here (e.g., respawn, score update, etc.)
 
+    def remove_player(self, player: Player) -> None:
+        """Take a player out of the match for good, e.g. on disconnect."""
+        self.weapons.hold_trigger(player, False)
+        # Leaving drops a carried flag just like dying does.
+        self.objectives.on_death(player)
+        for roster in (self.hunters, self.props, self.guardian_angels):
+            if player in roster:
+                roster.remove(player)
+                break
+        self.lag.forget(player)
+        if player.possessed is not None:
+            self.possession.release(player)
+        self.inputs.forget(player)
+        self.emit(PlayerLeft(player))
+
     # ============================================================
     # WORLD UPDATE (Game acts as World for now)
     # ============================================================
 
     def update(self, dt: float) -> None:
-        self.world.update(dt)
+        self.systems.run(dt)
+        self.events.flush()
+        self.inputs.end_tick()
+
+    def _register_systems(self) -> None:
+        # Program order is the serial order; the scheduler only overlaps
+        # systems whose declared components don't conflict.
+        add = self.systems.add
+        add(
+            "bullet_travel",
+            self.world.advance_bullets,
+            reads={"positions", "rosters"},
+            writes={"bullets"},
+            size=self.world.bullet_count,
+        )
+        add(
+            "bullet_collision",
+            self.world.collide_bullets,
+            reads={"positions", "rosters", "level", "lag_history"},
+            writes={"bullets", "damage", "areas", "physics", "events"},
+        )
+        add(
+            "physics",
+            self.physics.update,
+            reads={"level"},
+            writes={"physics", "positions"},
+        )
+        add("bullet_cull", self.world.cull_bullets, writes={"bullets", "areas"})
+        add(
+            "timers",
+            lambda dt: self._run_timers(self.time + dt),
+            reads={"clock", "positions", "rosters", "level", "lag_history"},
+            writes={"timers", "weapons", "bullets", "damage", "areas", "physics", "events"},
+        )
+        add(
+            "areas",
+            lambda dt: self.areas.resolve(),
+            reads={"positions", "rosters"},
+            writes={"areas", "damage", "physics", "events"},
+        )
+        add(
+            "damage",
+            lambda dt: self.damage.resolve(),
+            writes={"damage", "health", "rosters", "objectives", "lag_history", "events"},
+        )
+        add(
+            "objectives",
+            lambda dt: self.objectives.update(),
+            reads={"positions", "rosters"},
+            writes={"objectives", "events"},
+        )
+        add(
+            "noise",
+            lambda dt: self.noise.resolve(),
+            reads={"positions", "rosters"},
+            writes={"noise", "events"},
+        )
+        add("clock", self._advance_clock, writes={"clock"})
+        add(
+            "lag_history",
+            lambda dt: self.lag.record_all(self.time),
+            reads={"clock", "positions", "rosters"},
+            writes={"lag_history"},
+        )
+        add(
+            "visibility",
+            lambda dt: self.visibility.update(self.time),
+            reads={"clock", "positions", "rosters", "level"},
+            writes={"visibility"},
+        )
+
+    def _advance_clock(self, dt: float) -> None:
+        self.time += dt
+
+    def _run_timers(self, until: float) -> None:
+        # Timers may schedule follow-ups that are due within the same tick.
+        while True:
+            due = self.timers.advance(until)
+            if not due:
+                return
+            for due_time, (callback, args) in due:
+                callback(due_time, *args)
 
     # ============================================================
     # WEAPON USE PIPELINE
@@ -144,14 +425,19 @@ class Game:
     def _get_use_result_or_none(self, player: Player):
         return self.weapons.get_use_result_or_none(player)
 
-    def _use_equipped_weapon_live_core(self, player: Player):
-        return self.weapons.use_equipped_live(player)
+    def _use_equipped_weapon_live_core(self, player: Player, client_time: Optional[float] = None):
+        return self.weapons.use_equipped_live(player, client_time)
 
     def _use_equipped_weapon_blank_core(self, player: Player):
         return self.weapons.use_equipped_blank(player)
 
-    def _execute_shot_intent_core(self, player: Player, shot_intent: ShotIntent):
-        return self.weapons.execute_shot_intent(player, shot_intent)
+    def _execute_shot_intent_core(
+        self,
+        player: Player,
+        shot_intent: ShotIntent,
+        client_time: Optional[float] = None,
+    ):
+        return self.weapons.execute_shot_intent(player, shot_intent, client_time)
 
     def attempt_add_effect(self, player, effect):
         return self.actions.attempt_add_effect(player, effect)
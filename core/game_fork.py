@@ -0,0 +1,89 @@
+# game_fork.py
+#
+# Cheap throwaway copies of a match for speculative simulation.
+#
+# Design notes:
+# - Players become PlayerFork views, so per-player state is only copied
+#   when the fork reads or writes it.
+# - Immutable or static data is shared, never copied: the level and its
+#   distance field, gun/prop specs and shot prototypes, travel and impact
+#   behaviors, placed-prop indexes and capture zones.
+# - Bullets are copied up front. Every tick moves all of them, so any fork
+#   that is stepped would copy them anyway.
+# - Forks are taken between ticks, so the per-tick work buffers (pending
+#   area impacts, bullet starts) are empty and not copied.
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Optional
+
+from entities.player import Player
+from entities.player_fork import PlayerFork
+from entities.weapons.weapon import Weapon
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from core.game_pool import GamePool
+
+
+def fork_game(game: "Game", pool: Optional["GamePool"] = None) -> "Game":
+    if pool is not None:
+        fork = pool.acquire()
+    else:
+        from core.game import Game
+
+        fork = Game(text_output=False)
+
+    players: dict[Player, Player] = {}
+    for roster, fork_roster in (
+        (game.hunters, fork.hunters),
+        (game.props, fork.props),
+        (game.guardian_angels, fork.guardian_angels),
+    ):
+        for player in roster:
+            view = players[player] = PlayerFork(player, fork)
+            fork_roster.append(view)
+
+    fork.state = {
+        game.lobby_state: fork.lobby_state,
+        game.preparing_state: fork.preparing_state,
+        game.playing_state: fork.playing_state,
+    }[game.state]
+    fork.bullets = [copy.copy(bullet) for bullet in game.bullets]
+    fork.level = game.level
+    fork.time = game.time
+
+    owners = {id(value): name for name, value in vars(game).items()}
+
+    def fork_payload(payload):
+        callback, args = payload
+        controller = getattr(fork, owners[id(callback.__self__)])
+        return getattr(controller, callback.__name__), tuple(fork_arg(arg) for arg in args)
+
+    def fork_arg(arg):
+        if isinstance(arg, Player):
+            return players.get(arg, arg)
+        if isinstance(arg, Weapon) and arg.owner in players:
+            return players[arg.owner].weapon_for(arg)
+        return arg
+
+    fork.timers = game.timers.copy(fork_payload)
+
+    for name in (
+        "inputs",
+        "damage",
+        "weapons",
+        "physics",
+        "lag",
+        "visibility",
+        "objectives",
+        "noise",
+    ):
+        getattr(fork, name).copy_from(getattr(game, name), players)
+    # Built on first use; a fork only needs its own if the source has one.
+    if game._possession is not None:
+        fork.possession.copy_from(game._possession, players)
+    if game._navigation is not None:
+        fork.navigation.copy_from(game._navigation, players)
+    return fork
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections import deque
+
+from core.game import Game
+
+
+class GamePool:
+    """
+    Pre-built Game instances for new matches.
+
+    Construction happens up front (prewarm) and reset happens on release,
+    so acquire() on the lobby-fill path is a pop. When the pool is empty
+    acquire() falls back to building a new Game.
+    """
+
+    def __init__(self, size: int = 0, text_output: bool = False):
+        self.text_output = text_output
+        self._idle: deque[Game] = deque()
+        self.prewarm(size)
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def prewarm(self, count: int) -> None:
+        for _ in range(count):
+            self._idle.append(Game(text_output=self.text_output))
+
+    def acquire(self) -> Game:
+        if self._idle:
+            return self._idle.pop()
+        return Game(text_output=self.text_output)
+
+    def release(self, game: Game) -> None:
+        game.reset()
+        self._idle.append(game)
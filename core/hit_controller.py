@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.weapons.bullet import Bullet
+
+
+class HitController:
+    """
+    Bullet-vs-player hit detection for the bullet tick.
+
+    Each bullet's path this tick (start -> current position) is tested
+    against the hitboxes of players on other teams; a prop that possessed an
+    object is hit with that object's shape. Bullets fired with a client
+    timestamp test against target positions rewound by the bullet's
+    lag-compensation offset. The nearest hit along the path wins.
+    """
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+    def detect(self, bullets: list["Bullet"], starts: list[tuple[float, float]]) -> None:
+        game = self.game
+        hunters = game.hunters
+        props = game.props
+        if not bullets or not (hunters or props):
+            return
+
+        hunter_names = {p.name for p in hunters}
+        lag = game.lag
+
+        for bullet, (sx, sy) in zip(bullets, starts):
+            if not bullet.alive:
+                continue
+
+            targets = props if bullet.owner_id in hunter_names else hunters
+            rewind_time = game.time - bullet.rewind
+
+            best_target = None
+            best_t = 2.0
+            ex, ey = bullet.x, bullet.y
+            dx, dy = ex - sx, ey - sy
+            seg_len_sq = dx * dx + dy * dy
+
+            for target in targets:
+                if target.name == bullet.owner_id:
+                    continue
+                if bullet.rewind > 0.0:
+                    tx, ty = lag.position_at(target, rewind_time)
+                else:
+                    tx, ty = target.position
+
+                t = target.hitbox.segment_t(sx, sy, dx, dy, seg_len_sq, tx, ty)
+                if t is not None and t < best_t:
+                    best_t = t
+                    best_target = target
+
+            if best_target is not None:
+                bullet.x = sx + dx * best_t
+                bullet.y = sy + dy * best_t
+                bullet.impact(best_target)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from entities.movement.move_correction import MoveCorrection
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class InputSequencer:
+    """
+    Tracks client input sequence numbers for prediction reconciliation.
+
+    Every move/fire intent may carry a per-player, strictly increasing seq.
+    Stale or duplicate intents are dropped. The last processed seq is the
+    acknowledgement clients rewind their prediction buffer to, and moves whose
+    committed position diverges from the client's prediction produce a
+    MoveCorrection for this tick. Corrections nobody drains are dropped
+    once a whole update has passed, so a plain Game doesn't accumulate them.
+
+    It also remembers the position each client last had confirmed, so a
+    server can tell when a player was moved by something other than their
+    own inputs (knockback, physics) and needs a correction too.
+    """
+
+    tolerance = 0.01
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self._last_seq: dict["Player", int] = {}
+        self._confirmed: dict["Player", tuple[float, float]] = {}
+        self._corrections: list[tuple["Player", MoveCorrection]] = []
+        # How many of _corrections were already there at the last end_tick.
+        self._undrained = 0
+
+    def reset(self) -> None:
+        self._last_seq.clear()
+        self._confirmed.clear()
+        self._corrections.clear()
+        self._undrained = 0
+
+    def copy_from(self, source: "InputSequencer", players: dict) -> None:
+        self._last_seq = {players.get(p, p): seq for p, seq in source._last_seq.items()}
+        self._confirmed = {players.get(p, p): pos for p, pos in source._confirmed.items()}
+        self._corrections = []
+        self._undrained = 0
+
+    def accept(self, player: "Player", seq: Optional[int]) -> bool:
+        if seq is None:
+            return True
+        last = self._last_seq.get(player)
+        if last is not None and seq <= last:
+            return False
+        self._last_seq[player] = seq
+        return True
+
+    def forget(self, player: "Player") -> None:
+        self._last_seq.pop(player, None)
+        self._confirmed.pop(player, None)
+
+    def last_processed(self, player: "Player") -> Optional[int]:
+        return self._last_seq.get(player)
+
+    def reconcile(self, player: "Player", seq: int, predicted_position):
+        """Return True if the prediction held, else a MoveCorrection."""
+        x, y = player.position
+        self._confirmed[player] = (x, y)
+        px, py = predicted_position
+        if abs(x - px) <= self.tolerance and abs(y - py) <= self.tolerance:
+            return True
+
+        correction = MoveCorrection(seq=seq, position=(x, y))
+        self._corrections.append((player, correction))
+        return correction
+
+    def confirm(self, player: "Player", position) -> None:
+        """Record that the client has been told it is at position."""
+        self._confirmed[player] = position
+
+    def displaced(self, player: "Player") -> bool:
+        """Whether the player is away from the position their client last had confirmed."""
+        confirmed = self._confirmed.get(player)
+        if confirmed is None:
+            return True
+        x, y = player.position
+        cx, cy = confirmed
+        return abs(x - cx) > self.tolerance or abs(y - cy) > self.tolerance
+
+    def drain_corrections(self) -> list[tuple["Player", MoveCorrection]]:
+        corrections = self._corrections
+        self._corrections = []
+        self._undrained = 0
+        return corrections
+
+    def end_tick(self) -> None:
+        """Drop corrections that have gone a whole update without being drained."""
+        corrections = self._corrections
+        del corrections[:self._undrained]
+        self._undrained = len(corrections)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Container, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class KDTree(Generic[T]):
+    """
+    Static 2D k-d tree for nearest-item queries over things that never move.
+
+    Built once by median splits into flat arrays; a nearest query descends
+    to the query's leaf and only backtracks into a sibling subtree when the
+    splitting plane is closer than the best match so far, so a lookup costs
+    O(log n) on average instead of a scan over every item.
+    """
+
+    def __init__(self, items: list[tuple[T, float, float]]):
+        self._items: list[T] = []
+        self._xs: list[float] = []
+        self._ys: list[float] = []
+        self._build(list(items), 0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, entries, depth) -> None:
+        # Implicit layout: the median of a run of entries is stored at the
+        # run's midpoint, its lower half before it and its upper half after.
+        if not entries:
+            return
+        axis = depth & 1
+        entries.sort(key=lambda entry: entry[1 + axis])
+        mid = len(entries) // 2
+        self._build(entries[:mid], depth + 1)
+        item, x, y = entries[mid]
+        self._items.append(item)
+        self._xs.append(x)
+        self._ys.append(y)
+        self._build(entries[mid + 1:], depth + 1)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        max_distance: float = float("inf"),
+        exclude: Optional[Container[T]] = None,
+    ) -> Optional[tuple[T, float]]:
+        """
+        Nearest item within max_distance as (item, distance), or None.
+        Items in exclude are passed over but still guide the descent.
+        """
+        best = [-1, max_distance * max_distance]
+        self._search(0, len(self._items), 0, x, y, best, exclude)
+        if best[0] < 0:
+            return None
+        return self._items[best[0]], best[1] ** 0.5
+
+    def _search(self, lo, hi, depth, x, y, best, exclude) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        px = self._xs[mid]
+        py = self._ys[mid]
+        dist_sq = (px - x) ** 2 + (py - y) ** 2
+        if dist_sq <= best[1] and (exclude is None or self._items[mid] not in exclude):
+            best[0] = mid
+            best[1] = dist_sq
+
+        delta = (x - px) if depth & 1 == 0 else (y - py)
+        if delta < 0:
+            near, far = (lo, mid), (mid + 1, hi)
+        else:
+            near, far = (mid + 1, hi), (lo, mid)
+
+        self._search(near[0], near[1], depth + 1, x, y, best, exclude)
+        if delta * delta <= best[1]:
+            self._search(far[0], far[1], depth + 1, x, y, best, exclude)
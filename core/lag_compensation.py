@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from core.position_history import PositionHistory
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class LagCompensation:
+    """
+    Per-player position history used to rewind hit targets.
+
+    Every tick the game records each live player's position. A shot that
+    carries the client's timestamp is then tested against where targets
+    were at that time, never further back than max_rewind seconds.
+
+    Memory is bounded: history_capacity samples per player, preallocated.
+    """
+
+    max_rewind = 0.25
+    history_capacity = 32
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self._histories: dict["Player", PositionHistory] = {}
+        # Buffers of players who left, reused for players who join.
+        self._spare: list[PositionHistory] = []
+        # In a forked game: players whose history is still the source game's.
+        self._borrowed: set["Player"] = set()
+
+    @property
+    def bytes_per_player(self) -> int:
+        return self.history_capacity * PositionHistory.BYTES_PER_SAMPLE
+
+    def record_all(self, time: float) -> None:
+        histories = self._histories
+        borrowed = self._borrowed
+        for player in self.game.hunters + self.game.props:
+            history = histories.get(player)
+            if history is None:
+                history = histories[player] = self._new_history()
+            elif borrowed and player in borrowed:
+                history = histories[player] = history.copy()
+                borrowed.discard(player)
+            x, y = player.position
+            history.record(time, x, y)
+
+    def forget(self, player: "Player") -> None:
+        history = self._histories.pop(player, None)
+        if player in self._borrowed:
+            self._borrowed.discard(player)
+        elif history is not None:
+            self._spare.append(history)
+
+    def reset(self) -> None:
+        self._spare.extend(
+            h for p, h in self._histories.items() if p not in self._borrowed
+        )
+        self._histories.clear()
+        self._borrowed.clear()
+
+    def copy_from(self, source: "LagCompensation", players: dict) -> None:
+        # Histories are shared until this game records into them.
+        self._histories = {players.get(p, p): h for p, h in source._histories.items()}
+        self._borrowed = set(self._histories)
+
+    def _new_history(self) -> PositionHistory:
+        while self._spare:
+            history = self._spare.pop()
+            if history.capacity == self.history_capacity:
+                history.clear()
+                return history
+        return PositionHistory(self.history_capacity)
+
+    def rewind_for(self, client_time: Optional[float]) -> float:
+        """Seconds to rewind for a shot stamped client_time, capped at max_rewind."""
+        if client_time is None:
+            return 0.0
+        return max(0.0, min(self.game.time - client_time, self.max_rewind))
+
+    def position_at(self, player: "Player", time: float) -> tuple[float, float]:
+        history = self._histories.get(player)
+        if history is not None:
+            sampled = history.sample(time)
+            if sampled is not None:
+                return sampled
+        return player.position
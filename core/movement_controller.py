@@ -1,7 +1,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 
 from entities.movement.movement_intent import MoveIntent
 
@@ -11,20 +12,107 @@ if TYPE_CHECKING:
 
 
 class MovementController:
+    """
+    Applies movement intents: effects, possession weight, then walls.
+
+    Inside batch(), moves are queued instead of resolved one by one, and
+    every queued mover goes through one Level.resolve_moves call when the
+    batch is flushed. Whoever opens the batch must settle() a player before
+    acting on their position (e.g. firing), and a second move by the same
+    player flushes the batch first, so results match unbatched moves.
+    """
+
     def __init__(self, game: "Game"):
         self.game = game
+        self._batching = False
+        self._players: list["Player"] = []
+        self._queued: set["Player"] = set()
+        self._starts: list[tuple[float, float]] = []
+        self._targets: list[tuple[float, float]] = []
+        # (player, seq, predicted position) reconciled once the batch lands.
+        self._reconcile: list[tuple["Player", int, tuple[float, float]]] = []
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.flush()
+
+    def pending(self, player: "Player") -> bool:
+        return player in self._queued
+
+    def settle(self, player: "Player") -> None:
+        """Make sure player's queued move, if any, has been applied."""
+        if player in self._queued:
+            self.flush()
+
+    def defer_reconcile(self, player: "Player", seq: int, predicted_position) -> None:
+        self._reconcile.append((player, seq, predicted_position))
+
+    def flush(self) -> None:
+        players = self._players
+        if not players:
+            return
+        starts = self._starts
+        targets = self._targets
+        level = self.game.level
+        if level is not None:
+            targets = level.resolve_moves(starts, targets, [p.hit_radius for p in players])
+        for player, start, position in zip(players, starts, targets):
+            self._commit(player, start, position)
+
+        reconcile = self.game.inputs.reconcile
+        for player, seq, predicted in self._reconcile:
+            reconcile(player, seq, predicted)
+        self._players = []
+        self._queued.clear()
+        self._starts = []
+        self._targets = []
+        self._reconcile = []
 
     def move(
         self,
         player: "Player",
         requested_position: tuple[float, float],
     ) -> bool:
+        if self._batching and player in self._queued:
+            # A second move this batch starts from where the first one lands.
+            self.flush()
         move_intent = MoveIntent(
             current_position=player.position,
             requested_position=requested_position,
         )
 
         final_intent = player.active_effects.modify_movement(move_intent)
+        target = final_intent.requested_position
+
+        # A possessed object's weight scales the step the player takes.
+        if player.possessed is not None:
+            scale = self.game.possession.speed_modifier(player)
+            if scale != 1.0:
+                x, y = player.position
+                target = (x + (target[0] - x) * scale, y + (target[1] - y) * scale)
+
+        start = player.position
+        if self._batching:
+            self._players.append(player)
+            self._queued.add(player)
+            self._starts.append(start)
+            self._targets.append(target)
+            return True
+
+        level = self.game.level
+        if level is not None:
+            target = level.resolve_move(start, target, player.hit_radius)
+        self._commit(player, start, target)
+        return True
 
-        player.position = final_intent.requested_position
-        return True
\ No newline at end of file
+    def _commit(self, player: "Player", start, position: tuple[float, float]) -> None:
+        player.position = position
+        if player.role == "prop":
+            x, y = player.position
+            step = ((x - start[0]) ** 2 + (y - start[1]) ** 2) ** 0.5
+            self.game.noise.make_noise(player, player.position, step)
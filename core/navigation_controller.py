@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from core.game import Game
+    from entities.player import Player
+    from level.flow_field import FlowField
+    from level.level import Level
+    from level.nav_grid import NavGrid
+
+
+class NavigationController:
+    """
+    Bot pathfinding over flow fields cached per goal cell.
+
+    The nav grid is baked once per level. A flow field answers "which way to
+    the goal" for every cell, so bots chasing the same goal share one field
+    and steer_many costs a single cache lookup per goal per tick. Fields are
+    keyed by goal cell and kept in an LRU of max_fields; a goal that moves
+    within its cell reuses its field, and a tracked goal that changes cell
+    drops its old field.
+
+    With an executor set, missing fields are computed off the tick thread;
+    until one is ready, steering falls back to a straight line. Without a
+    level there are no walls, so steering is always a straight line.
+    """
+
+    cell_size = 0.5
+    clearance = 0.5
+    max_fields = 32
+
+    def __init__(self, game: "Game", executor: Optional["Executor"] = None):
+        self.game = game
+        self.executor = executor
+
+        self._grid: Optional["NavGrid"] = None
+        self._grid_level: Optional["Level"] = None
+        self._fields: OrderedDict[int, "FlowField"] = OrderedDict()
+        self._pending: dict[int, "Future"] = {}
+        self._goals: dict[Hashable, int] = {}
+
+    @property
+    def grid(self) -> Optional["NavGrid"]:
+        level = self.game.level
+        if level is not self._grid_level:
+            self.reset()
+            self._grid_level = level
+            if level is not None:
+                # Imported on first use; open-world matches never bake a grid.
+                from level.nav_grid import NavGrid
+
+                self._grid = NavGrid.bake(level, self.cell_size, self.clearance)
+        return self._grid
+
+    def reset(self) -> None:
+        self._grid = None
+        self._grid_level = None
+        self._fields.clear()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._goals.clear()
+
+    def copy_from(self, source: "NavigationController", players: dict) -> None:
+        # Grids and fields are immutable once built, so the fork shares them.
+        self.executor = source.executor
+        self._grid = source._grid
+        self._grid_level = source._grid_level
+        self._fields = OrderedDict(source._fields)
+        self._goals = dict(source._goals)
+
+    def field_for(self, goal: tuple[float, float]) -> Optional["FlowField"]:
+        """Flow field toward goal, or None if off the grid, walled in or still computing."""
+        grid = self.grid
+        if grid is None:
+            return None
+        cell = grid.nearest_walkable(grid.index_of(goal[0], goal[1]))
+        if cell is None:
+            return None
+        return self._field_for_cell(grid, cell)
+
+    def track(self, key: Hashable, goal: tuple[float, float]) -> Optional["FlowField"]:
+        """
+        field_for a named, moving goal (a flag carrier, a capture zone).
+        When the goal leaves its cell, the old cell's field is invalidated
+        unless another tracked goal still uses it.
+        """
+        grid = self.grid
+        if grid is None:
+            return None
+        cell = grid.nearest_walkable(grid.index_of(goal[0], goal[1]))
+        previous = self._goals.get(key)
+        if previous is not None and previous != cell:
+            del self._goals[key]
+            if previous not in self._goals.values():
+                self.forget(previous)
+        if cell is None:
+            self._goals.pop(key, None)
+            return None
+        self._goals[key] = cell
+        return self._field_for_cell(grid, cell)
+
+    def forget(self, cell: int) -> None:
+        self._fields.pop(cell, None)
+        future = self._pending.pop(cell, None)
+        if future is not None:
+            future.cancel()
+
+    def steer(self, player: "Player", goal: tuple[float, float]) -> tuple[float, float]:
+        return self.steer_many((player,), goal)[0]
+
+    def steer_many(
+        self, players: Iterable["Player"], goal: tuple[float, float]
+    ) -> list[tuple[float, float]]:
+        """Unit direction toward goal for each player, from one shared field."""
+        field = self.field_for(goal)
+        directions = []
+        for player in players:
+            x, y = player.position
+            direction = (0.0, 0.0) if field is None else field.direction_at(x, y)
+            if direction == (0.0, 0.0):
+                direction = _straight_line(x, y, goal)
+            directions.append(direction)
+        return directions
+
+    def _field_for_cell(self, grid: "NavGrid", cell: int) -> Optional["FlowField"]:
+        field = self._fields.get(cell)
+        if field is not None:
+            self._fields.move_to_end(cell)
+            return field
+
+        from level.flow_field import FlowField
+
+        if self.executor is None:
+            field = FlowField.compute(grid, cell)
+        else:
+            future = self._pending.get(cell)
+            if future is None:
+                self._pending[cell] = self.executor.submit(FlowField.compute, grid, cell)
+                return None
+            if not future.done():
+                return None
+            del self._pending[cell]
+            field = future.result()
+
+        self._fields[cell] = field
+        while len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+
+def _straight_line(x: float, y: float, goal: tuple[float, float]) -> tuple[float, float]:
+    dx = goal[0] - x
+    dy = goal[1] - y
+    length = math.hypot(dx, dy)
+    if length == 0.0:
+        return (0.0, 0.0)
+    return (dx / length, dy / length)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.events import NoiseHeard
+from core.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class NoiseController:
+    """
+    Footstep noise from moving props, delivered to hunters in earshot.
+
+    Noises are buffered as they happen and resolved once per tick: one
+    spatial hash of hunter positions answers every noise's radius query,
+    and each hunter gets a single NoiseHeard summarising everything they
+    heard that tick rather than one message per footstep.
+
+    A noise's loudness is the distance its step covered, so speed boosts
+    are louder. It carries range_per_loudness units per unit of loudness,
+    up to max_range, and fades linearly to nothing at that range.
+    """
+
+    range_per_loudness = 12.0
+    max_range = 20.0
+    min_loudness = 0.05
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+        self._sources: list["Player"] = []
+        self._positions: list[tuple[float, float]] = []
+        self._loudness: list[float] = []
+
+    def make_noise(self, source: "Player", position: tuple[float, float], loudness: float) -> None:
+        if loudness < self.min_loudness:
+            return
+        self._sources.append(source)
+        self._positions.append(position)
+        self._loudness.append(loudness)
+
+    def reset(self) -> None:
+        self._sources.clear()
+        self._positions.clear()
+        self._loudness.clear()
+
+    def copy_from(self, source: "NoiseController", players: dict) -> None:
+        self._sources = [players.get(p, p) for p in source._sources]
+        self._positions = list(source._positions)
+        self._loudness = list(source._loudness)
+
+    def pending(self) -> int:
+        return len(self._sources)
+
+    def resolve(self) -> None:
+        if not self._sources:
+            return
+
+        hunters = self.game.hunters
+        if hunters:
+            grid: SpatialHash = SpatialHash(self.max_range)
+            for hunter in hunters:
+                x, y = hunter.position
+                grid.insert(hunter, x, y)
+
+            # listener -> [total intensity, loudest intensity, its position, count]
+            heard: dict["Player", list] = {}
+            for position, loudness in zip(self._positions, self._loudness):
+                reach = min(loudness * self.range_per_loudness, self.max_range)
+                for hunter, distance in grid.query_radius(position[0], position[1], reach):
+                    intensity = loudness * (1.0 - distance / reach)
+                    if intensity <= 0.0:
+                        continue
+                    entry = heard.get(hunter)
+                    if entry is None:
+                        heard[hunter] = [intensity, intensity, position, 1]
+                        continue
+                    entry[0] += intensity
+                    entry[3] += 1
+                    if intensity > entry[1]:
+                        entry[1] = intensity
+                        entry[2] = position
+
+            for hunter, (total, _, loudest_at, count) in heard.items():
+                self.game.emit(NoiseHeard(hunter, loudest_at, total, count))
+
+        self._sources.clear()
+        self._positions.clear()
+        self._loudness.clear()
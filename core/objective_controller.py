@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from core.events import (
+    ActionDenied,
+    FlagCaptured,
+    FlagDropped,
+    FlagStolen,
+    ZoneEntered,
+    ZoneExited,
+)
+from core.trigger_grid import TriggerGrid
+from entities.objectives.capture_zone import CaptureZone
+from entities.objectives.flag import Flag
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class ObjectiveController:
+    """
+    Flags, capture zones and team scores.
+
+    Hunters carry flags; a prop steals one by getting within steal_radius
+    behind its hunter, and scores by carrying it into a "Props" zone. Zone
+    enter/exit triggers are only recomputed for players whose trigger-grid
+    cell changed since the last tick, so the per-tick cost does not grow
+    with the number or size of zones.
+    """
+
+    steal_radius = 1.5
+    trigger_cell_size = 1.0
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self.flags: list[Flag] = []
+        self.zones: list[CaptureZone] = []
+        self.scores = {"Hunters": 0, "Props": 0}
+
+        self._grid: TriggerGrid[CaptureZone] = TriggerGrid(self.trigger_cell_size)
+        self._carried: dict["Player", Flag] = {}
+        self._cells: dict["Player", tuple[int, int]] = {}
+        self._inside: dict["Player", tuple[CaptureZone, ...]] = {}
+
+    # ---- setup ----
+
+    def reset(self) -> None:
+        self.flags.clear()
+        self.zones.clear()
+        self.scores = {"Hunters": 0, "Props": 0}
+        self._grid.clear()
+        self._carried.clear()
+        self._cells.clear()
+        self._inside.clear()
+
+    def add_zone(self, zone: CaptureZone) -> None:
+        self.zones.append(zone)
+        self._grid.add(zone, zone.min_corner, zone.max_corner)
+        # Re-check everyone against the new layout on the next update.
+        self._cells.clear()
+
+    def issue_flags(self) -> list[Flag]:
+        """Give a flag to every hunter who isn't carrying one."""
+        issued = []
+        for hunter in self.game.hunters:
+            if hunter in self._carried:
+                continue
+            flag = Flag(len(self.flags), hunter, hunter)
+            self.flags.append(flag)
+            self._carried[hunter] = flag
+            issued.append(flag)
+        return issued
+
+    def copy_from(self, source: "ObjectiveController", players: dict) -> None:
+        flags = {
+            flag: Flag(
+                flag.flag_id,
+                players.get(flag.owner, flag.owner),
+                players.get(flag.carrier, flag.carrier),
+                flag.position,
+                flag.captured,
+            )
+            for flag in source.flags
+        }
+        self.flags = list(flags.values())
+        self.zones = list(source.zones)
+        self.scores = dict(source.scores)
+        self._grid = source._grid.copy()
+        self._carried = {players.get(p, p): flags[f] for p, f in source._carried.items()}
+        self._cells = {players.get(p, p): cell for p, cell in source._cells.items()}
+        self._inside = {players.get(p, p): zones for p, zones in source._inside.items()}
+
+    # ---- queries ----
+
+    def flag_of(self, player: "Player") -> Optional[Flag]:
+        return self._carried.get(player)
+
+    def zones_of(self, player: "Player") -> tuple[CaptureZone, ...]:
+        return self._inside.get(player, ())
+
+    # ---- actions ----
+
+    def steal(self, player: "Player") -> Optional[Flag]:
+        if player not in self.game.props:
+            self.game.emit(ActionDenied(player, "steal", "Only props can steal flags."))
+            return None
+        if player in self._carried:
+            self.game.emit(ActionDenied(player, "steal", "You're already carrying a flag."))
+            return None
+
+        flag = self._flag_in_reach(player)
+        if flag is None:
+            self.game.emit(
+                ActionDenied(player, "steal", "No flag in reach. Sneak up behind a hunter.")
+            )
+            return None
+
+        victim = flag.carrier
+        if victim is not None:
+            del self._carried[victim]
+        flag.carrier = player
+        self._carried[player] = flag
+        self.game.emit(FlagStolen(player, victim))
+
+        # Stealing while already standing in the base captures on the spot.
+        for zone in self.zones_of(player):
+            if zone.team == "Props":
+                self._capture(player, zone)
+                break
+        return flag
+
+    def _flag_in_reach(self, player: "Player") -> Optional[Flag]:
+        px, py = player.position
+        best = None
+        best_dist_sq = self.steal_radius * self.steal_radius
+        for flag in self.flags:
+            if flag.captured:
+                continue
+            carrier = flag.carrier
+            if carrier is not None and carrier not in self.game.hunters:
+                continue
+
+            fx, fy = flag.location
+            dx = px - fx
+            dy = py - fy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > best_dist_sq:
+                continue
+            if carrier is not None:
+                # Must come from behind the hunter.
+                facing_x, facing_y = carrier.direction
+                if dx * facing_x + dy * facing_y >= 0.0:
+                    continue
+            best = flag
+            best_dist_sq = dist_sq
+        return best
+
+    def _capture(self, player: "Player", zone: CaptureZone) -> None:
+        flag = self._carried.pop(player)
+        flag.carrier = None
+        flag.position = player.position
+        flag.captured = True
+        self.scores["Props"] += 1
+        self.game.emit(FlagCaptured(player, zone.name))
+
+    # ---- tick ----
+
+    def update(self) -> None:
+        grid = self._grid
+        cells = self._cells
+        for player in self.game.hunters + self.game.props:
+            cell = grid.cell_of(*player.position)
+            if cells.get(player) == cell:
+                continue
+            cells[player] = cell
+
+            old = self._inside.get(player, ())
+            new = grid.volumes_at(cell)
+            if old == new:
+                continue
+            self._inside[player] = new
+
+            for zone in old:
+                if zone not in new:
+                    self.game.emit(ZoneExited(player, zone.name))
+            for zone in new:
+                if zone not in old:
+                    self.game.emit(ZoneEntered(player, zone.name))
+                    if zone.team == "Props" and player in self._carried:
+                        self._capture(player, zone)
+
+    def on_death(self, player: "Player", killer: Optional[str] = None) -> None:
+        self._cells.pop(player, None)
+        self._inside.pop(player, None)
+
+        flag = self._carried.pop(player, None)
+        if flag is None:
+            return
+        flag.carrier = None
+        flag.position = player.position
+        if player in self.game.props:
+            # Stopping a carrier is the hunters' score.
+            self.scores["Hunters"] += 1
+        self.game.emit(FlagDropped(player, killer))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class PhysicsController:
+    """
+    Knockback / ragdoll integration for players.
+
+    Only players that have received an impulse and not yet come to rest are
+    kept in the active set, so idle players cost nothing per tick. Each tick
+    integrates the whole active set in one pass: gravity on the vertical
+    axis, exponential ground friction on the horizontal one, and the ragdoll
+    recovery timer.
+    """
+
+    gravity = 20.0
+    ground_friction = 6.0
+    rest_speed = 0.05
+
+    # Impulses at least this strong ragdoll the player for ragdoll_duration.
+    ragdoll_threshold = 20.0
+    ragdoll_duration = 1.5
+
+    def __init__(self, game: "Game"):
+        self.game = game
+
+        # Insertion-ordered set of players currently in motion.
+        self._active: dict["Player", None] = {}
+
+    def reset(self) -> None:
+        self._active.clear()
+
+    def copy_from(self, source: "PhysicsController", players: dict) -> None:
+        self._active = {players.get(p, p): None for p in source._active}
+
+    def is_active(self, player: "Player") -> bool:
+        return player in self._active
+
+    def apply_impulse(
+        self,
+        player: "Player",
+        impulse: tuple[float, float],
+        vertical: float = 0.0,
+    ) -> None:
+        ix, iy = impulse
+        # A heavy disguise takes the hit with the prop inside it.
+        if player.possessed is not None:
+            scale = self.game.possession.knockback_scale(player)
+            ix *= scale
+            iy *= scale
+            vertical *= scale
+        vx, vy = player.velocity
+        player.velocity = (vx + ix, vy + iy)
+        player.vertical_velocity += vertical
+
+        if math.sqrt(ix * ix + iy * iy + vertical * vertical) >= self.ragdoll_threshold:
+            player.status.ragdolled = True
+            player.status.ragdoll_time = max(
+                player.status.ragdoll_time, self.ragdoll_duration
+            )
+
+        self._active[player] = None
+
+    def update(self, dt: float) -> None:
+        if not self._active:
+            return
+
+        level = self.game.level
+        gravity_step = self.gravity * dt
+        friction = math.exp(-self.ground_friction * dt)
+        rest_speed = self.rest_speed
+
+        players = list(self._active)
+        starts = [player.position for player in players]
+        ends = [
+            (x + player.velocity[0] * dt, y + player.velocity[1] * dt)
+            for player, (x, y) in zip(players, starts)
+        ]
+        if level is not None:
+            # One batched wall resolution for everyone in motion.
+            ends = level.resolve_moves(starts, ends, [p.hit_radius for p in players])
+
+        settled = []
+        for player, (x, y) in zip(players, ends):
+            vx, vy = player.velocity
+
+            vz = player.vertical_velocity - gravity_step
+            height = player.height + vz * dt
+            grounded = height <= 0.0
+            if grounded:
+                height = 0.0
+                vz = 0.0
+                vx *= friction
+                vy *= friction
+                if abs(vx) < rest_speed and abs(vy) < rest_speed:
+                    vx = vy = 0.0
+
+            player.position = (x, y)
+            player.velocity = (vx, vy)
+            player.height = height
+            player.vertical_velocity = vz
+
+            status = player.status
+            if status.ragdolled:
+                status.ragdoll_time -= dt
+                if status.ragdoll_time <= 0.0 and grounded:
+                    status.ragdolled = False
+                    status.ragdoll_time = 0.0
+
+            if grounded and vx == 0.0 and vy == 0.0 and not status.ragdolled:
+                settled.append(player)
+
+        for player in settled:
+            del self._active[player]
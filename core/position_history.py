@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from array import array
+
+
+class PositionHistory:
+    """
+    Fixed-capacity ring buffer of (time, x, y) samples for one player.
+
+    Storage is three preallocated double arrays, so recording never
+    allocates and memory use is exactly 24 bytes per slot. Once full, the
+    oldest sample is overwritten.
+    """
+
+    BYTES_PER_SAMPLE = 3 * 8
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._xs = array("d", bytes(8 * capacity))
+        self._ys = array("d", bytes(8 * capacity))
+        self._head = 0  # next slot to write
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self.capacity * self.BYTES_PER_SAMPLE
+
+    def copy(self) -> "PositionHistory":
+        other = PositionHistory.__new__(PositionHistory)
+        other.capacity = self.capacity
+        other._times = array("d", self._times)
+        other._xs = array("d", self._xs)
+        other._ys = array("d", self._ys)
+        other._head = self._head
+        other._count = self._count
+        return other
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def record(self, time: float, x: float, y: float) -> None:
+        head = self._head
+        self._times[head] = time
+        self._xs[head] = x
+        self._ys[head] = y
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def oldest_time(self) -> float | None:
+        if self._count == 0:
+            return None
+        return self._times[self._slot(0)]
+
+    def sample(self, time: float) -> tuple[float, float] | None:
+        """
+        Position at time, linearly interpolated between recorded samples.
+
+        Times outside the recorded window clamp to the oldest/newest sample.
+        Returns None if nothing has been recorded yet.
+        """
+        count = self._count
+        if count == 0:
+            return None
+
+        times = self._times
+        newest = self._slot(count - 1)
+        if time >= times[newest]:
+            return (self._xs[newest], self._ys[newest])
+        oldest = self._slot(0)
+        if time <= times[oldest]:
+            return (self._xs[oldest], self._ys[oldest])
+
+        # Binary search for the last sample at or before time.
+        lo, hi = 0, count - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if times[self._slot(mid)] <= time:
+                lo = mid
+            else:
+                hi = mid
+
+        a = self._slot(lo)
+        b = self._slot(hi)
+        span = times[b] - times[a]
+        f = (time - times[a]) / span if span > 0 else 0.0
+        return (
+            self._xs[a] + (self._xs[b] - self._xs[a]) * f,
+            self._ys[a] + (self._ys[b] - self._ys[a]) * f,
+        )
+
+    def _slot(self, logical_index: int) -> int:
+        """Physical slot of the logical_index-th oldest sample."""
+        return (self._head - self._count + logical_index) % self.capacity
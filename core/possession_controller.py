@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from core.events import ActionDenied
+from core.kd_tree import KDTree
+from entities.player import DEFAULT_HITBOX
+from entities.props.prop_instance import PropInstance
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+    from entities.props.prop_catalog import PropCatalog
+
+
+class PossessionController:
+    """
+    Props disguising themselves as objects placed in the level.
+
+    Placed objects never move, so they are indexed once in k-d trees: one
+    over every object and one per prop kind, making "nearest Crate within
+    reach" a logarithmic lookup. Possessing swaps the player's hitbox for the
+    object's shape and scales their movement by its speed modifier.
+
+    An object hides one prop at a time: possessing claims the instance until
+    the prop releases it, and the nearest lookup passes over claimed ones.
+    Objects heavier than a prop's own body also soak up knockback.
+    """
+
+    reach = 3.0
+    body_mass = 40.0
+
+    def __init__(self, game: "Game", catalog: Optional["PropCatalog"] = None):
+        self.game = game
+        self._catalog = catalog
+        self.instances: list[PropInstance] = []
+        self._index: KDTree[PropInstance] = KDTree([])
+        self._index_by_name: dict[str, KDTree[PropInstance]] = {}
+        self._claimed: dict[PropInstance, "Player"] = {}
+
+    @property
+    def catalog(self) -> "PropCatalog":
+        # Loaded on first use so matches without props never read the file.
+        if self._catalog is None:
+            from entities.props.prop_catalog import default_catalog
+
+            self._catalog = default_catalog()
+        return self._catalog
+
+    def reset(self) -> None:
+        self.instances.clear()
+        self._index = KDTree([])
+        self._index_by_name.clear()
+        self._claimed.clear()
+
+    def copy_from(self, source: "PossessionController", players: dict) -> None:
+        # Placed objects and their k-d trees are never mutated, only rebuilt.
+        self._catalog = source._catalog
+        self.instances = list(source.instances)
+        self._index = source._index
+        self._index_by_name = dict(source._index_by_name)
+        self._claimed = {
+            instance: players.get(p, p) for instance, p in source._claimed.items()
+        }
+
+    def place(self, placements: Iterable[tuple[str, tuple[float, float]]]) -> list[PropInstance]:
+        """Add (prop name, position) placements and rebuild the indexes."""
+        for name, position in placements:
+            spec = self.catalog.by_name(name)
+            x, y = position
+            self.instances.append(
+                PropInstance(len(self.instances), spec, (float(x), float(y)))
+            )
+
+        by_name: dict[str, list] = {}
+        for instance in self.instances:
+            by_name.setdefault(instance.name, []).append((instance, *instance.position))
+        self._index = KDTree([(i, *i.position) for i in self.instances])
+        self._index_by_name = {name: KDTree(entries) for name, entries in by_name.items()}
+        return self.instances
+
+    def nearest(
+        self,
+        position: tuple[float, float],
+        name: Optional[str] = None,
+        max_distance: float = float("inf"),
+    ) -> Optional[PropInstance]:
+        index = self._index if name is None else self._index_by_name.get(name)
+        if index is None:
+            return None
+        found = index.nearest(position[0], position[1], max_distance, self._claimed)
+        return None if found is None else found[0]
+
+    def possess(self, player: "Player", obj_name: Optional[str]) -> Optional[PropInstance]:
+        if player not in self.game.props:
+            self.game.emit(ActionDenied(player, "possess", "Only props can possess objects."))
+            return None
+        if obj_name is not None and obj_name not in self.catalog:
+            self.game.emit(ActionDenied(player, "possess", "There is no {} to possess.", (obj_name,)))
+            return None
+
+        # The object being worn is up for grabs again when switching, but
+        # a failed switch keeps the prop in it.
+        current = player.possessed
+        worn = self._claimed.pop(current, None)
+        instance = self.nearest(player.position, obj_name, self.reach)
+        if instance is None:
+            if worn is not None:
+                self._claimed[current] = worn
+            self.game.emit(ActionDenied(player, "possess", "Nothing to possess within reach."))
+            return None
+
+        self._claimed[instance] = player
+        player.possessed = instance
+        player.hitbox = instance.spec.hitbox
+        return instance
+
+    def release(self, player: "Player") -> None:
+        instance = player.possessed
+        if self._claimed.get(instance) is player:
+            del self._claimed[instance]
+        player.possessed = None
+        player.hitbox = DEFAULT_HITBOX
+
+    def speed_modifier(self, player: "Player") -> float:
+        if player.possessed is None:
+            return 1.0
+        return player.possessed.spec.speed_modifier
+
+    def knockback_scale(self, player: "Player") -> float:
+        if player.possessed is None:
+            return 1.0
+        return min(1.0, self.body_mass / player.possessed.spec.mass)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SpatialHash(Generic[T]):
+    """
+    Uniform grid that buckets items by cell for radius queries.
+
+    With cell_size >= the query radius a lookup touches at most a 3x3 block
+    of cells, so the cost depends on local density rather than on how many
+    items are in the index.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: dict[tuple[int, int], list[tuple[T, float, float]]] = {}
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def insert(self, item: T, x: float, y: float) -> None:
+        self._cells.setdefault(self.cell_of(x, y), []).append((item, x, y))
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[tuple[T, float]]:
+        """Return (item, distance) for every item within radius of (x, y)."""
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        hits = []
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for item, ix, iy in bucket:
+                    d2 = (ix - x) ** 2 + (iy - y) ** 2
+                    if d2 <= radius_sq:
+                        hits.append((item, math.sqrt(d2)))
+        return hits
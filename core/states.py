@@ -1,3 +1,4 @@
+from core.events import ActionDenied, PropPossessed
 from entities.player import Player
 from entities.weapons.weapon import Weapon
 
@@ -15,7 +16,16 @@ class GameState:
     def handle_switch_slot(self, player: Player, slot_name: str):
         raise NotImplementedError
 
-    def handle_use_weapon(self, player: Player):
+    def handle_use_weapon(self, player: Player, client_time=None):
+        raise NotImplementedError
+
+    def handle_hold_trigger(self, player: Player, held: bool):
+        raise NotImplementedError
+
+    def handle_reload(self, player: Player):
+        raise NotImplementedError
+
+    def handle_steal(self, player: Player):
         raise NotImplementedError
 
     def handle_possess(self, player: Player, obj_name: str):
@@ -30,23 +40,37 @@ class LobbyState(GameState):
         return self.game._move_core(player, new_position)
 
     def handle_pickup_weapon(self, player, weapon):
-        self.game.notify_player(player, "Can't pick up weapons in the lobby.")
+        self.game.emit(ActionDenied(player, "pickup_weapon", "Can't pick up weapons in the lobby."))
         return False
 
     def handle_switch_slot(self, player, slot_name):
-        self.game.notify_player(player, "Can't switch weapons in the lobby.")
+        self.game.emit(ActionDenied(player, "switch_slot", "Can't switch weapons in the lobby."))
+        return False
+
+    def handle_use_weapon(self, player, client_time=None):
+        self.game.emit(ActionDenied(player, "use_weapon", "Can't use weapons in the lobby."))
+        return False
+
+    def handle_hold_trigger(self, player, held):
+        if not held:
+            return self.game._hold_trigger_core(player, False)
+        self.game.emit(ActionDenied(player, "use_weapon", "Can't use weapons in the lobby."))
         return False
 
-    def handle_use_weapon(self, player):
-        self.game.notify_player(player, "Can't use weapons in the lobby.")
+    def handle_reload(self, player):
+        self.game.emit(ActionDenied(player, "reload", "Can't reload in the lobby."))
+        return False
+
+    def handle_steal(self, player):
+        self.game.emit(ActionDenied(player, "steal", "Can't steal flags in the lobby."))
         return False
 
     def handle_possess(self, player, obj_name):
-        self.game.notify_player(player, "Can't possess in the lobby.")
+        self.game.emit(ActionDenied(player, "possess", "Can't possess in the lobby."))
         return False
 
     def handle_add_effect(self, player, effect):
-        self.game.notify_player(player, "Can't assign movement effects in the lobby.")
+        self.game.emit(ActionDenied(player, "add_effect", "Can't assign movement effects in the lobby."))
         return False
 
 
@@ -62,15 +86,28 @@ class PreparingState(GameState):
     def handle_switch_slot(self, player, slot_name):
         return self.game._switch_slot_core(player, slot_name)
 
-    def handle_use_weapon(self, player):
+    def handle_use_weapon(self, player, client_time=None):
         return self.game._use_equipped_weapon_blank_core(player)
 
+    def handle_hold_trigger(self, player, held):
+        return self.game._hold_trigger_core(player, held)
+
+    def handle_reload(self, player):
+        return self.game._reload_core(player)
+
+    def handle_steal(self, player):
+        self.game.emit(ActionDenied(player, "steal", "Can't steal flags while preparing."))
+        return False
+
     def handle_possess(self, player, obj_name):
-        self.game.notify_all(f"{player.name} possessed {obj_name} (PREPARING)")
+        instance = self.game._possess_core(player, obj_name)
+        if instance is None:
+            return False
+        self.game.emit(PropPossessed(player, instance.name, "PREPARING"))
         return True
 
     def handle_add_effect(self, player, effect):
-        self.game.notify_player(player, "Can't assign movement while preparing")
+        self.game.emit(ActionDenied(player, "add_effect", "Can't assign movement while preparing"))
         return False
     
 
@@ -87,11 +124,23 @@ class PlayingState(GameState):
     def handle_switch_slot(self, player, slot_name):
         return self.game._switch_slot_core(player, slot_name)
 
-    def handle_use_weapon(self, player):
-        return self.game._use_equipped_weapon_live_core(player)
+    def handle_use_weapon(self, player, client_time=None):
+        return self.game._use_equipped_weapon_live_core(player, client_time)
+
+    def handle_hold_trigger(self, player, held):
+        return self.game._hold_trigger_core(player, held)
+
+    def handle_reload(self, player):
+        return self.game._reload_core(player)
+
+    def handle_steal(self, player):
+        return self.game._steal_core(player) is not None
 
     def handle_possess(self, player, obj_name):
-        self.game.notify_all(f"{player.name} possessed {obj_name} (PLAYING)")
+        instance = self.game._possess_core(player, obj_name)
+        if instance is None:
+            return False
+        self.game.emit(PropPossessed(player, instance.name, "PLAYING"))
         return True
 
     def handle_add_effect(self, player, effect):
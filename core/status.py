@@ -4,10 +4,12 @@ from dataclasses import dataclass
 class Status:
     stunned: bool = False
     ragdolled: bool = False
+    # Seconds until a ragdolled player can recover (once grounded).
+    ragdoll_time: float = 0.0
 
     def blocks(self, action: str) -> bool:
-        if self.ragdolled and action in {"switch_slot", "use_weapon", "pickup_weapon"}:
+        if self.ragdolled and action in {"move", "switch_slot", "use_weapon", "pickup_weapon", "reload", "steal"}:
             return True
-        if self.stunned and action in {"switch_slot", "use_weapon", "pickup_weapon"}:
+        if self.stunned and action in {"switch_slot", "use_weapon", "pickup_weapon", "reload", "steal"}:
             return True
         return False
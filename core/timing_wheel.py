@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel for match-wide timers (shots, reloads, ...).
+
+    Level 0 has one slot per `resolution` seconds; each higher level covers
+    `slots` times the span of the one below. Timers are filed by how far in
+    the future they are and cascade down a level as their time approaches,
+    so advancing costs O(slots stepped + due timers) no matter how many
+    timers are pending. Exact float times are kept, and due timers come out
+    in time order, so callers get sub-tick precision.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 1.0 / 240.0,
+        slots: int = 64,
+        levels: int = 4,
+        start_time: float = 0.0,
+    ):
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self._wheels: list[list[list]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: list = []
+        self._tick = math.floor(start_time / resolution)
+        self._time = start_time
+        self._seq = 0
+        self._pending = 0
+        self._cancelled: set[int] = set()
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def copy(self, map_payload=None) -> "TimingWheel":
+        """
+        Independent wheel with the same pending timers and handles.
+        map_payload, if given, transforms each payload on the way.
+        """
+        other = TimingWheel.__new__(TimingWheel)
+        other.resolution = self.resolution
+        other.slots = self.slots
+        other.levels = self.levels
+
+        def copy_bucket(bucket):
+            if map_payload is None:
+                return list(bucket)
+            return [(time, seq, map_payload(payload), tick) for time, seq, payload, tick in bucket]
+
+        other._wheels = [[copy_bucket(bucket) for bucket in wheel] for wheel in self._wheels]
+        other._overflow = copy_bucket(self._overflow)
+        other._tick = self._tick
+        other._time = self._time
+        other._seq = self._seq
+        other._pending = self._pending
+        other._cancelled = set(self._cancelled)
+        return other
+
+    def entries(self) -> list[tuple[float, Any]]:
+        """Pending (time, payload) pairs in time order, without advancing."""
+        live = [entry for wheel in self._wheels for bucket in wheel for entry in bucket]
+        live += self._overflow
+        live.sort(key=lambda entry: (entry[0], entry[1]))
+        cancelled = self._cancelled
+        return [(time, payload) for time, seq, payload, _ in live if seq not in cancelled]
+
+    def reset(self, start_time: float = 0.0) -> None:
+        """Drop every timer and rewind to start_time, keeping the buckets."""
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._overflow.clear()
+        self._tick = math.floor(start_time / self.resolution)
+        self._time = start_time
+        self._pending = 0
+        self._cancelled.clear()
+
+    @property
+    def time(self) -> float:
+        """The time the wheel was last advanced to."""
+        return self._time
+
+    def schedule(self, time: float, payload: Any) -> int:
+        """File payload to come due at time. Returns a handle for cancel()."""
+        self._seq += 1
+        tick = max(math.floor(time / self.resolution), self._tick)
+        self._place((time, self._seq, payload, tick))
+        self._pending += 1
+        return self._seq
+
+    def cancel(self, handle: int) -> None:
+        self._cancelled.add(handle)
+
+    def advance(self, to_time: float) -> list[tuple[float, Any]]:
+        """Move the wheel to to_time and return the (time, payload) pairs now due."""
+        if to_time < self._time:
+            return []
+
+        target = math.floor(to_time / self.resolution)
+        self._time = to_time
+
+        if self._pending == 0:
+            self._tick = max(self._tick, target)
+            return []
+
+        due = []
+        wheel0 = self._wheels[0]
+        slots = self.slots
+        tick = self._tick
+        while True:
+            bucket = wheel0[tick % slots]
+            if bucket:
+                keep = []
+                for entry in bucket:
+                    if entry[0] <= to_time:
+                        due.append(entry)
+                    else:
+                        keep.append(entry)
+                wheel0[tick % slots] = keep
+
+            if tick >= target:
+                break
+            tick += 1
+            self._tick = tick
+            self._cascade(tick)
+
+        self._pending -= len(due)
+        due.sort()
+
+        cancelled = self._cancelled
+        if cancelled:
+            result = []
+            for time, seq, payload, _ in due:
+                if seq in cancelled:
+                    cancelled.discard(seq)
+                else:
+                    result.append((time, payload))
+            return result
+        return [(time, payload) for time, _, payload, _ in due]
+
+    def _place(self, entry) -> None:
+        tick = entry[3]
+        delta = tick - self._tick
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots:
+                self._wheels[level][(tick // span) % self.slots].append(entry)
+                return
+            span *= self.slots
+        self._overflow.append(entry)
+
+    def _cascade(self, tick: int) -> None:
+        # Find every level whose bucket boundary we just crossed, then
+        # re-file from the top down so entries can fall through levels.
+        crossed = 0
+        span = self.slots
+        while crossed < self.levels - 1 and tick % span == 0:
+            crossed += 1
+            span *= self.slots
+
+        if crossed == self.levels - 1 and tick % span == 0 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            for entry in overflow:
+                self._place(entry)
+
+        for level in range(crossed, 0, -1):
+            index = (tick // self.slots ** level) % self.slots
+            bucket = self._wheels[level][index]
+            if bucket:
+                self._wheels[level][index] = []
+                for entry in bucket:
+                    self._place(entry)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TriggerGrid(Generic[T]):
+    """
+    Static uniform grid mapping cells to the trigger volumes covering them.
+
+    Volumes are rasterized onto whole cells when added (a volume's edges are
+    snapped outward to cell boundaries), so "which volumes is this player
+    in" depends only on the player's cell. Callers can then skip every
+    player whose cell did not change since the last check.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._cells: dict[tuple[int, int], tuple[T, ...]] = {}
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def copy(self) -> "TriggerGrid[T]":
+        other = TriggerGrid(self.cell_size)
+        other._cells = dict(self._cells)
+        return other
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def add(self, volume: T, min_corner, max_corner) -> None:
+        x0, y0 = self.cell_of(*min_corner)
+        # A max edge exactly on a boundary does not spill into the next cell.
+        x1 = math.ceil(max_corner[0] / self.cell_size) - 1
+        y1 = math.ceil(max_corner[1] / self.cell_size) - 1
+        for cx in range(x0, max(x0, x1) + 1):
+            for cy in range(y0, max(y0, y1) + 1):
+                self._cells[(cx, cy)] = self._cells.get((cx, cy), ()) + (volume,)
+
+    def volumes_at(self, cell: tuple[int, int]) -> tuple[T, ...]:
+        return self._cells.get(cell, ())
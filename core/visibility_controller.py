@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Optional
+
+from core.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.player import Player
+
+
+class VisibilityController:
+    """
+    Which props each hunter can currently see.
+
+    The whole hunter x prop matrix is computed in one batch: a spatial-hash
+    distance cull, a view-cone test against Player.direction, and a single
+    batched level raycast for occlusion over the pairs that survive. The
+    result is cached until the next refresh, so AI, interest management and
+    anti-cheat all read the same answer instead of recomputing it.
+
+    interval is the refresh period in seconds (0 = every tick).
+    """
+
+    view_distance = 40.0
+    fov_degrees = 100.0
+    interval = 0.0
+
+    def __init__(self, game: "Game"):
+        self.game = game
+        self.computed_at: Optional[float] = None
+        self._visible: dict["Player", frozenset["Player"]] = {}
+        self._seen_by: dict["Player", frozenset["Player"]] = {}
+
+    def reset(self) -> None:
+        self.computed_at = None
+        self._visible = {}
+        self._seen_by = {}
+
+    def copy_from(self, source: "VisibilityController", players: dict) -> None:
+        def remap(table):
+            return {
+                players.get(p, p): frozenset(players.get(q, q) for q in seen)
+                for p, seen in table.items()
+            }
+
+        self.computed_at = source.computed_at
+        self._visible = remap(source._visible)
+        self._seen_by = remap(source._seen_by)
+
+    def update(self, now: float) -> bool:
+        """Refresh if the interval has elapsed. Returns whether it recomputed."""
+        if self.computed_at is not None and now - self.computed_at < self.interval:
+            return False
+        self.recompute()
+        self.computed_at = now
+        return True
+
+    def can_see(self, hunter: "Player", prop: "Player") -> bool:
+        return prop in self._visible.get(hunter, ())
+
+    def visible_to(self, hunter: "Player") -> frozenset["Player"]:
+        return self._visible.get(hunter, frozenset())
+
+    def seen_by(self, prop: "Player") -> frozenset["Player"]:
+        return self._seen_by.get(prop, frozenset())
+
+    def recompute(self) -> None:
+        hunters = self.game.hunters
+        props = self.game.props
+        self._visible = {}
+        self._seen_by = {}
+        if not hunters or not props:
+            return
+
+        view_distance = self.view_distance
+        cos_half_fov = math.cos(math.radians(self.fov_degrees) / 2)
+
+        grid: SpatialHash = SpatialHash(view_distance)
+        for prop in props:
+            x, y = prop.position
+            grid.insert(prop, x, y)
+
+        pairs = []
+        starts = []
+        ends = []
+        for hunter in hunters:
+            hx, hy = hunter.position
+            fx, fy = hunter.direction
+            facing = math.hypot(fx, fy)
+            if facing == 0.0:
+                continue
+            fx /= facing
+            fy /= facing
+
+            for prop, distance in grid.query_radius(hx, hy, view_distance):
+                px, py = prop.position
+                if distance > 0.0 and ((px - hx) * fx + (py - hy) * fy) / distance < cos_half_fov:
+                    continue
+                pairs.append((hunter, prop))
+                starts.append((hx, hy))
+                ends.append((px, py))
+
+        level = self.game.level
+        if level is not None and pairs:
+            occluded = level.raycast_batch(starts, ends)
+        else:
+            occluded = [None] * len(pairs)
+
+        visible: dict["Player", set] = {}
+        seen_by: dict["Player", set] = {}
+        for (hunter, prop), hit in zip(pairs, occluded):
+            if hit is None:
+                visible.setdefault(hunter, set()).add(prop)
+                seen_by.setdefault(prop, set()).add(hunter)
+
+        self._visible = {h: frozenset(s) for h, s in visible.items()}
+        self._seen_by = {p: frozenset(s) for p, s in seen_by.items()}
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+import random
+from typing import TYPE_CHECKING, Optional
 
+from core.events import (
+    ActionDenied,
+    Notice,
+    ReloadFinished,
+    ReloadStarted,
+    ShotFired,
+    SlotSwitched,
+    WeaponDropped,
+    WeaponPickedUp,
+)
+from entities.weapons.gun import Gun
 from entities.weapons.shot_intent import ShotIntent
 from entities.weapons.bullet import Bullet
 
@@ -12,55 +25,107 @@ if TYPE_CHECKING:
 
 
 class WeaponController:
+    """
+    Weapon mechanics that touch the world: slots, pickups, shots, and the
+    timed parts of firing.
+
+    Held triggers and reloads are timers on the match-wide game.timers wheel,
+    so their cost scales with what is due this tick, not with the number of
+    guns. Held-trigger shots fire at their exact sub-tick time and their
+    bullets are advanced to the end of the tick.
+
+    Shots fly straight along the shooter's facing unless rng is set; then
+    each is deflected by up to half its spread_deg either way, drawn from
+    rng so seeded simulations are reproducible.
+    """
+
     def __init__(self, game: "Game"):
         self.game = game
+        self.rng: Optional[random.Random] = None
+
+        self._held_triggers: set["Player"] = set()
+        self._scheduled_shots: set["Player"] = set()
+        # Set while a timer callback runs; the match time of that timer.
+        self._timer_time: Optional[float] = None
+
+    def reset(self) -> None:
+        self._held_triggers.clear()
+        self._scheduled_shots.clear()
+        self._timer_time = None
+        self.rng = None
+
+    def copy_from(self, source: "WeaponController", players: dict) -> None:
+        self._held_triggers = {players.get(p, p) for p in source._held_triggers}
+        self._scheduled_shots = {players.get(p, p) for p in source._scheduled_shots}
+        self._timer_time = source._timer_time
+        self.rng = None
+        if source.rng is not None:
+            # The fork draws the same spread the source would, without
+            # advancing the source's generator.
+            self.rng = random.Random()
+            self.rng.setstate(source.rng.getstate())
+
+    def held_triggers(self) -> list["Player"]:
+        return list(self._held_triggers)
+
+    def now(self) -> float:
+        """Match time of the action being processed."""
+        if self._timer_time is not None:
+            return self._timer_time
+        return self.game.time
 
     def switch_slot(self, player, slot_name: str):
         if slot_name not in player.loadout:
-            self.game.notify_player(player, f"Invalid slot: {slot_name}")
+            self.game.emit(ActionDenied(player, "switch_slot", "Invalid slot: {}", (slot_name,)))
             return None
         player.current_weapon_slot = slot_name
-        self.game.notify_player(player, f"Switched to {slot_name}")
+        self.game.emit(SlotSwitched(player, slot_name))
         return True
 
     def pickup_into_slot(self, player, weapon: "Weapon", slot_name: str):
         if weapon.owner is not None:
-            self.game.notify_player(player, f"{weapon.name} is already owned.")
+            self.game.emit(
+                ActionDenied(player, "pickup_weapon", "{} is already owned.", (weapon.name,))
+            )
             return None
 
         old = player.loadout.get(slot_name)
         if old:
             old.owner = None
-            self.game.notify_all(f"{player.name} dropped {old.name}.")
+            self.game.emit(WeaponDropped(player, old.name))
 
         weapon.owner = player
         player.loadout[slot_name] = weapon
-        self.game.notify_all(f"{player.name} picked up {weapon.name} into {slot_name}.")
+        self.game.emit(WeaponPickedUp(player, weapon.name, slot_name))
         return True
 
     def get_use_result_or_none(self, player):
         weapon = player.loadout.get(player.current_weapon_slot)
         if not weapon:
-            self.game.notify_player(player, "No weapon equipped in current slot.")
+            self.game.emit(
+                ActionDenied(player, "use_weapon", "No weapon equipped in current slot.")
+            )
             return None, None
 
-        use_result = weapon.use()
+        use_result = weapon.use(self.now())
         if use_result is None:
-            self.game.notify_player(player, f"Cannot use {weapon.name} right now.")
+            self.game.emit(
+                ActionDenied(player, "use_weapon", "Cannot use {} right now.", (weapon.name,))
+            )
             return weapon, None
 
         return weapon, use_result
 
-    def use_equipped_live(self, player):
+    def use_equipped_live(self, player, client_time: Optional[float] = None):
         weapon, use_result = self.get_use_result_or_none(player)
         if use_result is None:
             return None
 
         if isinstance(use_result, ShotIntent):
             final_shot = player.active_effects.modify_shot(use_result)
-            return self.execute_shot_intent(player, final_shot)
+            return self.execute_shot_intent(player, final_shot, client_time)
 
-        self.game.notify_player(player, f"{weapon.name} use is not implemented yet.")
+        self.game.emit(Notice(player, "{} use is not implemented yet.", (weapon.name,)))
         return None
 
     def use_equipped_blank(self, player):
@@ -69,15 +134,24 @@ class WeaponController:
             return None
 
         if isinstance(use_result, ShotIntent):
-            self.game.notify_player(player, f"{player.name} fired a blank!")
+            self.game.emit(ShotFired(player, use_result.name, blank=True))
             return True
 
-        self.game.notify_player(player, f"{weapon.name} use is not implemented yet.")
+        self.game.emit(Notice(player, "{} use is not implemented yet.", (weapon.name,)))
         return None
 
-    def execute_shot_intent(self, player, shot_intent: ShotIntent):
+    def execute_shot_intent(
+        self,
+        player,
+        shot_intent: ShotIntent,
+        client_time: Optional[float] = None,
+    ):
         x, y = player.position
         dx, dy = player.direction
+        if self.rng is not None and shot_intent.spread_deg:
+            angle = math.radians(self.rng.uniform(-0.5, 0.5) * shot_intent.spread_deg)
+            cos, sin = math.cos(angle), math.sin(angle)
+            dx, dy = dx * cos - dy * sin, dx * sin + dy * cos
 
         speed = float(shot_intent.bullet_speed)
         vx = dx * speed
@@ -92,8 +166,94 @@ class WeaponController:
             damage=int(shot_intent.damage),
             ttl=2.0,
             travel_behavior=shot_intent.travel_behavior,
-            impact_behaviors=shot_intent.impact_behaviors
+            impact_behaviors=shot_intent.impact_behaviors,
+            rewind=self.game.lag.rewind_for(client_time),
         )
         self.game.bullets.append(bullet)
-        self.game.notify_player(player, f"Fired {shot_intent.name}")
+        if self._timer_time is not None:
+            self._advance_to_tick_end(bullet)
+        self.game.emit(ShotFired(player, shot_intent.name))
+        return True
+
+    def _advance_to_tick_end(self, bullet: Bullet) -> None:
+        # A sub-tick shot missed part of this tick's bullet update; catch it up.
+        lead = self.game.timers.time - self._timer_time
+        if lead <= 0 or not bullet.age(lead):
+            return
+        start = (bullet.x, bullet.y)
+        bullet.travel_behavior.update(bullet, self.game, lead)
+        self.game.world.collide_paths([bullet], [start])
+
+    # ============================================================
+    # Held triggers and reloads (timing wheel)
+    # ============================================================
+
+    def hold_trigger(self, player, held: bool):
+        if not held:
+            self._held_triggers.discard(player)
+            return True
+
+        weapon = player.loadout.get(player.current_weapon_slot)
+        if not isinstance(weapon, Gun):
+            self.game.emit(
+                ActionDenied(player, "use_weapon", "No weapon equipped in current slot.")
+            )
+            return None
+
+        self._held_triggers.add(player)
+        if player not in self._scheduled_shots:
+            self._schedule_shot(player, max(self.now(), weapon.next_fire_time))
+        return True
+
+    def _schedule_shot(self, player, time: float) -> None:
+        self._scheduled_shots.add(player)
+        self.game.timers.schedule(time, (self._fire_held_trigger, (player,)))
+
+    def _fire_held_trigger(self, due_time: float, player) -> None:
+        self._scheduled_shots.discard(player)
+        if player not in self._held_triggers:
+            return
+
+        self._timer_time = due_time
+        try:
+            fired = self.game.attempt_use_weapon(player)
+        finally:
+            self._timer_time = None
+
+        weapon = player.loadout.get(player.current_weapon_slot)
+        if (
+            not fired
+            or not isinstance(weapon, Gun)
+            or not weapon.spec.automatic
+            or weapon.spec.fire_rate <= 0
+        ):
+            # Semi-automatic, empty or denied: the trigger must be pressed again.
+            self._held_triggers.discard(player)
+            return
+
+        self._schedule_shot(player, weapon.next_fire_time)
+
+    def start_reload(self, player):
+        weapon = player.loadout.get(player.current_weapon_slot)
+        if not isinstance(weapon, Gun):
+            self.game.emit(ActionDenied(player, "reload", "No weapon to reload."))
+            return None
+
+        if weapon.reloading or weapon.ammo >= weapon.spec.mag_size:
+            self.game.emit(
+                ActionDenied(player, "reload", "Can't reload {} right now.", (weapon.name,))
+            )
+            return None
+
+        weapon.reloading = True
+        self.game.timers.schedule(
+            self.now() + weapon.spec.reload_time,
+            (self._finish_reload, (player, weapon)),
+        )
+        self.game.emit(ReloadStarted(player, weapon.name))
         return True
+
+    def _finish_reload(self, due_time: float, player, weapon: Gun) -> None:
+        weapon.reload()
+        weapon.reloading = False
+        self.game.emit(ReloadFinished(player, weapon.name))
@@ -1,17 +1,105 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from core.game import Game
 
 
 class WorldController:
+    """
+    Bullet tick, split into phases the system scheduler can order:
+    advance_bullets (partitioned by index range) moves every bullet,
+    collide_bullets clips paths to walls and resolves player hits, and
+    cull_bullets drops dead bullets once physics has run, detonating the
+    ones that died without hitting a player (walls, range, lifetime).
+    """
+
     def __init__(self, game: "Game"):
         self.game = game
+        # Per-bullet path start for this tick; None for bullets that expired.
+        self._starts: list[Optional[tuple[float, float]]] = []
+
+    def reset(self) -> None:
+        self._starts.clear()
 
     def update(self, dt: float) -> None:
-        for bullet in self.game.bullets:
-            bullet.update(self.game, dt)
+        self.advance_bullets(dt, 0, self.bullet_count())
+        self.collide_bullets(dt)
+        self.game.physics.update(dt)
+        self.cull_bullets(dt)
+
+    def advance_bullets(self, dt: float, start: int, stop: int) -> None:
+        bullets = self.game.bullets
+        starts = self._starts
+
+        # One batch call per travel behavior class rather than one virtual
+        # call per bullet.
+        groups: dict[type, list] = {}
+        for i in range(start, stop):
+            bullet = bullets[i]
+            if bullet.age(dt):
+                groups.setdefault(type(bullet.travel_behavior), []).append(bullet)
+                starts[i] = (bullet.x, bullet.y)
+            else:
+                starts[i] = None
+
+        for behavior_type, group in groups.items():
+            behavior_type.update_batch(group, self.game, dt)
+
+    def bullet_count(self) -> int:
+        """Size this tick's bullet range; called before any advance_bullets chunk."""
+        count = len(self.game.bullets)
+        if len(self._starts) != count:
+            self._starts[:] = [None] * count
+        return count
+
+    def collide_bullets(self, dt: float) -> None:
+        live = []
+        starts = []
+        for bullet, start in zip(self.game.bullets, self._starts):
+            if start is not None:
+                live.append(bullet)
+                starts.append(start)
+        self.collide_paths(live, starts)
+
+    def collide_paths(self, bullets, starts) -> None:
+        """
+        Resolve bullets that moved from starts to their current positions:
+        clip each path at the first wall, hit the nearest player on what is
+        left, and let bullets that reached a wall react to it.
+        """
+        wall_hits = self._clip_bullets_to_level(bullets, starts)
+        self.game.hits.detect(bullets, starts)
+
+        # Bullets that reached a wall without hitting a player.
+        for bullet, point, normal in wall_hits:
+            if bullet.alive:
+                bullet.travel_behavior.on_wall_hit(bullet, point, normal)
+
+    def cull_bullets(self, dt: float) -> None:
+        game = self.game
+        live = []
+        for bullet in game.bullets:
+            if bullet.alive:
+                live.append(bullet)
+            elif not bullet.spent:
+                bullet.detonate(game)
+        game.bullets = live
+
+    def _clip_bullets_to_level(self, bullets, starts):
+        """Cut every bullet's path this tick at the first wall, in one batched query."""
+        level = self.game.level
+        if level is None or not bullets:
+            return []
 
-        self.game.bullets = [b for b in self.game.bullets if b.alive]
+        ends = [(b.x, b.y) for b in bullets]
+        wall_hits = []
+        for bullet, (sx, sy), hit in zip(bullets, starts, level.raycast_batch(starts, ends)):
+            if hit is None or not bullet.alive:
+                continue
+            t, nx, ny = hit
+            bullet.x = sx + (bullet.x - sx) * t
+            bullet.y = sy + (bullet.y - sy) * t
+            wall_hits.append((bullet, (bullet.x, bullet.y), (nx, ny)))
+        return wall_hits
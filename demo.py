@@ -36,6 +36,7 @@ game.switch_state(game.playing_state)
 
 gun = Gun(AR_15)
 hunter.attempt_pickup_weapon(gun)
+game.events.flush()
 
 
 print("\n-----------------------------")
@@ -51,6 +52,7 @@ hunter.attempt_add_effect(
 )
 
 hunter.attempt_move((101, 100))
+game.events.flush()
 
 print("Expected: (102, 100)")
 print("Actual:  ", hunter.position)
@@ -71,6 +73,8 @@ hunter.attempt_add_effect(
 )
 
 hunter.attempt_use_weapon()
+game.update(1.0 / AR_15.fire_rate)
 hunter.attempt_use_weapon()
+game.events.flush()
 # hunter.attempt_use_weapon()
 # hunter.attempt_use_weapon()
\ No newline at end of file
@@ -14,6 +14,15 @@ class ActiveEffects:
         self._shot_impact_effects: dict[type, ShotImpactEffect] = {}
         self._movement_effects: dict[type, MovementEffect] = {}
 
+    def copy(self) -> "ActiveEffects":
+        # Effects themselves are never mutated, so only the tables are copied.
+        other = ActiveEffects()
+        other._shot_value_effects = dict(self._shot_value_effects)
+        other._shot_travel_effect = self._shot_travel_effect
+        other._shot_impact_effects = dict(self._shot_impact_effects)
+        other._movement_effects = dict(self._movement_effects)
+        return other
+
     def add_effect(self, effect: ActiveEffect) -> None:
         if isinstance(effect, ShotValueEffect):
             self._shot_value_effects[self._effect_key(effect)] = effect
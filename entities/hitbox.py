@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+class Hitbox:
+    """
+    Shape a player is hit with, centered on the player's position.
+
+    segment_t returns the fraction along a bullet path (sx, sy) + t * (dx, dy)
+    at which the path touches the shape centered at (cx, cy), or None.
+    """
+
+    @property
+    def radius(self) -> float:
+        """Radius of the circle used for wall collision."""
+        raise NotImplementedError
+
+    def segment_t(self, sx, sy, dx, dy, seg_len_sq, cx, cy) -> Optional[float]:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class CircleHitbox(Hitbox):
+    size: float = 0.5
+
+    @property
+    def radius(self) -> float:
+        return self.size
+
+    def segment_t(self, sx, sy, dx, dy, seg_len_sq, cx, cy):
+        if seg_len_sq == 0.0:
+            t = 0.0
+        else:
+            t = ((cx - sx) * dx + (cy - sy) * dy) / seg_len_sq
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+
+        px = sx + dx * t - cx
+        py = sy + dy * t - cy
+        if px * px + py * py <= self.size * self.size:
+            return t
+        return None
+
+
+@dataclass(frozen=True)
+class BoxHitbox(Hitbox):
+    half_width: float
+    half_height: float
+
+    @property
+    def radius(self) -> float:
+        return max(self.half_width, self.half_height)
+
+    def segment_t(self, sx, sy, dx, dy, seg_len_sq, cx, cy):
+        t_enter = 0.0
+        t_exit = 1.0
+        for start, delta, lo, hi in (
+            (sx, dx, cx - self.half_width, cx + self.half_width),
+            (sy, dy, cy - self.half_height, cy + self.half_height),
+        ):
+            if delta == 0.0:
+                if start < lo or start > hi:
+                    return None
+                continue
+            ta = (lo - start) / delta
+            tb = (hi - start) / delta
+            if ta > tb:
+                ta, tb = tb, ta
+            t_enter = max(t_enter, ta)
+            t_exit = min(t_exit, tb)
+            if t_enter > t_exit:
+                return None
+        return t_enter
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from entities.movement.movement_intent import Position
+
+
+@dataclass(frozen=True)
+class MoveCorrection:
+    """
+    Authoritative position for a client move the server disagreed with.
+
+    Only sent when the committed position diverges from the client's
+    prediction; matching moves are acknowledged by sequence number alone.
+    """
+
+    seq: int
+    position: Position
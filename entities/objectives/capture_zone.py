@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CaptureZone:
+    """
+    An axis-aligned trigger volume owned by a team ("Hunters" or "Props").
+    A prop carrying a flag into a "Props" zone captures it.
+    """
+
+    name: str
+    team: str
+    min_corner: tuple[float, float]
+    max_corner: tuple[float, float]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from entities.player import Player
+
+
+@dataclass(eq=False)
+class Flag:
+    """
+    A flag issued to a hunter. Props steal it and carry it to their base;
+    if its carrier dies it is dropped where they fell.
+    """
+
+    flag_id: int
+    owner: "Player"
+    carrier: Optional["Player"]
+    position: tuple[float, float] = (0.0, 0.0)
+    captured: bool = False
+
+    @property
+    def location(self) -> tuple[float, float]:
+        if self.carrier is not None:
+            return self.carrier.position
+        return self.position
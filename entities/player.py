@@ -1,11 +1,15 @@
 from typing import Optional, Dict, TYPE_CHECKING
 
 from core.status import Status
+from entities.hitbox import CircleHitbox, Hitbox
 from entities.weapons.weapon import Weapon
 from entities.effects.active_effects import ActiveEffects
 
 if TYPE_CHECKING:
     from core.game import Game
+    from entities.props.prop_instance import PropInstance
+
+DEFAULT_HITBOX = CircleHitbox(0.5)
 
 
 class Player:
@@ -17,6 +21,15 @@ class Player:
         self.position = (0, 0)
         self.direction = (1, 0)
         self.health = 100
+        self.hitbox: Hitbox = DEFAULT_HITBOX
+
+        # The placed prop this player is disguised as, if any.
+        self.possessed: Optional["PropInstance"] = None
+
+        # Knockback state, integrated by the PhysicsController.
+        self.velocity = (0.0, 0.0)
+        self.height = 0.0
+        self.vertical_velocity = 0.0
 
         self.loadout: Dict[str, Optional[Weapon]] = {
             "primary": None,
@@ -36,10 +49,14 @@ class Player:
             self.game.add_guardian(self)
 
 
+    @property
+    def hit_radius(self) -> float:
+        return self.hitbox.radius
+
     # ---- ATTEMPTS (INTENT ONLY) ----
 
-    def attempt_move(self, new_position):
-        return self.game.attempt_move(self, new_position)
+    def attempt_move(self, new_position, seq: Optional[int] = None, predicted_position=None):
+        return self.game.attempt_move(self, new_position, seq, predicted_position)
 
     def attempt_pickup_weapon(self, weapon: Weapon):
         return self.game.attempt_pickup_weapon(self, weapon)
@@ -47,8 +64,17 @@ class Player:
     def attempt_switch_slot(self, slot_name: str):
         return self.game.attempt_switch_slot(self, slot_name)
 
-    def attempt_use_weapon(self):
-        return self.game.attempt_use_weapon(self)
+    def attempt_use_weapon(self, client_time: Optional[float] = None, seq: Optional[int] = None):
+        return self.game.attempt_use_weapon(self, client_time, seq)
+
+    def attempt_hold_trigger(self, held: bool = True):
+        return self.game.attempt_hold_trigger(self, held)
+
+    def attempt_reload(self):
+        return self.game.attempt_reload(self)
+
+    def attempt_steal(self):
+        return self.game.attempt_steal(self)
 
     def attempt_possess(self, obj_name: str):
         return self.game.attempt_possess(self, obj_name)
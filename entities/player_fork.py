@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING, Optional
+
+from entities.player import Player
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.weapons.weapon import Weapon
+
+
+class PlayerFork(Player):
+    """
+    Copy-on-write view of a Player inside a forked Game.
+
+    Attributes read through to the source player until the fork assigns
+    them. Mutable members (status, loadout and its weapons, active effects)
+    are copied the first time the fork reads them, so players a speculative
+    simulation never touches are never copied.
+    """
+
+    def __init__(self, source: Player, game: "Game"):
+        # Player.__init__ is skipped on purpose: no roster entry, no join event.
+        self._source = source
+        self.game = game
+
+    @property
+    def source(self) -> Player:
+        return self._source
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes the fork hasn't set yet.
+        if name.startswith("__") or name == "_source":
+            raise AttributeError(name)
+
+        value = getattr(self._source, name)
+        if name == "status":
+            value = copy.copy(value)
+        elif name == "active_effects":
+            value = value.copy()
+        elif name == "loadout":
+            value = {slot: self._copy_weapon(weapon) for slot, weapon in value.items()}
+        else:
+            return value
+
+        self.__dict__[name] = value
+        return value
+
+    def _copy_weapon(self, weapon: Optional["Weapon"]) -> Optional["Weapon"]:
+        if weapon is None:
+            return None
+        weapon = copy.copy(weapon)
+        weapon.owner = self
+        return weapon
+
+    def weapon_for(self, weapon: "Weapon") -> "Weapon":
+        """This fork's copy of one of the source player's weapons."""
+        for slot, source_weapon in self._source.loadout.items():
+            if source_weapon is weapon:
+                return self.loadout[slot]
+        return self._copy_weapon(weapon)
@@ -0,0 +1,81 @@
+# prop_catalog.py
+#
+# Data-driven table of possessable props.
+#
+# Design notes:
+# - Loaded once at startup; possession looks specs up by name or id and
+#   never re-reads the file.
+# - Hitbox shapes are built here so the hit path only sees Hitbox objects.
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from entities.hitbox import BoxHitbox, CircleHitbox, Hitbox
+from entities.props.prop_spec import PropSpec
+
+DEFAULT_CATALOG_PATH = Path(__file__).with_name("prop_catalog.json")
+
+
+class PropCatalog:
+    def __init__(self, path: os.PathLike | str = DEFAULT_CATALOG_PATH):
+        self.path = Path(path)
+        with open(self.path, encoding="utf-8") as f:
+            entries = json.load(f)["props"]
+
+        self._specs: list[PropSpec] = []
+        self._ids: dict[str, int] = {}
+        for entry in entries:
+            name = entry["name"]
+            if name in self._ids:
+                raise ValueError(f"Duplicate prop name in catalog: {name!r}")
+            spec_id = len(self._specs)
+            self._specs.append(_spec_from_entry(entry, spec_id))
+            self._ids[name] = spec_id
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def get(self, spec_id: int) -> PropSpec:
+        return self._specs[spec_id]
+
+    def id_of(self, name: str) -> int:
+        return self._ids[name]
+
+    def by_name(self, name: str) -> PropSpec:
+        return self._specs[self._ids[name]]
+
+
+def _hitbox_from_entry(entry: dict) -> Hitbox:
+    shape = entry["shape"]
+    if shape == "circle":
+        return CircleHitbox(float(entry["radius"]))
+    if shape == "box":
+        return BoxHitbox(float(entry["half_width"]), float(entry["half_height"]))
+    raise ValueError(f"Unknown hitbox shape: {shape!r}")
+
+
+def _spec_from_entry(entry: dict, spec_id: int) -> PropSpec:
+    return PropSpec(
+        name=entry["name"],
+        hitbox=_hitbox_from_entry(entry["hitbox"]),
+        mass=float(entry["mass"]),
+        speed_modifier=float(entry.get("speed_modifier", 1.0)),
+        spec_id=spec_id,
+    )
+
+
+_default_catalog: Optional[PropCatalog] = None
+
+
+def default_catalog() -> PropCatalog:
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = PropCatalog()
+    return _default_catalog
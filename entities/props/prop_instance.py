@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from entities.props.prop_spec import PropSpec
+
+
+@dataclass(frozen=True)
+class PropInstance:
+    """A possessable object placed in the level."""
+
+    instance_id: int
+    spec: PropSpec
+    position: tuple[float, float]
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from entities.hitbox import Hitbox
+
+
+@dataclass(frozen=True)
+class PropSpec:
+    name: str
+    hitbox: Hitbox
+    mass: float
+    speed_modifier: float = 1.0
+
+    # Index into the PropCatalog this spec was loaded from.
+    spec_id: Optional[int] = None
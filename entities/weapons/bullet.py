@@ -24,20 +24,40 @@ class Bullet:
 
     ttl: float = 2.0
     alive: bool = True
+    bounces: int = 0
+    # Lag-compensation offset: targets are tested where they were this many
+    # seconds ago, as seen by the shooter's client.
+    rewind: float = 0.0
+    # Whether its impact behaviors have run, on a player or as a detonation.
+    spent: bool = False
 
     def update(self, world: Any, dt: float) -> None:
-        if not self.alive:
+        if not self.age(dt):
             return
 
+        self.travel_behavior.update(self, world, dt)
+
+    def age(self, dt: float) -> bool:
+        """Burn dt of lifetime. Returns whether the bullet should still travel."""
+        if not self.alive:
+            return False
+
         self.ttl -= dt
         if self.ttl <= 0:
             self.alive = False
-            return
+            return False
 
-        self.travel_behavior.update(self, world, dt)
+        return True
 
     def impact(self, target: "Player") -> None:
         for impact_behavior in self.impact_behaviors:
             impact_behavior.apply(self, target)
 
-        self.alive = False
\ No newline at end of file
+        self.alive = False
+        self.spent = True
+
+    def detonate(self, game: Any) -> None:
+        """The bullet died without hitting a player; let its impacts react."""
+        for impact_behavior in self.impact_behaviors:
+            impact_behavior.detonate(self, game)
+        self.spent = True
@@ -10,6 +10,11 @@
 # Ownership:
 # - self.owner is assigned/cleared by the Game core on pickup/drop.
 # - Gun never assigns ownership itself.
+#
+# Specs:
+# - Catalog specs are referenced by spec_id and resolved through the GunCatalog
+#   on every access, so a hot reload rebalances guns that already exist.
+# - use() returns the spec's shared, prebuilt ShotIntent prototype.
 
 from __future__ import annotations
 import inspect
@@ -17,6 +22,7 @@ import inspect
 from typing import Optional
 
 from .weapon import Weapon
+from .gun_catalog import GunCatalog, make_prototype
 from .gun_spec import GunSpec
 from .shot_intent import ShotIntent
 
@@ -27,14 +33,34 @@ class Gun(Weapon):
 
     Runtime state:
     - ammo: mutable, per-instance (two Glocks can have different ammo)
+    - next_fire_time / reloading: timing state in match time. The Game's
+      WeaponController drives reloads and held triggers on its timing wheel.
 
     Defaults:
     - spec: immutable recipe shared across instances
     """
 
-    def __init__(self, spec: GunSpec, starting_ammo: Optional[int] = None):
+    def __init__(
+        self,
+        spec: GunSpec,
+        starting_ammo: Optional[int] = None,
+        catalog: Optional[GunCatalog] = None,
+    ):
         super().__init__(name=spec.name)
-        self.spec = spec
+        self.spec_id = spec.spec_id
+        if self.spec_id is not None:
+            # Ids are only meaningful in the catalog that issued them.
+            if catalog is None:
+                catalog = spec.catalog
+            elif spec.catalog is not None and spec.catalog is not catalog:
+                raise ValueError(f"{spec.name} belongs to a different gun catalog")
+            if catalog is None:
+                raise ValueError(f"{spec.name} has a catalog id but no catalog")
+        self._catalog = catalog
+
+        # Ad-hoc (non-catalog) specs keep their own spec and prototype.
+        self._spec = spec
+        self._prototype = make_prototype(spec) if self.spec_id is None else None
 
         # If starting_ammo isn't provided, start full.
         # Clamp to [0, mag_size] to avoid nonsense values.
@@ -43,19 +69,32 @@ class Gun(Weapon):
         else:
             self.ammo = max(0, min(starting_ammo, spec.mag_size))
 
+        self.next_fire_time = 0.0
+        self.reloading = False
+
+    @property
+    def spec(self) -> GunSpec:
+        if self.spec_id is None:
+            return self._spec
+        return self._catalog.get(self.spec_id)
+
     def has_ammo(self) -> bool:
         return self.ammo > 0
 
     def reload(self) -> None:
         self.ammo = self.spec.mag_size
 
-    def use(self) -> Optional[ShotIntent]:
+    def use(self, now: Optional[float] = None) -> Optional[ShotIntent]:
         """
         Attempt to fire.
 
+        Args:
+            now: match time of the shot. When given, the spec's fire rate is
+                enforced; when omitted only owner/ammo/reload are checked.
+
         Returns:
-            ShotIntent if the shot is allowed by weapon mechanics (owner + ammo)
-            None otherwise.
+            ShotIntent if the shot is allowed by weapon mechanics
+            (owner + ammo + not reloading + fire rate) None otherwise.
 
         Note:
             Authorization (stunned, match phase, blanks vs real) is NOT handled here.
@@ -64,19 +103,21 @@ class Gun(Weapon):
         if self.owner is None:
             return None
 
-        if not self.has_ammo():
+        if self.reloading or not self.has_ammo():
             return None
 
+        spec = self.spec
+        if now is not None:
+            if now < self.next_fire_time:
+                return None
+            if spec.fire_rate > 0:
+                self.next_fire_time = now + 1.0 / spec.fire_rate
+
         # Consume ammo as part of weapon mechanics.
         self.ammo -= 1
 
-        # Create a per-shot receipt (copied from spec so it can be modified per-shot
-        # without mutating the shared GunSpec).
-        return ShotIntent(
-            name=self.spec.name,
-            damage=self.spec.damage,
-            bullet_speed=self.spec.bullet_speed,
-            spread_deg=self.spec.spread_deg,
-            travel_behavior=self.spec.travel_behavior,
-            impact_behaviors=self.spec.impact_behaviors
-        )
+        # The per-shot receipt is the spec's shared prototype. ShotIntent is
+        # frozen, so effects build modified copies instead of mutating it.
+        if self.spec_id is None:
+            return self._prototype
+        return self._catalog.prototype(self.spec_id)
@@ -0,0 +1,149 @@
+# gun_catalog.py
+#
+# Data-driven weapon table.
+#
+# Design notes:
+# - Specs are loaded from a JSON file into a list indexed by small integer ids.
+#   Snapshots and network messages carry the id, never the GunSpec object.
+# - Ids are interned by name and stay stable across reloads, so guns that
+#   already exist pick up rebalanced values on their next shot.
+# - Each spec gets one prebuilt ShotIntent prototype. ShotIntent is frozen and
+#   effects modify it with dataclasses.replace, so the prototype is shared.
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+from entities.weapons.gun_spec import GunSpec
+from entities.weapons.impact.damage_impact import DamageImpact
+from entities.weapons.impact.explosion_impact import ExplosionImpact
+from entities.weapons.impact.reveal_impact import RevealImpact
+from entities.weapons.impact.yeet_impact import YeetImpact
+from entities.weapons.shot_intent import ShotIntent
+from entities.weapons.travel.ballistic_travel import BallisticTravel
+from entities.weapons.travel.homing_travel import HomingTravel
+from entities.weapons.travel.straight_travel import StraightTravel
+
+DEFAULT_CATALOG_PATH = Path(__file__).with_name("gun_catalog.json")
+
+TRAVEL_BEHAVIORS = {
+    "straight": StraightTravel,
+    "ballistic": BallisticTravel,
+    "homing": HomingTravel,
+}
+
+IMPACT_BEHAVIORS = {
+    "damage": DamageImpact,
+    "yeet": YeetImpact,
+    "explosion": ExplosionImpact,
+    "reveal": RevealImpact,
+}
+
+
+class GunCatalog:
+    def __init__(self, path: os.PathLike | str = DEFAULT_CATALOG_PATH):
+        self.path = Path(path)
+        self._specs: list[GunSpec] = []
+        self._prototypes: list[ShotIntent] = []
+        self._ids: dict[str, int] = {}
+        self._mtime_ns: Optional[int] = None
+        self.reload()
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def get(self, spec_id: int) -> GunSpec:
+        return self._specs[spec_id]
+
+    def prototype(self, spec_id: int) -> ShotIntent:
+        return self._prototypes[spec_id]
+
+    def id_of(self, name: str) -> int:
+        return self._ids[name]
+
+    def by_name(self, name: str) -> GunSpec:
+        return self._specs[self._ids[name]]
+
+    def reload(self) -> None:
+        """(Re)load every spec from disk, keeping existing ids stable."""
+        mtime_ns = self.path.stat().st_mtime_ns
+        with open(self.path, encoding="utf-8") as f:
+            entries = json.load(f)["guns"]
+
+        # Build everything first so a bad file leaves the old table intact.
+        loaded = [_spec_from_entry(entry) for entry in entries]
+
+        for spec in loaded:
+            spec_id = self._ids.get(spec.name)
+            if spec_id is None:
+                spec_id = self._ids[spec.name] = len(self._specs)
+                self._specs.append(spec)
+                self._prototypes.append(None)
+
+            spec = replace(spec, spec_id=spec_id, catalog=self)
+            self._specs[spec_id] = spec
+            self._prototypes[spec_id] = make_prototype(spec)
+
+        self._mtime_ns = mtime_ns
+
+    def reload_if_changed(self) -> bool:
+        """Hot-reload hook for a running server. Returns whether it reloaded."""
+        if self.path.stat().st_mtime_ns == self._mtime_ns:
+            return False
+        self.reload()
+        return True
+
+
+def make_prototype(spec: GunSpec) -> ShotIntent:
+    return ShotIntent(
+        name=spec.name,
+        damage=spec.damage,
+        bullet_speed=spec.bullet_speed,
+        spread_deg=spec.spread_deg,
+        travel_behavior=spec.travel_behavior,
+        impact_behaviors=spec.impact_behaviors,
+    )
+
+
+def _spec_from_entry(entry: dict) -> GunSpec:
+    return GunSpec(
+        name=entry["name"],
+        damage=entry["damage"],
+        bullet_speed=float(entry["bullet_speed"]),
+        spread_deg=float(entry["spread_deg"]),
+        mag_size=int(entry["mag_size"]),
+        fire_rate=float(entry.get("fire_rate", 0.0)),
+        reload_time=float(entry.get("reload_time", 0.0)),
+        automatic=bool(entry.get("automatic", False)),
+        travel_behavior=_build(TRAVEL_BEHAVIORS, entry.get("travel", "straight")),
+        impact_behaviors=tuple(
+            _build(IMPACT_BEHAVIORS, impact)
+            for impact in entry.get("impacts", ["damage"])
+        ),
+    )
+
+
+def _build(registry: dict, entry):
+    """Build a behavior from "kind" or {"type": "kind", **kwargs}."""
+    if isinstance(entry, str):
+        return registry[entry]()
+
+    kwargs = dict(entry)
+    kind = kwargs.pop("type")
+    if kind == "explosion" and "knockback" in kwargs:
+        kwargs["knockback"] = YeetImpact(**kwargs["knockback"])
+    return registry[kind](**kwargs)
+
+
+_default_catalog: Optional[GunCatalog] = None
+
+
+def default_catalog() -> GunCatalog:
+    global _default_catalog
+    if _default_catalog is None:
+        _default_catalog = GunCatalog()
+    return _default_catalog
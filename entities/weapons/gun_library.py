@@ -1,18 +1,9 @@
-from entities.weapons.gun_spec import GunSpec
+from entities.weapons.gun_catalog import default_catalog
 
-# Canonical weapon definitions used across the game
-GLOCK_17 = GunSpec(
-    name="Glock 17",
-    mag_size=17,
-    damage=22,
-    bullet_speed=30.0,
-    spread_deg=2.0,
-)
+# Canonical weapon definitions used across the game.
+# The values live in gun_catalog.json; these names are kept for convenience.
+GUNS = default_catalog()
 
-AR_15 = GunSpec(
-    name="AR-15",
-    mag_size=30,
-    damage=25,
-    bullet_speed=45.0,
-    spread_deg=1.2,
-)
+GLOCK_17 = GUNS.by_name("Glock 17")
+
+AR_15 = GUNS.by_name("AR-15")
@@ -1,10 +1,14 @@
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
 
 from entities.weapons.travel.straight_travel import StraightTravel
 from entities.weapons.travel.travel_behavior import TravelBehavior
 from entities.weapons.impact.damage_impact import DamageImpact
 from entities.weapons.impact.impact_behavior import ImpactBehavior
 
+if TYPE_CHECKING:
+    from entities.weapons.gun_catalog import GunCatalog
+
 
 @dataclass(frozen=True)
 class GunSpec:
@@ -20,4 +24,15 @@ class GunSpec:
 
     impact_behaviors: tuple[ImpactBehavior, ...] = field(
         default_factory=lambda: (DamageImpact(),)
-    )
\ No newline at end of file
+    )
+
+    # Rounds per second (0 = no limit) and seconds to reload.
+    fire_rate: float = 0.0
+    reload_time: float = 0.0
+    # Whether holding the trigger keeps firing.
+    automatic: bool = False
+
+    # Interned catalog id and the catalog it belongs to (see GunCatalog).
+    # Both None for ad-hoc specs.
+    spec_id: Optional[int] = None
+    catalog: Optional["GunCatalog"] = field(default=None, compare=False, repr=False)
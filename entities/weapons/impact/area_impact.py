@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from entities.weapons.impact.impact_behavior import ImpactBehavior
+
+if TYPE_CHECKING:
+    from core.game import Game
+    from entities.weapons.bullet import Bullet
+    from entities.player import Player
+
+
+class AreaImpact(ImpactBehavior):
+    """
+    An impact that affects every player within radius of the hit point.
+
+    apply() only queues the impact with the game's AreaController; the
+    radius query and resolve() happen in the end-of-tick batch. A bullet
+    that dies on a wall, at the end of its range or lifetime goes off
+    where it stopped (detonate()).
+
+    falloff is the exponent on (1 - distance / radius): 0 is a flat blast,
+    1 is linear and larger values concentrate the effect at the center.
+    """
+
+    def __init__(self, radius: float, falloff: float = 1.0, hits_owner: bool = False):
+        self.radius = radius
+        self.falloff = falloff
+        self.hits_owner = hits_owner
+
+    def apply(self, bullet: "Bullet", target: "Player") -> None:
+        target.game.areas.queue(self, bullet, (bullet.x, bullet.y))
+
+    def detonate(self, bullet: "Bullet", game: "Game") -> None:
+        game.areas.queue(self, bullet, (bullet.x, bullet.y))
+
+    def affects(self, bullet: "Bullet", player: "Player") -> bool:
+        return self.hits_owner or player.name != bullet.owner_id
+
+    def falloff_scale(self, distance: float) -> float:
+        if self.radius <= 0:
+            return 1.0
+        return max(0.0, 1.0 - distance / self.radius) ** self.falloff
+
+    def resolve(
+        self,
+        game: "Game",
+        bullet: "Bullet",
+        origin: tuple[float, float],
+        targets: list["Player"],
+        scales: list[float],
+    ) -> None:
+        raise NotImplementedError
@@ -2,8 +2,10 @@ from entities.weapons.impact.impact_behavior import ImpactBehavior
 
 class DamageImpact(ImpactBehavior):
     """
-    Applies damage to the target player when a bullet hits.
+    Records damage against the target player when a bullet hits.
+
+    The hit is applied by the game's DamageController at the end of the tick.
     """
 
     def apply(self, bullet, target):
-        target.take_damage(bullet.damage)
\ No newline at end of file
+        target.game.damage.record(target, bullet.damage, bullet.owner_id)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from entities.weapons.impact.area_impact import AreaImpact
+
+if TYPE_CHECKING:
+    from entities.weapons.impact.yeet_impact import YeetImpact
+
+
+class ExplosionImpact(AreaImpact):
+    """
+    Deals the bullet's damage, scaled by falloff, to everyone in the blast.
+
+    An optional YeetImpact is applied to all blast targets as one batched
+    impulse, pushing them away from the center.
+    """
+
+    def __init__(
+        self,
+        radius: float,
+        falloff: float = 1.0,
+        hits_owner: bool = False,
+        knockback: Optional["YeetImpact"] = None,
+    ):
+        super().__init__(radius, falloff, hits_owner)
+        self.knockback = knockback
+
+    def resolve(self, game, bullet, origin, targets, scales):
+        for target, scale in zip(targets, scales):
+            if scale > 0:
+                game.damage.record(target, bullet.damage * scale, bullet.owner_id)
+
+        if self.knockback is not None:
+            self.knockback.apply_batch(bullet, origin, targets, scales)
@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from entities.bullet import Bullet
+    from core.game import Game
+    from entities.weapons.bullet import Bullet
     from entities.player import Player
 
 
@@ -13,4 +14,7 @@ class ImpactBehavior:
     """
 
     def apply(self, bullet: Bullet, target: Player) -> None:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def detonate(self, bullet: Bullet, game: Game) -> None:
+        """Called when the bullet dies without hitting a player. Default: nothing."""
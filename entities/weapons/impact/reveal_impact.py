@@ -0,0 +1,21 @@
+from core.events import PropsRevealed
+from entities.weapons.impact.area_impact import AreaImpact
+
+
+class RevealImpact(AreaImpact):
+    """
+    Prop-reveal pulse: tells the shooter which props are inside the radius.
+    """
+
+    def __init__(self, radius: float):
+        super().__init__(radius, falloff=0.0)
+
+    def affects(self, bullet, player) -> bool:
+        return player.role == "prop" and super().affects(bullet, player)
+
+    def resolve(self, game, bullet, origin, targets, scales):
+        shooter = game.find_player(bullet.owner_id)
+        if shooter is None:
+            return
+
+        game.emit(PropsRevealed(shooter, tuple(targets)))
@@ -1,21 +1,63 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 from entities.weapons.impact.impact_behavior import ImpactBehavior
 
 if TYPE_CHECKING:
-    from entities.bullet import Bullet
+    from entities.weapons.bullet import Bullet
     from entities.player import Player
 
 
 class YeetImpact(ImpactBehavior):
-    def __init__(self, yeet_multiplier: float = 1.0):
+    """
+    Knocks the target back along the bullet's path and up into the air.
+
+    Strength is bullet damage * yeet_multiplier; lift is the fraction of that
+    strength applied as vertical velocity. Strong enough hits ragdoll the
+    target (see PhysicsController).
+    """
+
+    def __init__(self, yeet_multiplier: float = 1.0, lift: float = 0.5):
         self.yeet_multiplier = yeet_multiplier
+        self.lift = lift
 
     def apply(self, bullet: "Bullet", target: "Player") -> None:
         yeet_strength = bullet.damage * self.yeet_multiplier
+        dx, dy = _unit(bullet.vx, bullet.vy)
+
+        target.game.physics.apply_impulse(
+            target,
+            (dx * yeet_strength, dy * yeet_strength),
+            vertical=yeet_strength * self.lift,
+        )
+
+    def apply_batch(
+        self,
+        bullet: "Bullet",
+        origin: tuple[float, float],
+        targets: list["Player"],
+        scales: list[float],
+    ) -> None:
+        """Knock every target of an area impact away from origin in one call."""
+        base_strength = bullet.damage * self.yeet_multiplier
+        ox, oy = origin
+        for target, scale in zip(targets, scales):
+            if scale <= 0:
+                continue
+            strength = base_strength * scale
+            x, y = target.position
+            dx, dy = _unit(x - ox, y - oy)
+            target.game.physics.apply_impulse(
+                target,
+                (dx * strength, dy * strength),
+                vertical=strength * self.lift,
+            )
+
 
-        # Temporary proof that the impact executed.
-        # Replace this later with vertical velocity / knockback.
-        target.update(f"BONK! Yeet strength: {yeet_strength}")
\ No newline at end of file
+def _unit(x: float, y: float) -> tuple[float, float]:
+    length = math.hypot(x, y)
+    if length == 0.0:
+        return (0.0, 0.0)
+    return (x / length, y / length)
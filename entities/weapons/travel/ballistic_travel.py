@@ -0,0 +1,24 @@
+from entities.weapons.travel.travel_behavior import TravelBehavior
+
+
+class BallisticTravel(TravelBehavior):
+    """
+    Straight travel plus a constant acceleration (bullet drop, wind, ...).
+
+    Integrated with semi-implicit Euler: velocity first, then position.
+    """
+
+    def __init__(self, gravity: tuple[float, float] = (0.0, -9.81)):
+        self.gravity = gravity
+
+    def update(self, bullet, world, dt: float) -> None:
+        BallisticTravel.update_batch((bullet,), world, dt)
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt: float) -> None:
+        for bullet in bullets:
+            gx, gy = bullet.travel_behavior.gravity
+            bullet.vx += gx * dt
+            bullet.vy += gy * dt
+            bullet.x += bullet.vx * dt
+            bullet.y += bullet.vy * dt
@@ -0,0 +1,67 @@
+import math
+
+from entities.weapons.travel.travel_behavior import TravelBehavior
+
+
+class HomingTravel(TravelBehavior):
+    """
+    Steers toward the nearest enemy of the bullet's owner.
+
+    Hunters' bullets home on props and everyone else's home on hunters.
+    The heading turns by at most turn_rate radians per second and the
+    bullet keeps its speed. Targets further than max_range are ignored.
+    """
+
+    def __init__(self, turn_rate: float = math.pi, max_range: float = 50.0):
+        self.turn_rate = turn_rate
+        self.max_range = max_range
+
+    def update(self, bullet, world, dt: float) -> None:
+        HomingTravel.update_batch((bullet,), world, dt)
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt: float) -> None:
+        # Snapshot candidate positions once for the whole batch instead of
+        # walking the rosters for every bullet.
+        hunter_names = {p.name for p in world.hunters}
+        hunter_positions = [p.position for p in world.hunters]
+        prop_positions = [p.position for p in world.props]
+
+        for bullet in bullets:
+            behavior = bullet.travel_behavior
+            if bullet.owner_id in hunter_names:
+                candidates = prop_positions
+            else:
+                candidates = hunter_positions
+
+            target = _nearest(candidates, bullet.x, bullet.y, behavior.max_range)
+            if target is not None:
+                _steer(bullet, target, behavior.turn_rate * dt)
+
+            bullet.x += bullet.vx * dt
+            bullet.y += bullet.vy * dt
+
+
+def _nearest(candidates, x: float, y: float, max_range: float):
+    best = None
+    best_d2 = max_range * max_range
+    for cx, cy in candidates:
+        d2 = (cx - x) ** 2 + (cy - y) ** 2
+        if d2 <= best_d2:
+            best = (cx, cy)
+            best_d2 = d2
+    return best
+
+
+def _steer(bullet, target, max_turn: float) -> None:
+    speed = math.hypot(bullet.vx, bullet.vy)
+    if speed == 0.0:
+        return
+
+    heading = math.atan2(bullet.vy, bullet.vx)
+    desired = math.atan2(target[1] - bullet.y, target[0] - bullet.x)
+    delta = (desired - heading + math.pi) % (2 * math.pi) - math.pi
+    heading += max(-max_turn, min(max_turn, delta))
+
+    bullet.vx = math.cos(heading) * speed
+    bullet.vy = math.sin(heading) * speed
@@ -0,0 +1,73 @@
+from entities.weapons.travel.travel_behavior import TravelBehavior
+
+
+class RicochetTravel(TravelBehavior):
+    """
+    Straight travel that bounces off level walls and, optionally, the edges
+    of an axis-aligned arena.
+
+    bounds is (min_x, min_y, max_x, max_y) or None. Each bounce scales the
+    speed by restitution; the bullet dies on the bounce after max_bounces.
+    """
+
+    def __init__(
+        self,
+        bounds: tuple[float, float, float, float] | None = None,
+        max_bounces: int = 3,
+        restitution: float = 1.0,
+    ):
+        self.bounds = bounds
+        self.max_bounces = max_bounces
+        self.restitution = restitution
+
+    def update(self, bullet, world, dt: float) -> None:
+        RicochetTravel.update_batch((bullet,), world, dt)
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt: float) -> None:
+        for bullet in bullets:
+            behavior = bullet.travel_behavior
+            x = bullet.x + bullet.vx * dt
+            y = bullet.y + bullet.vy * dt
+
+            if behavior.bounds is None:
+                bullet.x = x
+                bullet.y = y
+                continue
+
+            min_x, min_y, max_x, max_y = behavior.bounds
+            bounced = False
+
+            if x < min_x or x > max_x:
+                x = 2 * min_x - x if x < min_x else 2 * max_x - x
+                bullet.vx = -bullet.vx * behavior.restitution
+                bullet.vy *= behavior.restitution
+                bounced = True
+
+            if y < min_y or y > max_y:
+                y = 2 * min_y - y if y < min_y else 2 * max_y - y
+                bullet.vy = -bullet.vy * behavior.restitution
+                if not bounced:
+                    bullet.vx *= behavior.restitution
+                bounced = True
+
+            bullet.x = x
+            bullet.y = y
+
+            if bounced:
+                bullet.bounces += 1
+                if bullet.bounces > behavior.max_bounces:
+                    bullet.alive = False
+
+    def on_wall_hit(self, bullet, point, normal) -> None:
+        nx, ny = normal
+        into = bullet.vx * nx + bullet.vy * ny
+        bullet.vx = (bullet.vx - 2 * into * nx) * self.restitution
+        bullet.vy = (bullet.vy - 2 * into * ny) * self.restitution
+        # Nudge off the surface so the next path doesn't start inside it.
+        bullet.x = point[0] + nx * 1e-3
+        bullet.y = point[1] + ny * 1e-3
+
+        bullet.bounces += 1
+        if bullet.bounces > self.max_bounces:
+            bullet.alive = False
@@ -4,4 +4,10 @@ from entities.weapons.travel.travel_behavior import TravelBehavior
 class StraightTravel(TravelBehavior):
     def update(self, bullet, world, dt: float) -> None:
         bullet.x += bullet.vx * dt
-        bullet.y += bullet.vy * dt
\ No newline at end of file
+        bullet.y += bullet.vy * dt
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt: float) -> None:
+        for bullet in bullets:
+            bullet.x += bullet.vx * dt
+            bullet.y += bullet.vy * dt
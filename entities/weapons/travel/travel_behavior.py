@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from entities.bullet import Bullet
+    from entities.weapons.bullet import Bullet
 
 
 class TravelBehavior:
@@ -12,4 +12,21 @@ class TravelBehavior:
     """
 
     def update(self, bullet, world, dt: float) -> None:
-        raise NotImplementedError("TravelBehavior subclasses must implement update()")
\ No newline at end of file
+        raise NotImplementedError("TravelBehavior subclasses must implement update()")
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt: float) -> None:
+        """
+        Advance every live bullet whose travel behavior is of this class.
+
+        The world tick groups bullets by behavior type and makes one call per
+        group. Subclasses override this with a kernel over the whole group;
+        the default just falls back to the per-bullet update().
+        """
+        for bullet in bullets:
+            bullet.travel_behavior.update(bullet, world, dt)
+
+    def on_wall_hit(self, bullet, point, normal) -> None:
+        """Called when level geometry stops the bullet at point. Default: it dies."""
+        bullet.x, bullet.y = point
+        bullet.alive = False
@@ -27,9 +27,9 @@ class Weapon:
         # Weapons do not assign or change ownership themselves.
         self.owner: Optional["Player"] = None
 
-    def use(self):
+    def use(self, now=None):
         """
-        Attempt to use the weapon.
+        Attempt to use the weapon at match time `now` (None if untimed).
 
         Returns:
             - A ShotIntent-like object if the weapon can be used
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence
+
+Box = tuple[float, float, float, float]
+
+# hit_fn(primitive_index, x0, y0, dx, dy) -> (t, nx, ny) or None
+HitFn = Callable[[int, float, float, float, float], Optional[tuple[float, float, float]]]
+
+
+class BVH:
+    """
+    Static bounding volume hierarchy over axis-aligned boxes.
+
+    Built once (top-down, median split on the longest centroid axis) and
+    stored as flat per-node lists. Queries walk an explicit stack and
+    prune whole subtrees by box, so cost grows with log(primitives) plus
+    whatever the query actually touches.
+    """
+
+    LEAF_SIZE = 4
+
+    def __init__(self, boxes: Sequence[Box]):
+        self.boxes = list(boxes)
+        self.order = list(range(len(self.boxes)))
+
+        self._min_x: list[float] = []
+        self._min_y: list[float] = []
+        self._max_x: list[float] = []
+        self._max_y: list[float] = []
+        # Inner nodes: left child index, right child index, count == 0.
+        # Leaves: first index into order, primitive count.
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._start: list[int] = []
+        self._count: list[int] = []
+
+        if self.boxes:
+            self._build(0, len(self.boxes))
+
+    def __len__(self) -> int:
+        return len(self._count)
+
+    def node_bounds(self, node: int) -> Box:
+        return (self._min_x[node], self._min_y[node], self._max_x[node], self._max_y[node])
+
+    def _build(self, start: int, end: int) -> int:
+        boxes = self.boxes
+        ids = self.order[start:end]
+        node = len(self._count)
+        self._min_x.append(min(boxes[i][0] for i in ids))
+        self._min_y.append(min(boxes[i][1] for i in ids))
+        self._max_x.append(max(boxes[i][2] for i in ids))
+        self._max_y.append(max(boxes[i][3] for i in ids))
+        self._left.append(-1)
+        self._right.append(-1)
+        self._start.append(start)
+        self._count.append(end - start)
+
+        if end - start <= self.LEAF_SIZE:
+            return node
+
+        cx = [(boxes[i][0] + boxes[i][2]) for i in ids]
+        cy = [(boxes[i][1] + boxes[i][3]) for i in ids]
+        axis = 0 if max(cx) - min(cx) >= max(cy) - min(cy) else 1
+        ids.sort(key=lambda i: boxes[i][axis] + boxes[i][axis + 2])
+        self.order[start:end] = ids
+
+        mid = (start + end) // 2
+        self._count[node] = 0
+        self._left[node] = self._build(start, mid)
+        self._right[node] = self._build(mid, end)
+        return node
+
+    def query_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[int]:
+        """Primitive indices whose boxes overlap the given box."""
+        if not self._count:
+            return []
+
+        found = []
+        boxes = self.boxes
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if (
+                self._min_x[node] > max_x or self._max_x[node] < min_x
+                or self._min_y[node] > max_y or self._max_y[node] < min_y
+            ):
+                continue
+            count = self._count[node]
+            if count == 0:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+            for k in range(self._start[node], self._start[node] + count):
+                i = self.order[k]
+                b = boxes[i]
+                if b[0] <= max_x and b[2] >= min_x and b[1] <= max_y and b[3] >= min_y:
+                    found.append(i)
+        return found
+
+    def raycast(
+        self,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        hit_fn: HitFn,
+        pad: float = 0.0,
+    ) -> Optional[tuple[float, float, float, int]]:
+        """
+        Nearest hit along the segment (x0, y0) -> (x1, y1).
+
+        Node boxes are grown by pad (use the radius for swept circles).
+        Returns (t, nx, ny, primitive) with t in [0, 1], or None.
+        """
+        if not self._count:
+            return None
+
+        dx = x1 - x0
+        dy = y1 - y0
+        inv_dx = 1.0 / dx if dx != 0.0 else None
+        inv_dy = 1.0 / dy if dy != 0.0 else None
+
+        best = None
+        best_t = 1.0
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            enter = _slab_enter(
+                x0, y0, inv_dx, inv_dy,
+                self._min_x[node] - pad, self._min_y[node] - pad,
+                self._max_x[node] + pad, self._max_y[node] + pad,
+                best_t,
+            )
+            if enter is None:
+                continue
+
+            count = self._count[node]
+            if count == 0:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+
+            for k in range(self._start[node], self._start[node] + count):
+                i = self.order[k]
+                hit = hit_fn(i, x0, y0, dx, dy)
+                if hit is not None and hit[0] <= best_t:
+                    best_t = hit[0]
+                    best = (hit[0], hit[1], hit[2], i)
+        return best
+
+    def raycast_batch(
+        self,
+        segments: Sequence[tuple[float, float, float, float]],
+        hit_fn: HitFn,
+        pad: float = 0.0,
+    ) -> list[Optional[tuple[float, float, float, int]]]:
+        raycast = self.raycast
+        return [raycast(x0, y0, x1, y1, hit_fn, pad) for x0, y0, x1, y1 in segments]
+
+
+def _slab_enter(x0, y0, inv_dx, inv_dy, min_x, min_y, max_x, max_y, t_max):
+    """Entry t of the segment into the box, or None if it misses within t_max."""
+    t_enter = 0.0
+    t_exit = t_max
+
+    if inv_dx is None:
+        if x0 < min_x or x0 > max_x:
+            return None
+    else:
+        ta = (min_x - x0) * inv_dx
+        tb = (max_x - x0) * inv_dx
+        if ta > tb:
+            ta, tb = tb, ta
+        if ta > t_enter:
+            t_enter = ta
+        if tb < t_exit:
+            t_exit = tb
+        if t_enter > t_exit:
+            return None
+
+    if inv_dy is None:
+        if y0 < min_y or y0 > max_y:
+            return None
+    else:
+        ta = (min_y - y0) * inv_dy
+        tb = (max_y - y0) * inv_dy
+        if ta > tb:
+            ta, tb = tb, ta
+        if ta > t_enter:
+            t_enter = ta
+        if tb < t_exit:
+            t_exit = tb
+        if t_enter > t_exit:
+            return None
+
+    return t_enter
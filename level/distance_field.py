@@ -0,0 +1,220 @@
+# distance_field.py
+#
+# Signed distance field baked from level geometry.
+#
+# Design notes:
+# - Baked once per level at load, then cached on disk keyed by the level
+#   file's hash and the grid resolution, so restarts skip the bake.
+# - Values are float32 in a flat array; lookups are bilinear.
+# - Movement resolution is a gradient push-out, split into steps of at most
+#   half the player's radius so thin walls can't be tunneled. Segment
+#   distances are unsigned, so Level only calls it for the slide after a
+#   swept query has stopped the mover on the open side of a wall; clear
+#   paths never touch the field.
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from level.level import Level
+
+CACHE_MAGIC = b"CTSD"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sIffffII")
+
+
+class DistanceField:
+    def __init__(
+        self,
+        origin: tuple[float, float],
+        cell_size: float,
+        width: int,
+        height: int,
+        max_distance: float,
+        values: array,
+    ):
+        self.origin_x, self.origin_y = origin
+        self.cell_size = cell_size
+        self.width = width
+        self.height = height
+        self.max_distance = max_distance
+        self.values = values
+
+    # ---- baking / caching ----
+
+    @classmethod
+    def bake(
+        cls,
+        level: "Level",
+        cell_size: float = 0.25,
+        max_distance: float = 2.0,
+    ) -> "DistanceField":
+        """Sample the distance to the nearest wall at every grid node."""
+        min_x, min_y, max_x, max_y = level.bounds
+        origin = (min_x - max_distance, min_y - max_distance)
+        width = int(math.ceil((max_x - min_x + 2 * max_distance) / cell_size)) + 1
+        height = int(math.ceil((max_y - min_y + 2 * max_distance) / cell_size)) + 1
+
+        box_count = level.box_count
+        values = array("f", bytes(4 * width * height))
+        for j in range(height):
+            y = origin[1] + j * cell_size
+            for i in range(width):
+                x = origin[0] + i * cell_size
+                d = max_distance
+                candidates = level.bvh.query_box(
+                    x - max_distance, y - max_distance, x + max_distance, y + max_distance
+                )
+                for prim in candidates:
+                    if prim < box_count:
+                        pd = _box_distance(x, y, level.box(prim))
+                    else:
+                        pd = _segment_distance(x, y, level.segment(prim - box_count))
+                    if pd < d:
+                        d = pd
+                values[j * width + i] = d
+
+        return cls(origin, cell_size, width, height, max_distance, values)
+
+    @classmethod
+    def load_or_bake(
+        cls,
+        level: "Level",
+        cache_dir: os.PathLike | str,
+        cell_size: float = 0.25,
+        max_distance: float = 2.0,
+    ) -> "DistanceField":
+        path = Path(cache_dir) / cache_key(level, cell_size, max_distance)
+        if path.exists():
+            try:
+                return cls.read(path)
+            except (ValueError, struct.error, EOFError, OSError):
+                pass  # Stale, truncated or unreadable cache entry; bake a new one.
+
+        field = cls.bake(level, cell_size, max_distance)
+        field.write(path)
+        return field
+
+    def write(self, path: os.PathLike | str) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "wb") as f:
+            f.write(CACHE_HEADER.pack(
+                CACHE_MAGIC, CACHE_VERSION,
+                self.origin_x, self.origin_y, self.cell_size, self.max_distance,
+                self.width, self.height,
+            ))
+            self.values.tofile(f)
+            # Durable before the rename, so a crash can't leave a torn cache.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def read(cls, path: os.PathLike | str) -> "DistanceField":
+        with open(path, "rb") as f:
+            header = f.read(CACHE_HEADER.size)
+            magic, version, ox, oy, cell_size, max_distance, width, height = (
+                CACHE_HEADER.unpack(header)
+            )
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                raise ValueError("not a distance field cache file")
+            values = array("f")
+            values.fromfile(f, width * height)
+        return cls((ox, oy), cell_size, width, height, max_distance, values)
+
+    # ---- lookups ----
+
+    def sample(self, x: float, y: float) -> float:
+        """Bilinear distance at (x, y); open space outside the grid."""
+        fx = (x - self.origin_x) / self.cell_size
+        fy = (y - self.origin_y) / self.cell_size
+        i = math.floor(fx)
+        j = math.floor(fy)
+        if i < 0 or j < 0 or i >= self.width - 1 or j >= self.height - 1:
+            return self.max_distance
+
+        tx = fx - i
+        ty = fy - j
+        w = self.width
+        v = self.values
+        k = j * w + i
+        top = v[k] + (v[k + 1] - v[k]) * tx
+        bottom = v[k + w] + (v[k + w + 1] - v[k + w]) * tx
+        return top + (bottom - top) * ty
+
+    def gradient(self, x: float, y: float) -> tuple[float, float]:
+        """Unit direction of increasing distance (away from walls)."""
+        h = self.cell_size * 0.5
+        gx = self.sample(x + h, y) - self.sample(x - h, y)
+        gy = self.sample(x, y + h) - self.sample(x, y - h)
+        length = math.hypot(gx, gy)
+        if length == 0.0:
+            return (0.0, 0.0)
+        return (gx / length, gy / length)
+
+    def push_out(self, x: float, y: float, radius: float, iterations: int = 2):
+        for _ in range(iterations):
+            d = self.sample(x, y)
+            if d >= radius:
+                break
+            gx, gy = self.gradient(x, y)
+            if gx == 0.0 and gy == 0.0:
+                break
+            x += gx * (radius - d)
+            y += gy * (radius - d)
+        return (x, y)
+
+    def resolve_move(self, start, end, radius: float):
+        """Move toward end, sliding along walls the circle would overlap."""
+        x, y = start
+        dx = end[0] - x
+        dy = end[1] - y
+        max_step = max(radius * 0.5, 1e-6)
+        steps = max(1, math.ceil(math.hypot(dx, dy) / max_step))
+        dx /= steps
+        dy /= steps
+        for _ in range(steps):
+            x, y = self.push_out(x + dx, y + dy, radius)
+        return (x, y)
+
+    def resolve_moves(
+        self,
+        starts: Sequence[tuple[float, float]],
+        ends: Sequence[tuple[float, float]],
+        radii: Sequence[float],
+    ) -> list[tuple[float, float]]:
+        """resolve_move for every player that moved this tick, in one pass."""
+        resolve = self.resolve_move
+        return [resolve(s, e, r) for s, e, r in zip(starts, ends, radii)]
+
+
+def cache_key(level: "Level", cell_size: float, max_distance: float) -> str:
+    return f"{level.digest()}-{cell_size:g}-{max_distance:g}.sdf"
+
+
+def _box_distance(x, y, box) -> float:
+    min_x, min_y, max_x, max_y = box
+    qx = abs(x - (min_x + max_x) * 0.5) - (max_x - min_x) * 0.5
+    qy = abs(y - (min_y + max_y) * 0.5) - (max_y - min_y) * 0.5
+    outside = math.hypot(max(qx, 0.0), max(qy, 0.0))
+    inside = min(max(qx, qy), 0.0)
+    return outside + inside
+
+
+def _segment_distance(x, y, seg) -> float:
+    ax, ay, bx, by = seg
+    ex = bx - ax
+    ey = by - ay
+    length_sq = ex * ex + ey * ey
+    t = 0.0 if length_sq == 0.0 else ((x - ax) * ex + (y - ay) * ey) / length_sq
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+    return math.hypot(x - (ax + ex * t), y - (ay + ey * t))
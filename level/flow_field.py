@@ -0,0 +1,111 @@
+# flow_field.py
+#
+# Breadth-first flow field toward one goal cell of a NavGrid.
+#
+# Design notes:
+# - One field answers "which way to the goal" for every cell at once, so
+#   any number of agents share it; a lookup is one index computation.
+# - Distances are filled a whole BFS frontier at a time over flat indices
+#   (4-connected, unit cost). Directions then pick, per cell, the
+#   8-connected neighbor closest to the goal; diagonals are only taken
+#   when both orthogonal cells are open, so paths never cut wall corners.
+# - Fields are immutable once computed, so they can be built on a worker
+#   thread and shared between forks.
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from level.nav_grid import NavGrid
+
+UNREACHABLE = -1
+NO_DIRECTION = 255
+
+_DIAGONAL = 1.0 / math.sqrt(2.0)
+# (column step, row step, unit vector)
+DIRECTIONS = (
+    (1, 0, (1.0, 0.0)),
+    (-1, 0, (-1.0, 0.0)),
+    (0, 1, (0.0, 1.0)),
+    (0, -1, (0.0, -1.0)),
+    (1, 1, (_DIAGONAL, _DIAGONAL)),
+    (-1, 1, (-_DIAGONAL, _DIAGONAL)),
+    (1, -1, (_DIAGONAL, -_DIAGONAL)),
+    (-1, -1, (-_DIAGONAL, -_DIAGONAL)),
+)
+
+
+class FlowField:
+    def __init__(self, grid: "NavGrid", goal: int, distances: array, directions: bytearray):
+        self.grid = grid
+        self.goal = goal
+        self.distances = distances
+        self.directions = directions
+
+    @classmethod
+    def compute(cls, grid: "NavGrid", goal: int) -> "FlowField":
+        width = grid.width
+        height = grid.height
+        walkable = grid.walkable
+        distances = array("i", [UNREACHABLE]) * (width * height)
+
+        frontier = [goal]
+        distances[goal] = 0
+        step = 0
+        while frontier:
+            step += 1
+            next_frontier = []
+            append = next_frontier.append
+            for index in frontier:
+                row, col = divmod(index, width)
+                for neighbor, ok in (
+                    (index + 1, col + 1 < width),
+                    (index - 1, col > 0),
+                    (index + width, row + 1 < height),
+                    (index - width, row > 0),
+                ):
+                    if ok and walkable[neighbor] and distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = step
+                        append(neighbor)
+            frontier = next_frontier
+
+        directions = bytearray([NO_DIRECTION]) * (width * height)
+        for index in range(width * height):
+            own = distances[index]
+            if own <= 0:
+                continue
+            row, col = divmod(index, width)
+            best = own
+            best_direction = NO_DIRECTION
+            for d, (dc, dr, _) in enumerate(DIRECTIONS):
+                c = col + dc
+                r = row + dr
+                if not (0 <= c < width and 0 <= r < height):
+                    continue
+                if dc and dr and not (walkable[row * width + c] and walkable[r * width + col]):
+                    continue
+                distance = distances[r * width + c]
+                if distance != UNREACHABLE and distance < best:
+                    best = distance
+                    best_direction = d
+            directions[index] = best_direction
+
+        return cls(grid, goal, distances, directions)
+
+    def distance_at(self, x: float, y: float) -> int:
+        """Steps to the goal from (x, y), or UNREACHABLE."""
+        index = self.grid.index_of(x, y)
+        return UNREACHABLE if index < 0 else self.distances[index]
+
+    def direction_at(self, x: float, y: float) -> tuple[float, float]:
+        """Unit step toward the goal from (x, y); (0, 0) at the goal or when cut off."""
+        index = self.grid.index_of(x, y)
+        if index < 0:
+            return (0.0, 0.0)
+        direction = self.directions[index]
+        if direction == NO_DIRECTION:
+            return (0.0, 0.0)
+        return DIRECTIONS[direction][2]
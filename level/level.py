@@ -0,0 +1,342 @@
+# level.py
+#
+# Static level geometry.
+#
+# File format (little-endian):
+#   header   "<4sHHII"  magic b"CTPL", version, reserved, box count, segment count
+#   boxes    "<4f" each  min_x, min_y, max_x, max_y    (solid walls / props)
+#   segments "<4f" each  x1, y1, x2, y2                (thin walls)
+#
+# The file is memory-mapped and the coordinate blocks are read through
+# memoryviews, so loading does not copy the raw geometry. The BVH over all
+# primitives is built once at load. An optional DistanceField can be attached
+# for cheap movement resolution (see distance_field.py).
+
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from level.bvh import BVH
+
+if TYPE_CHECKING:
+    from level.distance_field import DistanceField
+
+MAGIC = b"CTPL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+RECORD = struct.Struct("<4f")
+
+# How far movement stops short of a wall, so the next sweep starts outside it.
+SKIN = 1e-3
+
+Hit = tuple[float, float, float]
+
+
+class LevelFormatError(ValueError):
+    pass
+
+
+class Level:
+    def __init__(self, data, path: Optional[str] = None):
+        """Parse a level from a bytes-like buffer (usually an mmap)."""
+        self.path = path
+        self._data = data
+
+        if len(data) < HEADER.size:
+            raise LevelFormatError("level file is too short")
+        magic, version, _, box_count, segment_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise LevelFormatError(f"bad level magic: {magic!r}")
+        if version != VERSION:
+            raise LevelFormatError(f"unsupported level version: {version}")
+
+        expected = HEADER.size + RECORD.size * (box_count + segment_count)
+        if len(data) < expected:
+            raise LevelFormatError("level file is truncated")
+
+        floats = _float_view(data, HEADER.size, 4 * (box_count + segment_count))
+        self._box_coords = floats[: 4 * box_count]
+        self._segment_coords = floats[4 * box_count:]
+        self.box_count = box_count
+        self.segment_count = segment_count
+
+        bounds = [self.box(i) for i in range(box_count)]
+        bounds += [_segment_bounds(self.segment(i)) for i in range(segment_count)]
+        self.bvh = BVH(bounds)
+
+        self.distance_field: Optional["DistanceField"] = None
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: os.PathLike | str) -> "Level":
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, os.fspath(path))
+
+    def digest(self) -> str:
+        """Content hash of the level file, used to key baked caches."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self._data).hexdigest()
+        return self._digest
+
+    def box(self, i: int) -> tuple[float, float, float, float]:
+        c = self._box_coords
+        return (c[4 * i], c[4 * i + 1], c[4 * i + 2], c[4 * i + 3])
+
+    def segment(self, i: int) -> tuple[float, float, float, float]:
+        c = self._segment_coords
+        return (c[4 * i], c[4 * i + 1], c[4 * i + 2], c[4 * i + 3])
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """Bounding box of all geometry."""
+        if not len(self.bvh):
+            return (0.0, 0.0, 0.0, 0.0)
+        return self.bvh.node_bounds(0)
+
+    # ---- queries ----
+
+    def raycast(self, start, end, radius: float = 0.0) -> Optional[Hit]:
+        """First contact of a point (radius 0) or circle moving start -> end."""
+        hit = self.bvh.raycast(
+            start[0], start[1], end[0], end[1], self._hit_fn(radius), pad=radius
+        )
+        return None if hit is None else hit[:3]
+
+    def raycast_batch(
+        self,
+        starts: Sequence[tuple[float, float]],
+        ends: Sequence[tuple[float, float]],
+        radius: float = 0.0,
+    ) -> list[Optional[Hit]]:
+        """raycast() for many paths at once, e.g. every bullet this tick."""
+        hits = self.bvh.raycast_batch(
+            [(s[0], s[1], e[0], e[1]) for s, e in zip(starts, ends)],
+            self._hit_fn(radius),
+            pad=radius,
+        )
+        return [None if hit is None else hit[:3] for hit in hits]
+
+    def resolve_moves(self, starts, ends, radii) -> list[tuple[float, float]]:
+        """resolve_move for a batch of movers (e.g. every player moved this tick)."""
+        if self.distance_field is None:
+            return [self.resolve_move(s, e, r) for s, e, r in zip(starts, ends, radii)]
+
+        # One batched sweep per radius; movers whose path is clear are done.
+        by_radius: dict[float, list[int]] = {}
+        for i, radius in enumerate(radii):
+            by_radius.setdefault(radius, []).append(i)
+        moved = list(ends)
+        for radius, indices in by_radius.items():
+            hits = self.raycast_batch(
+                [starts[i] for i in indices], [ends[i] for i in indices], radius
+            )
+            for i, hit in zip(indices, hits):
+                if hit is not None:
+                    moved[i] = self._slide_with_field(starts[i], ends[i], radius, hit)
+        return moved
+
+    def resolve_move(self, start, end, radius: float, iterations: int = 2):
+        """
+        Circle movement against the walls.
+
+        A swept query finds the first wall on the path; a clear path costs
+        just that sweep. Otherwise the circle stops at the wall and the rest
+        of the motion slides along it, either through the distance field
+        when one is attached or by up to `iterations` further sweeps.
+        """
+        if self.distance_field is not None:
+            hit = self.raycast(start, end, radius)
+            if hit is None:
+                return (end[0], end[1])
+            return self._slide_with_field(start, end, radius, hit)
+
+        x, y = start
+        tx, ty = end
+        for _ in range(iterations):
+            hit = self.raycast((x, y), (tx, ty), radius)
+            if hit is None:
+                return (tx, ty)
+            x, y, tx, ty = _slide(x, y, tx, ty, hit)
+
+        hit = self.raycast((x, y), (tx, ty), radius)
+        return (x, y) if hit is not None else (tx, ty)
+
+    def _slide_with_field(self, start, end, radius: float, hit: Hit):
+        # The sweep put the circle on the open side of the wall it hit; the
+        # field (unsigned for thin walls) only resolves the slide from there,
+        # and only if the slide itself runs into something.
+        x, y, tx, ty = _slide(start[0], start[1], end[0], end[1], hit)
+        if self.raycast((x, y), (tx, ty), radius) is None:
+            return (tx, ty)
+        return self.distance_field.resolve_move((x, y), (tx, ty), radius)
+
+    def _hit_fn(self, radius: float):
+        box_count = self.box_count
+        box = self.box
+        segment = self.segment
+
+        def hit_fn(i, x0, y0, dx, dy):
+            if i < box_count:
+                return _ray_box(x0, y0, dx, dy, box(i), radius)
+            return _ray_capsule(x0, y0, dx, dy, segment(i - box_count), radius)
+
+        return hit_fn
+
+
+def write_level(
+    path: os.PathLike | str,
+    boxes: Sequence[tuple[float, float, float, float]] = (),
+    segments: Sequence[tuple[float, float, float, float]] = (),
+) -> None:
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(boxes), len(segments)))
+        for record in list(boxes) + list(segments):
+            f.write(RECORD.pack(*record))
+
+
+def _slide(x, y, tx, ty, hit: Hit):
+    """Stop just short of a sweep hit and redirect the rest of the motion along the wall."""
+    t, nx, ny = hit
+    dx = tx - x
+    dy = ty - y
+    length = math.hypot(dx, dy)
+    if length > 0:
+        t = max(0.0, t - SKIN / length)
+    x += dx * t
+    y += dy * t
+
+    rx = tx - x
+    ry = ty - y
+    into = rx * nx + ry * ny
+    if into < 0:
+        rx -= nx * into
+        ry -= ny * into
+    return x, y, x + rx, y + ry
+
+
+def _float_view(data, offset: int, count: int):
+    raw = memoryview(data)[offset: offset + 4 * count]
+    if sys.byteorder == "little":
+        return raw.cast("f")
+    # Big-endian hosts pay one decode; the file format stays little-endian.
+    return struct.unpack(f"<{count}f", raw)
+
+
+def _segment_bounds(seg):
+    x1, y1, x2, y2 = seg
+    return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+
+def _ray_box(x0, y0, dx, dy, box, radius) -> Optional[Hit]:
+    """Entry hit of the segment into the box grown by radius (square corners)."""
+    min_x, min_y, max_x, max_y = box
+    min_x -= radius
+    min_y -= radius
+    max_x += radius
+    max_y += radius
+
+    # Starting inside: never report a hit, so nothing gets stuck in a wall.
+    if min_x < x0 < max_x and min_y < y0 < max_y:
+        return None
+
+    t_enter = 0.0
+    t_exit = 1.0
+    nx = ny = 0.0
+
+    if dx == 0.0:
+        if x0 < min_x or x0 > max_x:
+            return None
+    else:
+        ta = (min_x - x0) / dx
+        tb = (max_x - x0) / dx
+        n = -1.0
+        if ta > tb:
+            ta, tb, n = tb, ta, 1.0
+        if ta > t_enter:
+            t_enter, nx, ny = ta, n, 0.0
+        t_exit = min(t_exit, tb)
+
+    if dy == 0.0:
+        if y0 < min_y or y0 > max_y:
+            return None
+    else:
+        ta = (min_y - y0) / dy
+        tb = (max_y - y0) / dy
+        n = -1.0
+        if ta > tb:
+            ta, tb, n = tb, ta, 1.0
+        if ta > t_enter:
+            t_enter, nx, ny = ta, 0.0, n
+        t_exit = min(t_exit, tb)
+
+    if t_enter > t_exit or (nx == 0.0 and ny == 0.0):
+        return None
+    return (t_enter, nx, ny)
+
+
+def _ray_capsule(x0, y0, dx, dy, seg, radius) -> Optional[Hit]:
+    """First hit of the segment against a wall segment thickened by radius."""
+    ax, ay, bx, by = seg
+    ex = bx - ax
+    ey = by - ay
+    length = math.hypot(ex, ey)
+    if length == 0.0:
+        return _ray_circle(x0, y0, dx, dy, ax, ay, radius)
+
+    nx = -ey / length
+    ny = ex / length
+    best = None
+
+    for side in ((1.0,) if radius == 0.0 else (1.0, -1.0)):
+        sx = nx * side
+        sy = ny * side
+        approach = dx * sx + dy * sy
+        if radius > 0.0 and approach >= 0.0:
+            continue
+        ox = ax + sx * radius
+        oy = ay + sy * radius
+        denom = dx * ey - dy * ex
+        if denom == 0.0:
+            continue
+        qx = ox - x0
+        qy = oy - y0
+        t = (qx * ey - qy * ex) / denom
+        s = (qx * dy - qy * dx) / denom
+        if 0.0 <= t <= 1.0 and 0.0 <= s <= 1.0 and (best is None or t < best[0]):
+            if radius == 0.0 and approach > 0.0:
+                sx, sy = -sx, -sy
+            best = (t, sx, sy)
+
+    if radius > 0.0:
+        for cx, cy in ((ax, ay), (bx, by)):
+            hit = _ray_circle(x0, y0, dx, dy, cx, cy, radius)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+
+    return best
+
+
+def _ray_circle(x0, y0, dx, dy, cx, cy, radius) -> Optional[Hit]:
+    if radius <= 0.0:
+        return None
+    fx = x0 - cx
+    fy = y0 - cy
+    a = dx * dx + dy * dy
+    c = fx * fx + fy * fy - radius * radius
+    if a == 0.0 or c < 0.0:
+        return None
+    b = 2.0 * (fx * dx + fy * dy)
+    disc = b * b - 4.0 * a * c
+    if disc < 0.0:
+        return None
+    t = (-b - math.sqrt(disc)) / (2.0 * a)
+    if not 0.0 <= t <= 1.0:
+        return None
+    return (t, (fx + dx * t) / radius, (fy + dy * t) / radius)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Optional
+
+from level.distance_field import DistanceField
+
+if TYPE_CHECKING:
+    from level.level import Level
+
+
+class NavGrid:
+    """
+    Walkable/blocked grid baked from level geometry for pathfinding.
+
+    Cells are addressed by flat index (row * width + column) so flow fields
+    can be plain arrays. A cell is walkable when its center is at least
+    clearance away from every wall, using the level's distance field.
+    """
+
+    def __init__(
+        self,
+        origin: tuple[float, float],
+        cell_size: float,
+        width: int,
+        height: int,
+        walkable: bytearray,
+    ):
+        self.origin_x, self.origin_y = origin
+        self.cell_size = cell_size
+        self.width = width
+        self.height = height
+        self.walkable = walkable
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    @classmethod
+    def bake(
+        cls,
+        level: "Level",
+        cell_size: float = 0.5,
+        clearance: float = 0.5,
+        margin: float = 2.0,
+    ) -> "NavGrid":
+        field = level.distance_field
+        if field is None or field.max_distance < clearance:
+            field = DistanceField.bake(level, cell_size / 2, max_distance=clearance + cell_size)
+
+        min_x, min_y, max_x, max_y = level.bounds
+        origin = (min_x - margin, min_y - margin)
+        width = int(math.ceil((max_x - min_x + 2 * margin) / cell_size))
+        height = int(math.ceil((max_y - min_y + 2 * margin) / cell_size))
+
+        walkable = bytearray(width * height)
+        half = cell_size / 2
+        for row in range(height):
+            y = origin[1] + row * cell_size + half
+            base = row * width
+            for col in range(width):
+                x = origin[0] + col * cell_size + half
+                if field.sample(x, y) >= clearance:
+                    walkable[base + col] = 1
+        return cls(origin, cell_size, width, height, walkable)
+
+    def index_of(self, x: float, y: float) -> int:
+        """Flat cell index containing (x, y), or -1 outside the grid."""
+        col = math.floor((x - self.origin_x) / self.cell_size)
+        row = math.floor((y - self.origin_y) / self.cell_size)
+        if 0 <= col < self.width and 0 <= row < self.height:
+            return row * self.width + col
+        return -1
+
+    def center(self, index: int) -> tuple[float, float]:
+        row, col = divmod(index, self.width)
+        half = self.cell_size / 2
+        return (
+            self.origin_x + col * self.cell_size + half,
+            self.origin_y + row * self.cell_size + half,
+        )
+
+    def is_walkable(self, x: float, y: float) -> bool:
+        index = self.index_of(x, y)
+        return index >= 0 and bool(self.walkable[index])
+
+    def nearest_walkable(self, index: int, max_rings: int = 4) -> Optional[int]:
+        """index itself if walkable, else the closest walkable cell within max_rings."""
+        if index < 0:
+            return None
+        if self.walkable[index]:
+            return index
+        row, col = divmod(index, self.width)
+        for ring in range(1, max_rings + 1):
+            for r in range(row - ring, row + ring + 1):
+                for c in range(col - ring, col + ring + 1):
+                    if max(abs(r - row), abs(c - col)) != ring:
+                        continue
+                    if 0 <= r < self.height and 0 <= c < self.width:
+                        candidate = r * self.width + c
+                        if self.walkable[candidate]:
+                            return candidate
+        return None
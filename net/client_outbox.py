@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Optional
+
+
+class ClientOutbox:
+    """
+    Bounded per-client send buffer, filled by the simulation thread and
+    drained by the client's writer task on the event loop.
+
+    State snapshots and position corrections are coalesced: only the newest
+    unsent one of each is kept, since a newer correction supersedes an older.
+    Messages go into a fixed-size deque that drops the oldest when full.
+    The simulation side never waits, so a slow client only ever loses its
+    own stale output and cannot stall the tick.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, capacity: int = 64):
+        self._loop = loop
+        self._messages: deque[bytes] = deque(maxlen=capacity)
+        self._state: Optional[bytes] = None
+        self._correction: Optional[bytes] = None
+        self._wake = asyncio.Event()
+        self._notified = False
+        self.closed = False
+
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._messages) + (self._state is not None) + (self._correction is not None)
+
+    # ---- simulation thread ----
+
+    def push_message(self, frame: bytes) -> None:
+        if len(self._messages) == self._messages.maxlen:
+            self.dropped += 1
+        self._messages.append(frame)
+        self._notify()
+
+    def set_state(self, frame: bytes) -> None:
+        if self._state is not None:
+            self.coalesced += 1
+        self._state = frame
+        self._notify()
+
+    def set_correction(self, frame: bytes) -> None:
+        if self._correction is not None:
+            self.coalesced += 1
+        self._correction = frame
+        self._notify()
+
+    def close(self) -> None:
+        self.closed = True
+        self._notified = True
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _notify(self) -> None:
+        # One wakeup per drain, however many frames arrive before it runs.
+        if not self._notified:
+            self._notified = True
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # ---- event loop ----
+
+    async def next_batch(self) -> Optional[list[bytes]]:
+        """Wait for output and take all of it; None once closed and empty."""
+        while True:
+            if not self.closed and not self:
+                await self._wake.wait()
+            self._wake.clear()
+            self._notified = False
+
+            batch = []
+            messages = self._messages
+            while messages:
+                batch.append(messages.popleft())
+            correction, self._correction = self._correction, None
+            if correction is not None:
+                batch.append(correction)
+            state, self._state = self._state, None
+            if state is not None:
+                batch.append(state)
+
+            if batch:
+                return batch
+            if self.closed:
+                return None
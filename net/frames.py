@@ -0,0 +1,217 @@
+# frames.py
+#
+# Binary wire format between clients and the gateway.
+#
+# Every frame is a little-endian header (payload length u16, opcode u8)
+# followed by the payload. Client frames decode into (action, args) pairs
+# that map one-to-one onto Player.attempt_* calls; server frames carry
+# per-client state snapshots and rendered event text.
+
+from __future__ import annotations
+
+import asyncio
+import math
+import struct
+
+HEADER = struct.Struct("<HB")
+MAX_PAYLOAD = 0xFFFF
+
+# ---- client -> server ----
+HELLO = 1           # role u8 (0 hunter, 1 prop), name utf-8
+MOVE = 2            # seq u32, x f32, y f32
+USE_WEAPON = 3      # seq u32, client_time f64 (NaN = none)
+HOLD_TRIGGER = 4    # held u8
+RELOAD = 5
+SWITCH_SLOT = 6     # slot name utf-8
+POSSESS = 7         # object name utf-8 (empty = nearest)
+STEAL = 8
+
+# ---- server -> client ----
+STATE = 64          # time f64, last seq u32, health f32
+MESSAGE = 65        # text utf-8
+WORLD = 66          # time f64, player count u16, bullet count u16,
+                    # players (team u8, x f32, y f32, health f32, name u8-prefixed),
+                    # bullets (x f32, y f32); large snapshots span several frames
+CORRECTION = 67     # seq u32, x f32, y f32; only when the client's position is off
+
+ROLES = ("hunter", "prop")
+TEAMS = ("hunters", "props", "guardian_angels")
+
+_MOVE = struct.Struct("<Iff")
+_USE_WEAPON = struct.Struct("<Id")
+_HOLD_TRIGGER = struct.Struct("<B")
+_STATE = struct.Struct("<dIf")
+_CORRECTION = struct.Struct("<Iff")
+_WORLD = struct.Struct("<dHH")
+_WORLD_PLAYER = struct.Struct("<BfffB")
+_WORLD_BULLET = struct.Struct("<ff")
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+def encode_frame(opcode: int, payload: bytes = b"") -> bytes:
+    if len(payload) > MAX_PAYLOAD:
+        raise ProtocolError(f"Payload too large: {len(payload)} bytes")
+    return HEADER.pack(len(payload), opcode) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one frame; raises asyncio.IncompleteReadError at end of stream."""
+    length, opcode = HEADER.unpack(await reader.readexactly(HEADER.size))
+    payload = await reader.readexactly(length) if length else b""
+    return opcode, payload
+
+
+def decode_intent(opcode: int, payload: bytes) -> tuple[str, tuple]:
+    try:
+        if opcode == HELLO:
+            return "join", (payload[1:].decode("utf-8"), ROLES[payload[0]])
+        if opcode == MOVE:
+            seq, x, y = _MOVE.unpack(payload)
+            # One NaN position would poison every grid lookup, every tick.
+            if not (math.isfinite(x) and math.isfinite(y)):
+                raise ProtocolError(f"Non-finite move target ({x}, {y})")
+            return "move", ((x, y), seq)
+        if opcode == USE_WEAPON:
+            seq, client_time = _USE_WEAPON.unpack(payload)
+            if math.isnan(client_time):
+                client_time = None
+            elif math.isinf(client_time):
+                raise ProtocolError(f"Non-finite client time {client_time}")
+            return "use_weapon", (client_time, seq)
+        if opcode == HOLD_TRIGGER:
+            return "hold_trigger", (bool(_HOLD_TRIGGER.unpack(payload)[0]),)
+        if opcode == RELOAD and not payload:
+            return "reload", ()
+        if opcode == SWITCH_SLOT:
+            return "switch_slot", (payload.decode("utf-8"),)
+        if opcode == POSSESS:
+            return "possess", (payload.decode("utf-8") or None,)
+        if opcode == STEAL and not payload:
+            return "steal", ()
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ProtocolError(f"Malformed frame (opcode {opcode}): {e}") from None
+    raise ProtocolError(f"Unknown or malformed opcode {opcode}")
+
+
+# ---- encoders (clients encode intents, the server encodes output) ----
+
+def hello(name: str, role: str) -> bytes:
+    return encode_frame(HELLO, bytes((ROLES.index(role),)) + name.encode("utf-8"))
+
+
+def move(seq: int, x: float, y: float) -> bytes:
+    return encode_frame(MOVE, _MOVE.pack(seq, x, y))
+
+
+def use_weapon(seq: int, client_time: float = math.nan) -> bytes:
+    return encode_frame(USE_WEAPON, _USE_WEAPON.pack(seq, client_time))
+
+
+def hold_trigger(held: bool) -> bytes:
+    return encode_frame(HOLD_TRIGGER, _HOLD_TRIGGER.pack(held))
+
+
+def state(time: float, seq: int, health: float) -> bytes:
+    return encode_frame(STATE, _STATE.pack(time, seq, health))
+
+
+def decode_state(payload: bytes) -> tuple[float, int, float]:
+    return _STATE.unpack(payload)
+
+
+def correction(seq: int, x: float, y: float) -> bytes:
+    return encode_frame(CORRECTION, _CORRECTION.pack(seq, x, y))
+
+
+def decode_correction(payload: bytes) -> tuple[int, float, float]:
+    return _CORRECTION.unpack(payload)
+
+
+def message(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return encode_frame(MESSAGE, data[:MAX_PAYLOAD])
+
+
+def world(time: float, players, bullets) -> bytes:
+    """
+    Whole-match snapshot for spectators. players are
+    (team index, name, x, y, health) and bullets (x, y).
+
+    A busy match doesn't fit one frame, so the snapshot is one or more
+    WORLD frames back to back, each carrying the time and its share of the
+    players and bullets. read_world() puts them back together.
+    """
+    frames = []
+    parts: list[bytes] = []
+    size = _WORLD.size
+    player_count = bullet_count = 0
+
+    def close_frame():
+        nonlocal parts, size, player_count, bullet_count
+        payload = _WORLD.pack(time, player_count, bullet_count) + b"".join(parts)
+        frames.append(encode_frame(WORLD, payload))
+        parts, size, player_count, bullet_count = [], _WORLD.size, 0, 0
+
+    for team, name, x, y, health in players:
+        data = name.encode("utf-8")
+        if len(data) > 255:
+            # Cut on a character boundary so the name still decodes.
+            data = data[:255].decode("utf-8", errors="ignore").encode("utf-8")
+        if size + _WORLD_PLAYER.size + len(data) > MAX_PAYLOAD or player_count == 0xFFFF:
+            close_frame()
+        parts.append(_WORLD_PLAYER.pack(team, x, y, health, len(data)))
+        parts.append(data)
+        size += _WORLD_PLAYER.size + len(data)
+        player_count += 1
+    for x, y in bullets:
+        if size + _WORLD_BULLET.size > MAX_PAYLOAD or bullet_count == 0xFFFF:
+            close_frame()
+        parts.append(_WORLD_BULLET.pack(x, y))
+        size += _WORLD_BULLET.size
+        bullet_count += 1
+    close_frame()
+    return b"".join(frames)
+
+
+def read_world(data) -> tuple[float, list, list]:
+    """Decode a whole snapshot made by world(), however many frames it spans."""
+    time = 0.0
+    players: list = []
+    bullets: list = []
+    offset = 0
+    while offset < len(data):
+        try:
+            length, opcode = HEADER.unpack_from(data, offset)
+        except struct.error as exc:
+            raise ProtocolError(f"Malformed world snapshot: {exc}") from None
+        offset += HEADER.size
+        if opcode != WORLD or offset + length > len(data):
+            raise ProtocolError("Malformed world snapshot: bad frame")
+        time, frame_players, frame_bullets = decode_world(data[offset:offset + length])
+        players += frame_players
+        bullets += frame_bullets
+        offset += length
+    return time, players, bullets
+
+
+def decode_world(payload) -> tuple[float, list, list]:
+    try:
+        time, player_count, bullet_count = _WORLD.unpack_from(payload)
+        offset = _WORLD.size
+        players = []
+        for _ in range(player_count):
+            team, x, y, health, name_length = _WORLD_PLAYER.unpack_from(payload, offset)
+            offset += _WORLD_PLAYER.size
+            name = bytes(payload[offset:offset + name_length]).decode("utf-8")
+            offset += name_length
+            players.append((TEAMS[team], name, x, y, health))
+        bullets = [
+            _WORLD_BULLET.unpack_from(payload, offset + i * _WORLD_BULLET.size)
+            for i in range(bullet_count)
+        ]
+    except (struct.error, IndexError, UnicodeDecodeError) as exc:
+        raise ProtocolError(f"Malformed world snapshot: {exc}") from None
+    return time, players, bullets
@@ -0,0 +1,242 @@
+# gateway.py
+#
+# asyncio front door for a Game.
+#
+# Design notes:
+# - The event loop only does I/O. Each connection's reader decodes frames
+#   into intents and appends them to one deque (append/popleft are atomic,
+#   so no lock); the simulation thread drains it at the start of a tick.
+# - Everything that touches the Game (joining, attempt_* calls, reading
+#   state) happens on the simulation thread, inside tick().
+# - Output goes through per-client ClientOutboxes, which are bounded and
+#   never block the simulation thread.
+# - Movement is acknowledged by sequence number in the STATE frame; a
+#   CORRECTION frame with the authoritative position goes out only when the
+#   client's prediction diverged or the server moved the player.
+# - The gun catalog is hot-reloaded from tick() every catalog_check_interval
+#   seconds of match time. A broken file leaves the old table in place and
+#   is counted in catalog_reload_errors.
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from entities.movement.move_correction import MoveCorrection
+from entities.player import Player
+from entities.weapons.gun_catalog import GunCatalog, default_catalog
+from net import frames
+from net.client_outbox import ClientOutbox
+
+if TYPE_CHECKING:
+    from core.checkpoint import Checkpointer
+    from core.events import GameEvent
+    from core.game import Game
+    from net.snapshot_ring import SnapshotRing
+
+
+class ClientSession:
+    def __init__(self, client_id: int, outbox: ClientOutbox):
+        self.client_id = client_id
+        self.outbox = outbox
+        # Set on the simulation thread once the join intent is applied.
+        self.player: Optional[Player] = None
+
+
+class Gateway:
+    send_capacity = 64
+    catalog_check_interval = 1.0
+
+    def __init__(
+        self,
+        game: "Game",
+        snapshots: Optional["SnapshotRing"] = None,
+        checkpoints: Optional["Checkpointer"] = None,
+        match_id: str = "match",
+        catalog: Optional[GunCatalog] = None,
+    ):
+        self.game = game
+        # Gun table hot-reloaded while the match runs.
+        self.catalog = default_catalog() if catalog is None else catalog
+        self.catalog_reload_errors = 0
+        self._catalog_checked: Optional[float] = None
+        # Whole-match snapshots for spectator and relay processes.
+        self.snapshots = snapshots
+        self.snapshots_dropped = 0
+        # Periodic crash-recovery checkpoints, keyed by match_id.
+        self.checkpoints = checkpoints
+        self.match_id = match_id
+        self._intents: deque[tuple[ClientSession, str, tuple]] = deque()
+        self._ids = itertools.count(1)
+
+        # Simulation-thread only.
+        self._sessions: dict[Player, ClientSession] = {}
+        game.events.subscribe(self._route_events)
+
+    # ============================================================
+    # Event loop side
+    # ============================================================
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(self.handle_connection, path)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer) -> None:
+        outbox = ClientOutbox(asyncio.get_running_loop(), self.send_capacity)
+        session = ClientSession(next(self._ids), outbox)
+        writer_task = asyncio.create_task(self._write_loop(outbox, writer))
+        try:
+            while True:
+                opcode, payload = await frames.read_frame(reader)
+                action, args = frames.decode_intent(opcode, payload)
+                self._intents.append((session, action, args))
+        except (asyncio.IncompleteReadError, ConnectionError, frames.ProtocolError):
+            pass
+        finally:
+            self._intents.append((session, "leave", ()))
+            outbox.close()
+            await writer_task
+            writer.close()
+
+    async def _write_loop(self, outbox: ClientOutbox, writer) -> None:
+        try:
+            while True:
+                batch = await outbox.next_batch()
+                if batch is None:
+                    return
+                writer.write(b"".join(batch))
+                await writer.drain()
+        except ConnectionError:
+            return
+
+    # ============================================================
+    # Simulation thread side
+    # ============================================================
+
+    def tick(self, dt: float) -> None:
+        self.apply_intents()
+        self.game.update(dt)
+        self.publish()
+        self.reload_catalog()
+        if self.checkpoints is not None:
+            self.checkpoints.tick(self.game, self.match_id)
+
+    def run(self, tick_rate: float, stop: threading.Event) -> None:
+        """Fixed-rate simulation loop, meant for a dedicated thread."""
+        dt = 1.0 / tick_rate
+        next_tick = time.perf_counter()
+        while not stop.is_set():
+            self.tick(dt)
+            next_tick += dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                stop.wait(delay)
+
+    def reload_catalog(self) -> bool:
+        """Pick up gun catalog edits, at most every catalog_check_interval."""
+        now = self.game.time
+        last = self._catalog_checked
+        if last is not None and now - last < self.catalog_check_interval:
+            return False
+        self._catalog_checked = now
+        try:
+            return self.catalog.reload_if_changed()
+        except (OSError, ValueError, LookupError, TypeError):
+            # Mid-write or malformed file: keep serving the old table.
+            self.catalog_reload_errors += 1
+            return False
+
+    def apply_intents(self) -> int:
+        intents = self._intents
+        movement = self.game.movement
+        applied = 0
+        # Every client's moves this tick are resolved against the walls in
+        # one batch; anything else a player does sees their settled position.
+        with movement.batch():
+            while intents:
+                session, action, args = intents.popleft()
+                applied += 1
+                player = session.player
+                if player is not None and action != "move":
+                    movement.settle(player)
+                if action == "join":
+                    self._join(session, *args)
+                elif action == "leave":
+                    self._leave(session)
+                elif player is not None:
+                    getattr(player, "attempt_" + action)(*args)
+        return applied
+
+    def publish(self) -> None:
+        now = self.game.time
+        inputs = self.game.inputs
+        corrections = dict(inputs.drain_corrections())
+        for player, session in self._sessions.items():
+            seq = inputs.last_processed(player) or 0
+            correction = corrections.get(player)
+            # Knockback and the like move players after their last input;
+            # the client only hears its position when it is off.
+            if inputs.displaced(player):
+                correction = MoveCorrection(seq, player.position)
+                inputs.confirm(player, player.position)
+            if correction is not None:
+                x, y = correction.position
+                session.outbox.set_correction(frames.correction(correction.seq, x, y))
+            session.outbox.set_state(frames.state(now, seq, player.health))
+        if self.snapshots is not None:
+            snapshot = world_snapshot(self.game)
+            # Spectators must never take the match down: a snapshot too big
+            # for the ring is skipped and counted.
+            if len(snapshot) > self.snapshots.capacity:
+                self.snapshots_dropped += 1
+            else:
+                self.snapshots.publish(snapshot)
+
+    def _join(self, session: ClientSession, name: str, role: str) -> None:
+        if session.player is not None or session.outbox.closed:
+            return
+        session.player = Player(name, role, self.game)
+        self._sessions[session.player] = session
+
+    def _leave(self, session: ClientSession) -> None:
+        player = session.player
+        if player is None:
+            return
+        del self._sessions[player]
+        session.player = None
+        self.game.remove_player(player)
+
+    def _route_events(self, events: Sequence["GameEvent"]) -> None:
+        sessions = self._sessions
+        for event in events:
+            if event.silent:
+                continue
+            recipient = event.recipient
+            if recipient is not None:
+                session = sessions.get(recipient)
+                if session is not None:
+                    session.outbox.push_message(frames.message(event.render()))
+                continue
+
+            frame = frames.message(event.render())
+            exclude = getattr(event, "exclude", None)
+            for player, session in sessions.items():
+                if player is not exclude:
+                    session.outbox.push_message(frame)
+
+
+def world_snapshot(game: "Game") -> bytes:
+    teams = (game.hunters, game.props, game.guardian_angels)
+    players = (
+        (team, player.name, player.position[0], player.position[1], player.health)
+        for team, members in enumerate(teams)
+        for player in members
+    )
+    bullets = ((bullet.x, bullet.y) for bullet in game.bullets if bullet.alive)
+    return frames.world(game.time, players, bullets)
@@ -0,0 +1,172 @@
+# snapshot_ring.py
+#
+# Single-writer, many-reader ring of whole-match snapshots in shared memory.
+#
+# Design notes:
+# - The simulation encodes each tick's snapshot once and publishes it here;
+#   spectator and relay processes attach by name and fan it out, so encode
+#   cost doesn't grow with viewer count.
+# - The writer never waits. Each slot is a seqlock: the writer clears the
+#   slot's sequence number, writes the payload, then stamps the new number.
+#   A reader checks the number before and after copying the payload out;
+#   if it changed, the writer lapped the reader mid-copy and the copy is
+#   thrown away.
+# - Sequence numbers start at 1 and only grow, so a slot never shows the
+#   same number for two different snapshots.
+#
+# Layout: header (magic, slot count, slot size, head seq), then slot count
+# slots of (seq u64, length u32, payload).
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import shared_memory
+from typing import Optional
+
+MAGIC = b"CTSR"
+HEADER = struct.Struct("<4sIIQ")
+SLOT = struct.Struct("<QI")
+_HEAD_OFFSET = 12
+_SEQ = struct.Struct("<Q")
+
+
+class Lapped(Exception):
+    """The requested snapshot was overwritten before it could be read."""
+
+    def __init__(self, seq: int, head: int):
+        super().__init__(f"Snapshot {seq} was overwritten (head is {head})")
+        self.seq = seq
+        self.head = head
+
+
+class SnapshotRing:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+
+        magic, self.slots, self.slot_size, _ = HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            raise ValueError(f"{shm.name} is not a snapshot ring")
+        self.capacity = self.slot_size - SLOT.size
+
+    @classmethod
+    def create(cls, slots: int = 16, slot_size: int = 1 << 20, name: Optional[str] = None) -> "SnapshotRing":
+        if slots < 2:
+            raise ValueError("A snapshot ring needs at least two slots")
+        if slot_size <= SLOT.size:
+            raise ValueError(f"slot_size must be larger than {SLOT.size}")
+        shm = shared_memory.SharedMemory(name, create=True, size=HEADER.size + slots * slot_size)
+        HEADER.pack_into(shm.buf, 0, MAGIC, slots, slot_size, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SnapshotRing":
+        return cls(shared_memory.SharedMemory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest snapshot; 0 before the first."""
+        return _SEQ.unpack_from(self._buf, _HEAD_OFFSET)[0]
+
+    def _slot_offset(self, seq: int) -> int:
+        return HEADER.size + (seq % self.slots) * self.slot_size
+
+    # ---- writer ----
+
+    def publish(self, payload) -> int:
+        """Write a snapshot into the next slot, overwriting the oldest. Never blocks."""
+        length = len(payload)
+        if length > self.capacity:
+            raise ValueError(f"Snapshot of {length} bytes exceeds slot capacity {self.capacity}")
+        buf = self._buf
+        seq = self.head + 1
+        offset = self._slot_offset(seq)
+
+        _SEQ.pack_into(buf, offset, 0)
+        start = offset + SLOT.size
+        buf[start:start + length] = payload
+        SLOT.pack_into(buf, offset, seq, length)
+        _SEQ.pack_into(buf, _HEAD_OFFSET, seq)
+        return seq
+
+    # ---- readers ----
+
+    def read(self, seq: int) -> Optional[bytes]:
+        """
+        Copy out snapshot seq. Returns None if it hasn't been published yet;
+        raises Lapped if it has already been overwritten.
+        """
+        head = self.head
+        if seq > head:
+            return None
+        if seq < 1 or head - seq >= self.slots:
+            raise Lapped(seq, head)
+
+        buf = self._buf
+        offset = self._slot_offset(seq)
+        before, length = SLOT.unpack_from(buf, offset)
+        if before != seq or length > self.capacity:
+            raise Lapped(seq, self.head)
+        start = offset + SLOT.size
+        data = bytes(buf[start:start + length])
+        if _SEQ.unpack_from(buf, offset)[0] != seq:
+            raise Lapped(seq, self.head)
+        return data
+
+    def close(self) -> None:
+        self._buf.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the segment; the creating process calls this at shutdown."""
+        self._shm.unlink()
+
+
+class SnapshotReader:
+    """
+    One reader's cursor into a ring. poll() returns every snapshot published
+    since the last call, skipping ahead to the oldest still in the ring when
+    the reader falls more than a ring's length behind.
+    """
+
+    def __init__(self, ring: SnapshotRing, from_latest: bool = True):
+        self.ring = ring
+        self.next_seq = ring.head if from_latest and ring.head else 1
+        self.missed = 0
+
+    def poll(self) -> list[bytes]:
+        ring = self.ring
+        snapshots = []
+        while True:
+            try:
+                data = ring.read(self.next_seq)
+            except Lapped as lapped:
+                # Resume at the oldest slot the writer can't be partway through.
+                resume = max(lapped.head - ring.slots + 2, self.next_seq + 1)
+                self.missed += resume - self.next_seq
+                self.next_seq = resume
+                continue
+            if data is None:
+                return snapshots
+            snapshots.append(data)
+            self.next_seq += 1
+
+    def latest(self) -> Optional[bytes]:
+        """Newest snapshot only, for viewers that just want the current frame."""
+        ring = self.ring
+        while True:
+            head = ring.head
+            if head == 0:
+                return None
+            try:
+                data = ring.read(head)
+            except Lapped:
+                continue
+            self.missed += max(0, head - self.next_seq)
+            self.next_seq = head + 1
+            return data
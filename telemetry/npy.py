@@ -0,0 +1,73 @@
+# npy.py
+#
+# Just enough of the NumPy .npy format (version 1.0) to write and map 1-D
+# columns from stdlib arrays, so segments open with numpy.load(mmap_mode="r")
+# without the writer depending on NumPy.
+
+from __future__ import annotations
+
+import ast
+import struct
+import sys
+from array import array
+from typing import BinaryIO
+
+MAGIC = b"\x93NUMPY"
+VERSION = b"\x01\x00"
+_HEADER_LEN = struct.Struct("<H")
+ALIGNMENT = 64
+
+# array typecode -> (little-endian numpy descr, memoryview format)
+DTYPES = {
+    "b": ("|i1", "b"),
+    "B": ("|u1", "B"),
+    "h": ("<i2", "h"),
+    "H": ("<u2", "H"),
+    "i": ("<i4", "i"),
+    "I": ("<u4", "I"),
+    "q": ("<i8", "q"),
+    "Q": ("<u8", "Q"),
+    "f": ("<f4", "f"),
+    "d": ("<f8", "d"),
+}
+_FORMATS = {descr: fmt for descr, fmt in DTYPES.values()}
+
+
+class NpyFormatError(ValueError):
+    pass
+
+
+def header(typecode: str, rows: int) -> bytes:
+    descr = DTYPES[typecode][0]
+    text = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({rows},), }}"
+    # Pad with spaces so the data starts on an ALIGNMENT boundary.
+    unpadded = len(MAGIC) + len(VERSION) + _HEADER_LEN.size + len(text) + 1
+    text += " " * (-unpadded % ALIGNMENT) + "\n"
+    return MAGIC + VERSION + _HEADER_LEN.pack(len(text)) + text.encode("latin1")
+
+
+def write(f: BinaryIO, column: array) -> None:
+    f.write(header(column.typecode, len(column)))
+    if sys.byteorder == "big" and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    column.tofile(f)
+
+
+def parse_header(data) -> tuple[str, int, int]:
+    """(memoryview format, rows, data offset) of a mapped .npy file."""
+    if bytes(data[:6]) != MAGIC or bytes(data[6:8]) != VERSION:
+        raise NpyFormatError("not a version 1.0 .npy file")
+    (length,) = _HEADER_LEN.unpack_from(data, 8)
+    offset = 10 + length
+    try:
+        fields = ast.literal_eval(bytes(data[10:offset]).decode("latin1"))
+        fmt = _FORMATS[fields["descr"]]
+        (rows,) = fields["shape"]
+    except (ValueError, SyntaxError, KeyError, TypeError) as exc:
+        raise NpyFormatError(f"unsupported .npy header: {exc}") from None
+    if fields["fortran_order"]:
+        raise NpyFormatError("fortran-ordered arrays are not supported")
+    if sys.byteorder == "big" and fmt not in ("b", "B"):
+        raise NpyFormatError("little-endian columns can't be mapped on this platform")
+    return fmt, rows, offset
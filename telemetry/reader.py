@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator, Optional
+
+from telemetry import npy
+from telemetry.writer import MANIFEST, NO_STRING
+
+
+class TelemetryReader:
+    """
+    Memory-mapped access to a telemetry directory.
+
+    Columns come back as typed memoryviews over the mapped segment files, so
+    scanning doesn't copy. Views borrow the mappings: drop them before
+    close().
+    """
+
+    def __init__(self, directory: os.PathLike | str):
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST) as f:
+            manifest = json.load(f)
+        self.strings: list[str] = manifest["strings"]
+        self._tables: dict[str, dict] = manifest["tables"]
+        self._maps: dict[str, mmap.mmap] = {}
+
+    @property
+    def tables(self) -> list[str]:
+        return list(self._tables)
+
+    def rows(self, table: str) -> int:
+        return sum(segment["rows"] for segment in self._tables[table]["segments"])
+
+    def string(self, code: int) -> Optional[str]:
+        return None if code == NO_STRING else self.strings[code]
+
+    def segments(self, table: str, *columns: str) -> Iterator[dict[str, memoryview]]:
+        """Per segment, the named columns (all of them by default) as memoryviews."""
+        spec = self._tables[table]
+        names = columns or tuple(spec["columns"])
+        for segment in spec["segments"]:
+            yield {name: self._view(segment["files"][name]) for name in names}
+
+    def column(self, table: str, name: str) -> list:
+        """Every value of one column, concatenated across segments."""
+        values: list = []
+        for segment in self.segments(table, name):
+            values.extend(segment[name])
+        return values
+
+    def _view(self, name: str) -> memoryview:
+        mapped = self._maps.get(name)
+        if mapped is None:
+            with open(self.directory / name, "rb") as f:
+                mapped = self._maps[name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        fmt, rows, offset = npy.parse_header(mapped)
+        return memoryview(mapped)[offset:offset + rows * struct.calcsize(fmt)].cast(fmt)
+
+    def close(self) -> None:
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "TelemetryReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
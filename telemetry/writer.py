@@ -0,0 +1,221 @@
+# writer.py
+#
+# Columnar match telemetry.
+#
+# Design notes:
+# - TelemetryWriter is an EventStream sink. Each recorded event becomes one
+#   row of its table: a handful of array appends on the tick thread, with
+#   strings (player, weapon, effect names) dictionary-encoded to integer
+#   codes.
+# - A table that reaches chunk_rows hands its column arrays to a background
+#   thread and starts fresh ones. The thread writes each column as a .npy
+#   segment and then rewrites manifest.json (atomically), so a reader never
+#   sees a segment the manifest doesn't describe in full.
+# - Rows are stamped with each event's own match time (EventStream.times),
+#   so a held-trigger shot keeps its sub-tick time rather than the tick's.
+# - One writer can record several matches; every row carries its match id.
+#   Like the rest of the game, the writer expects events from one tick
+#   thread at a time.
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from core.events import EffectApplied, PlayerDied, PlayerHit, ShotFired, WeaponPickedUp
+from telemetry import npy
+
+if TYPE_CHECKING:
+    from core.events import GameEvent
+    from core.game import Game
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+NO_STRING = 0xFFFFFFFF
+
+# table -> ((column, array typecode), ...). time is match time in seconds;
+# name-valued columns hold codes into the manifest's string table.
+SCHEMA: dict[str, tuple[tuple[str, str], ...]] = {
+    "shots": (("match", "I"), ("time", "d"), ("player", "I"), ("weapon", "I"), ("blank", "B")),
+    "hits": (("match", "I"), ("time", "d"), ("player", "I"), ("source", "I"), ("damage", "f")),
+    "deaths": (("match", "I"), ("time", "d"), ("player", "I"), ("killer", "I")),
+    "pickups": (("match", "I"), ("time", "d"), ("player", "I"), ("weapon", "I"), ("slot", "I")),
+    "effects": (("match", "I"), ("time", "d"), ("player", "I"), ("effect", "I")),
+}
+
+
+class TelemetryWriter:
+    chunk_rows = 1 << 16
+
+    def __init__(self, directory: os.PathLike | str, chunk_rows: Optional[int] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if chunk_rows is not None:
+            self.chunk_rows = chunk_rows
+
+        self._columns = {table: _new_columns(table) for table in SCHEMA}
+        self._strings: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._match_ids = 0
+        self._closed = False
+
+        # Background thread state.
+        self._queue: queue.Queue = queue.Queue()
+        self._segments: dict[str, list[dict]] = {table: [] for table in SCHEMA}
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._write_loop, name="telemetry", daemon=True)
+        self._thread.start()
+
+    # ============================================================
+    # Tick thread
+    # ============================================================
+
+    def attach(self, game: "Game") -> int:
+        """Record game's events from now on. Returns the match id its rows carry."""
+        match = self._match_ids
+        self._match_ids += 1
+        game.events.subscribe(_MatchSink(self, game, match))
+        return match
+
+    def code(self, text: Optional[str]) -> int:
+        if text is None:
+            return NO_STRING
+        code = self._codes.get(text)
+        if code is None:
+            code = self._codes[text] = len(self._strings)
+            self._strings.append(text)
+        return code
+
+    def record(
+        self, match: int, times: Sequence[float], events: Sequence["GameEvent"]
+    ) -> None:
+        columns = self._columns
+        code = self.code
+        for time, event in zip(times, events):
+            kind = type(event)
+            if kind is ShotFired:
+                table = "shots"
+                match_, t, player, weapon, blank = columns[table]
+                weapon.append(code(event.shot_name))
+                blank.append(event.blank)
+            elif kind is PlayerHit:
+                table = "hits"
+                match_, t, player, source, damage = columns[table]
+                source.append(code(event.source))
+                damage.append(event.damage)
+            elif kind is PlayerDied:
+                table = "deaths"
+                match_, t, player, killer = columns[table]
+                killer.append(code(event.killer))
+            elif kind is WeaponPickedUp:
+                table = "pickups"
+                match_, t, player, weapon, slot = columns[table]
+                weapon.append(code(event.weapon_name))
+                slot.append(code(event.slot_name))
+            elif kind is EffectApplied:
+                table = "effects"
+                match_, t, player, effect = columns[table]
+                effect.append(code(event.effect_name))
+            else:
+                continue
+            match_.append(match)
+            t.append(time)
+            player.append(code(event.player.name))
+            if len(t) >= self.chunk_rows:
+                self._hand_off(table)
+
+    def flush(self) -> None:
+        """Write every partial table and wait until it is on disk."""
+        for table in SCHEMA:
+            if len(self._columns[table][0]):
+                self._hand_off(table)
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> "TelemetryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _hand_off(self, table: str) -> None:
+        chunk = self._columns[table]
+        self._columns[table] = _new_columns(table)
+        self._queue.put((table, chunk))
+
+    # ============================================================
+    # Background thread
+    # ============================================================
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    self._write_segment(*item)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                self._queue.task_done()
+
+    def _write_segment(self, table: str, chunk: list[array]) -> None:
+        segments = self._segments[table]
+        folder = self.directory / table
+        folder.mkdir(exist_ok=True)
+        files = {}
+        for (column, _), values in zip(SCHEMA[table], chunk):
+            name = f"{table}/{column}-{len(segments):05d}.npy"
+            with open(self.directory / name, "wb") as f:
+                npy.write(f, values)
+            files[column] = name
+        segments.append({"rows": len(chunk[0]), "files": files})
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "version": FORMAT_VERSION,
+            # Codes are only ever appended, so a snapshot of the list covers
+            # every code in the segments written so far.
+            "strings": list(self._strings),
+            "tables": {
+                table: {
+                    "columns": {column: npy.DTYPES[typecode][0] for column, typecode in columns},
+                    "segments": self._segments[table],
+                }
+                for table, columns in SCHEMA.items()
+            },
+        }
+        tmp = self.directory / (MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, self.directory / MANIFEST)
+
+
+class _MatchSink:
+    def __init__(self, writer: TelemetryWriter, game: "Game", match: int):
+        self.writer = writer
+        self.game = game
+        self.match = match
+
+    def __call__(self, events: Sequence["GameEvent"]) -> None:
+        self.writer.record(self.match, self.game.events.times, events)
+
+
+def _new_columns(table: str) -> list[array]:
+    return [array(typecode) for _, typecode in SCHEMA[table]]
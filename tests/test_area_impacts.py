@@ -0,0 +1,151 @@
+"""Tests for area-of-effect impacts and the batched radius pass."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from core.events import PropsRevealed
+from core.game import Game
+from core.spatial_hash import SpatialHash
+from entities.player import Player
+from entities.weapons.bullet import Bullet
+from entities.weapons.impact.explosion_impact import ExplosionImpact
+from entities.weapons.impact.reveal_impact import RevealImpact
+from entities.weapons.impact.yeet_impact import YeetImpact
+from entities.weapons.travel.straight_travel import StraightTravel
+from level.level import write_level
+
+
+def make_bullet(impact, owner_id="Hunter", x=0.0, y=0.0, damage=40):
+    return Bullet(
+        x=x,
+        y=y,
+        vx=0.0,
+        vy=0.0,
+        owner_id=owner_id,
+        damage=damage,
+        travel_behavior=StraightTravel(),
+        impact_behaviors=(impact,),
+    )
+
+
+class TestSpatialHash(unittest.TestCase):
+    def test_query_radius_returns_only_items_in_range(self):
+        grid = SpatialHash(2.0)
+        grid.insert("near", 1.0, 0.0)
+        grid.insert("edge", 0.0, 3.0)
+        grid.insert("far", 10.0, 10.0)
+
+        hits = dict(grid.query_radius(0.0, 0.0, 3.0))
+
+        self.assertEqual(set(hits), {"near", "edge"})
+        self.assertAlmostEqual(hits["edge"], 3.0)
+
+
+class TestAreaImpacts(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.center = Player("Center", "prop", self.game)
+        self.halfway = Player("Halfway", "prop", self.game)
+        self.outside = Player("Outside", "prop", self.game)
+        self.center.position = (0.0, 0.0)
+        self.halfway.position = (5.0, 0.0)
+        self.outside.position = (20.0, 0.0)
+
+    def test_explosion_damage_falls_off_with_distance(self):
+        bullet = make_bullet(ExplosionImpact(radius=10.0))
+
+        bullet.impact(self.center)
+        self.game.update(0.0)
+
+        self.assertEqual(self.center.health, 60)
+        self.assertEqual(self.halfway.health, 80)
+        self.assertEqual(self.outside.health, 100)
+        self.assertEqual(self.hunter.health, 100)
+
+    def test_explosions_in_one_tick_share_one_batch_and_stack(self):
+        first = make_bullet(ExplosionImpact(radius=10.0, falloff=0.0))
+        second = make_bullet(ExplosionImpact(radius=10.0, falloff=0.0))
+
+        first.impact(self.center)
+        second.impact(self.center)
+        self.game.areas.resolve()
+
+        self.assertEqual(self.game.damage.pending(), 4)
+        self.game.damage.resolve()
+        self.assertEqual(self.center.health, 20)
+
+    def test_explosion_knockback_is_applied_as_one_batch(self):
+        knockback = YeetImpact()
+        knockback.apply_batch = MagicMock()
+        bullet = make_bullet(ExplosionImpact(radius=10.0, knockback=knockback))
+
+        bullet.impact(self.center)
+        self.game.areas.resolve()
+
+        knockback.apply_batch.assert_called_once()
+        _, origin, targets, scales = knockback.apply_batch.call_args.args
+        self.assertEqual(origin, (0.0, 0.0))
+        self.assertEqual(set(targets), {self.center, self.halfway})
+        self.assertEqual(len(scales), 2)
+
+    def test_reveal_pulse_reports_props_in_radius_to_shooter(self):
+        bullet = make_bullet(RevealImpact(radius=6.0))
+
+        bullet.impact(self.center)
+        self.game.areas.resolve()
+
+        events = [e for e in self.game.events if isinstance(e, PropsRevealed)]
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].recipient, self.hunter)
+        self.assertEqual(set(events[0].props), {self.center, self.halfway})
+        self.assertEqual(self.center.health, 100)
+
+
+class TestAreaImpactDetonation(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.prop = Player("Prop", "prop", self.game)
+        self.prop.position = (9.0, 3.0)
+
+    def test_explodes_where_it_hits_a_wall(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, "wall.ctpl")
+        write_level(path, [(10.0, -5.0, 12.0, 5.0)])
+        self.game.load_level(path)
+        bullet = make_bullet(ExplosionImpact(radius=5.0, falloff=0.0), x=8.0)
+        bullet.vx = 100.0
+        self.game.bullets.append(bullet)
+
+        self.game.update(0.1)
+
+        self.assertEqual(self.game.bullets, [])
+        self.assertEqual(self.prop.health, 60)
+
+    def test_explodes_when_it_runs_out_of_range(self):
+        bullet = make_bullet(ExplosionImpact(radius=5.0, falloff=0.0), x=8.0)
+        bullet.ttl = 0.05
+        self.game.bullets.append(bullet)
+
+        self.game.update(0.1)
+
+        self.assertEqual(self.game.bullets, [])
+        self.assertEqual(self.prop.health, 60)
+
+    def test_player_hit_does_not_explode_twice(self):
+        bullet = make_bullet(ExplosionImpact(radius=5.0, falloff=0.0), x=9.0, y=3.0)
+        self.game.bullets.append(bullet)
+
+        bullet.impact(self.prop)
+        self.game.update(0.1)
+
+        self.assertEqual(self.prop.health, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for seeded weapon spread and the Monte-Carlo balance simulator."""
+
+import math
+import random
+import unittest
+
+from core.game import Game
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import GLOCK_17
+from tools import balance
+
+GLOCKS = balance.Matchup(balance.Loadout("Glock 17"), balance.Loadout("Glock 17"))
+
+
+class TestSpread(unittest.TestCase):
+    def fire(self, rng):
+        game = Game(text_output=False)
+        game.switch_state(game.playing_state)
+        game.weapons.rng = rng
+        player = Player("Shooter", "hunter", game)
+        player.attempt_pickup_weapon(Gun(GLOCK_17))
+        player.attempt_use_weapon()
+        bullet = game.bullets[-1]
+        return math.degrees(math.atan2(bullet.vy, bullet.vx))
+
+    def test_no_rng_fires_straight(self):
+        self.assertEqual(self.fire(None), 0.0)
+
+    def test_seeded_spread_is_bounded_and_reproducible(self):
+        angle = self.fire(random.Random(7))
+        self.assertNotEqual(angle, 0.0)
+        self.assertLessEqual(abs(angle), GLOCK_17.spread_deg / 2)
+        self.assertEqual(self.fire(random.Random(7)), angle)
+
+
+class TestBalance(unittest.TestCase):
+    def test_same_seed_same_outcomes(self):
+        first = balance.simulate(GLOCKS, "seed", 20)
+        second = balance.simulate(GLOCKS, "seed", 20)
+        self.assertEqual(first, second)
+        self.assertEqual(first.wins_a + first.wins_b + first.draws, 20)
+        self.assertEqual(len(first.ttk_a), first.wins_a)
+
+    def test_damage_multiplier_wins_more(self):
+        boosted = balance.Matchup(balance.Loadout("Glock 17", 1.5), balance.Loadout("Glock 17"))
+        report = balance.sweep([boosted], duels=40, workers=1)[0]
+        self.assertGreater(report.win_rate_a, 0.8)
+        stats = report.ttk_stats(report.result.ttk_a)
+        self.assertLessEqual(stats["p10"], stats["p50"])
+        self.assertLessEqual(stats["p50"], stats["p90"])
+        self.assertIn("Glock 17 x1.5 vs Glock 17", report.format())
+
+    def test_pool_matches_single_process(self):
+        matchups = balance.default_matchups()
+        self.assertEqual(len(matchups), 4)
+        inline = balance.sweep(matchups[:2], duels=6, seed=3, workers=1, batch_size=4)
+        pooled = balance.sweep(matchups[:2], duels=6, seed=3, workers=2, batch_size=4)
+        self.assertEqual([r.result for r in inline], [r.result for r in pooled])
+
+
+if __name__ == "__main__":
+    unittest.main()
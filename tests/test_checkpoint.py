@@ -0,0 +1,150 @@
+"""Tests for crash-safe match checkpoints and restoring from them."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from core import checkpoint
+from core.checkpoint import Checkpointer
+from core.game import Game
+from entities.effects.apply_shot_value_modifier_effect import ApplyShotValueModifierEffect
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_catalog import GunCatalog
+from entities.weapons.gun_library import AR_15, GLOCK_17
+from entities.weapons.shot_values.damage_multiplier import DamageMultiplier
+
+
+def build_match():
+    game = Game(text_output=False)
+    game.switch_state(game.playing_state)
+    hunter = Player("Hunter", "hunter", game)
+    hunter.attempt_pickup_weapon(Gun(AR_15))
+    hunter.attempt_add_effect(ApplyShotValueModifierEffect(DamageMultiplier(2.0)))
+    reloader = Player("Reloader", "hunter", game)
+    reloader.position = (0.0, 5.0)
+    reloader.attempt_pickup_weapon(Gun(GLOCK_17, starting_ammo=3))
+    prop = Player("Prop", "prop", game)
+    prop.position = (10.0, 0.0)
+    victim = Player("Victim", "prop", game)
+    victim.position = (10.0, 0.0)
+    victim.health = 10
+    game.damage.record(victim, 50, "Hunter")
+    game.update(0.1)
+
+    hunter.attempt_hold_trigger(True)
+    reloader.attempt_reload()
+    game.update(0.05)
+    return game
+
+
+def describe(game):
+    """Comparable summary of a match."""
+    return (
+        round(game.time, 9),
+        type(game.state).__name__,
+        [
+            [
+                (
+                    p.name, p.position, p.health, p.current_weapon_slot,
+                    [(slot, w.name, w.ammo, w.reloading) for slot, w in p.loadout.items() if w],
+                )
+                for p in roster
+            ]
+            for roster in (game.hunters, game.props, game.guardian_angels)
+        ],
+        [(round(b.x, 6), round(b.y, 6), b.damage) for b in game.bullets],
+    )
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_restore_matches_original_and_plays_on_identically(self):
+        game = build_match()
+        with Checkpointer(self.tmp) as checkpoints:
+            checkpoints.checkpoint(game, "m1")
+            checkpoints.flush()
+            restored = checkpoints.restore("m1")
+
+        self.assertEqual(describe(restored), describe(game))
+        self.assertEqual([p.name for p in restored.guardian_angels], ["Victim"])
+        self.assertTrue(restored.bullets)
+
+        for _ in range(40):
+            game.update(0.05)
+            restored.update(0.05)
+        self.assertEqual(describe(restored), describe(game))
+        # The reload and held trigger carried over.
+        self.assertEqual(restored.find_player("Reloader").loadout["primary"].ammo, GLOCK_17.mag_size)
+        self.assertLess(restored.find_player("Prop").health, 100)
+
+    def test_file_is_replaced_atomically(self):
+        game = build_match()
+        with Checkpointer(self.tmp) as checkpoints:
+            checkpoints.checkpoint(game, "m1")
+            checkpoints.flush()
+            game.update(0.5)
+            checkpoints.checkpoint(game, "m1")
+            checkpoints.flush()
+            self.assertEqual(checkpoints.saved_matches(), ["m1"])
+            self.assertEqual(checkpoints.written, 2)
+
+        self.assertEqual(os.listdir(self.tmp), ["m1.ckpt"])
+        self.assertAlmostEqual(checkpoint.read(os.path.join(self.tmp, "m1.ckpt")).time, game.time)
+
+        bad = os.path.join(self.tmp, "bad.ckpt")
+        with open(bad, "wb") as f:
+            f.write(b"not a checkpoint")
+        with self.assertRaises(ValueError):
+            checkpoint.read(bad)
+
+    def test_guns_restore_from_their_own_catalog(self):
+        path = os.path.join(self.tmp, "guns.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"guns": [{
+                "name": "Event Gun", "mag_size": 3, "damage": 7,
+                "bullet_speed": 20.0, "spread_deg": 0.0,
+            }]}, f)
+        game = Game(text_output=False)
+        player = Player("Hunter", "hunter", game)
+        player.attempt_pickup_weapon(Gun(GunCatalog(path).by_name("Event Gun")))
+
+        restored = checkpoint.restore(checkpoint.capture(game))
+
+        gun = restored.find_player("Hunter").loadout["primary"]
+        self.assertEqual(gun.spec.name, "Event Gun")
+        self.assertEqual(str(gun.spec.catalog.path), path)
+
+    def test_tick_checkpoints_every_interval(self):
+        game = Game(text_output=False)
+        with Checkpointer(self.tmp, interval=1.0) as checkpoints:
+            taken = []
+            for _ in range(25):
+                game.update(0.1)
+                taken.append(checkpoints.tick(game, "m1"))
+            self.assertEqual(sum(taken), 3)
+
+            checkpoints.forget("m1")
+            self.assertEqual(checkpoints.saved_matches(), [])
+
+    def test_capture_stays_within_budget(self):
+        game = Game(text_output=False)
+        for i in range(100):
+            player = Player(f"H{i}", "hunter", game)
+            player.attempt_pickup_weapon(Gun(AR_15))
+            Player(f"P{i}", "prop", game).position = (float(i), 0.0)
+
+        with Checkpointer(self.tmp) as checkpoints:
+            for _ in range(5):
+                checkpoints.checkpoint(game, "big")
+            # Best of several runs, to keep a busy machine from failing this.
+            self.assertLess(min(checkpoints.costs), checkpoints.budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for end-of-tick damage resolution."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from core.game import Game
+from entities.player import Player
+
+
+class TestDamageController(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.prop = Player("Prop", "prop", self.game)
+        self.other_prop = Player("Other Prop", "prop", self.game)
+
+    def test_damage_is_deferred_until_resolve(self):
+        self.game.damage.record(self.prop, 30, "Hunter")
+
+        self.assertEqual(self.prop.health, 100)
+        self.game.damage.resolve()
+        self.assertEqual(self.prop.health, 70)
+        self.assertEqual(self.game.damage.pending(), 0)
+
+    def test_overkill_from_many_pellets_handles_death_once(self):
+        self.game._handle_player_death = MagicMock()
+        for _ in range(8):
+            self.game.damage.record(self.prop, 25, "Hunter")
+
+        dead = self.game.damage.resolve()
+
+        self.assertEqual(dead, [self.prop])
+        self.assertEqual(self.prop.health, 0)
+        self.game._handle_player_death.assert_called_once_with(
+            self.prop, killer="Hunter"
+        )
+
+    def test_deaths_resolve_in_first_hit_order(self):
+        self.game.damage.record(self.other_prop, 60, "Hunter")
+        self.game.damage.record(self.prop, 100, "Hunter")
+        self.game.damage.record(self.other_prop, 60, "Hunter")
+
+        dead = self.game.damage.resolve()
+
+        self.assertEqual(dead, [self.other_prop, self.prop])
+        self.assertEqual(self.game.props, [])
+        self.assertEqual(
+            self.game.guardian_angels, [self.other_prop, self.prop]
+        )
+
+    def test_game_update_resolves_recorded_damage(self):
+        self.game.damage.record(self.prop, 100, "Hunter")
+
+        self.game.update(0.1)
+
+        self.assertNotIn(self.prop, self.game.props)
+        self.assertIn(self.prop, self.game.guardian_angels)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Tests for the baked signed distance field and wall sliding."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from core.game import Game
+from entities.player import Player
+from level.distance_field import CACHE_HEADER, DistanceField
+from level.level import Level, write_level
+
+BOXES = [(10.0, -5.0, 12.0, 5.0)]
+SEGMENTS = [(0.0, 10.0, 8.0, 10.0)]
+
+
+class TestDistanceField(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, "arena.ctpl")
+        write_level(self.path, BOXES, SEGMENTS)
+        self.level = Level.load(self.path)
+        self.field = DistanceField.bake(self.level, cell_size=0.25)
+
+    def test_distances_are_signed(self):
+        self.assertAlmostEqual(self.field.sample(9.0, 0.0), 1.0, places=5)
+        self.assertAlmostEqual(self.field.sample(11.0, 0.0), -1.0, places=5)
+        self.assertAlmostEqual(self.field.sample(4.0, 9.5), 0.5, places=5)
+        self.assertEqual(self.field.sample(-100.0, 0.0), self.field.max_distance)
+
+    def test_cache_is_keyed_by_level_hash_and_reused(self):
+        cache = os.path.join(self.tmp, "cache")
+        first = DistanceField.load_or_bake(self.level, cache)
+
+        with patch.object(DistanceField, "bake") as bake:
+            second = DistanceField.load_or_bake(Level.load(self.path), cache)
+        bake.assert_not_called()
+        self.assertEqual(second.values, first.values)
+
+        write_level(self.path, BOXES)
+        DistanceField.load_or_bake(Level.load(self.path), cache)
+        self.assertEqual(len(os.listdir(cache)), 2)
+
+    def test_truncated_cache_is_rebaked(self):
+        cache = os.path.join(self.tmp, "cache")
+        first = DistanceField.load_or_bake(self.level, cache)
+        (name,) = os.listdir(cache)
+        path = os.path.join(cache, name)
+        with open(path, "r+b") as f:
+            f.truncate(CACHE_HEADER.size + 400)
+
+        second = DistanceField.load_or_bake(Level.load(self.path), cache)
+        self.assertEqual(second.values, first.values)
+        self.assertEqual(DistanceField.read(path).values, first.values)
+
+    def test_move_into_wall_slides_along_it(self):
+        x, y = self.field.resolve_move((8.0, 0.0), (11.0, 3.0), radius=0.5)
+
+        self.assertLess(x, 9.55)
+        self.assertGreater(x, 9.4)
+        self.assertAlmostEqual(y, 3.0, places=3)
+
+    def test_long_move_cannot_tunnel_through_thin_wall(self):
+        x, y = self.field.resolve_move((4.0, 8.0), (4.0, 14.0), radius=0.5)
+
+        self.assertLess(y, 10.0)
+
+    def test_level_delegates_batch_moves_to_attached_field(self):
+        self.level.distance_field = self.field
+
+        moved = self.level.resolve_moves(
+            [(8.0, 0.0), (0.0, -8.0)],
+            [(11.0, 0.0), (1.0, -8.0)],
+            [0.5, 0.5],
+        )
+
+        self.assertLess(moved[0][0], 9.55)
+        self.assertEqual(moved[1], (1.0, -8.0))
+
+    def test_clear_paths_never_touch_the_field(self):
+        self.level.distance_field = self.field
+
+        with patch.object(DistanceField, "sample") as sample:
+            moved = self.level.resolve_move((0.0, 0.0), (0.0, -9.0), 0.5)
+            batch = self.level.resolve_moves([(0.0, 0.0)], [(5.0, -3.0)], [0.5])
+        sample.assert_not_called()
+        self.assertEqual(moved, (0.0, -9.0))
+        self.assertEqual(batch, [(5.0, -3.0)])
+
+    def test_field_resolution_keeps_thin_walls_solid(self):
+        self.level.distance_field = self.field
+
+        for start, end in (((4.0, 8.0), (4.0, 40.0)), ((4.0, 12.0), (5.0, -20.0))):
+            x, y = self.level.resolve_move(start, end, 0.5)
+            self.assertEqual(y < 10.0, start[1] < 10.0)
+        (x, y), = self.level.resolve_moves([(4.0, 8.0)], [(4.0, 40.0)], [0.5])
+        self.assertLess(y, 10.0)
+
+
+class TestDistanceFieldInGame(unittest.TestCase):
+    def test_knockback_into_wall_is_resolved(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, "arena.ctpl")
+        write_level(path, BOXES)
+        game = Game(text_output=False)
+        game.load_level(path, sdf_cache_dir=os.path.join(tmp, "cache"))
+        prop = Player("Prop", "prop", game)
+        prop.position = (8.0, 0.0)
+
+        game.physics.apply_impulse(prop, (200.0, 0.0))
+        for _ in range(10):
+            game.update(0.05)
+
+        self.assertLess(prop.position[0], 10.0 - prop.hit_radius + 0.05)
+
+    def test_gateway_resolves_a_ticks_moves_in_one_batch(self):
+        from net import frames
+        from net.gateway import Gateway
+
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, "arena.ctpl")
+        write_level(path, BOXES)
+        game = Game(text_output=False)
+        game.load_level(path, sdf_cache_dir=os.path.join(tmp, "cache"))
+        game.switch_state(game.playing_state)
+        gateway = Gateway(game)
+        players = [Player(f"P{i}", "prop", game) for i in range(3)]
+        for i, player in enumerate(players):
+            session = SimpleNamespace(player=player)
+            player.position = (8.0, float(i))
+            gateway._intents.append((session, "move", ((20.0, float(i)), 1)))
+        gateway._intents.append((session, "use_weapon", (None, 2)))
+
+        calls = []
+        resolve_moves = game.level.resolve_moves
+
+        def spy(*args):
+            calls.append(len(args[0]))
+            return resolve_moves(*args)
+
+        with patch.object(game.level, "resolve_moves", spy):
+            gateway.apply_intents()
+
+        self.assertEqual(calls, [3])
+        for player in players:
+            self.assertLess(player.position[0], 10.0 - player.hit_radius + 0.01)
+        self.assertEqual(game.inputs.last_processed(players[2]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
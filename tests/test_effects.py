@@ -1,7 +1,6 @@
 """Tests for the current composed effect system."""
 
 import unittest
-from unittest.mock import MagicMock
 
 from core.game import Game
 from entities.effects.active_effects import ActiveEffects
@@ -175,14 +174,13 @@ class TestEffectIntegration(unittest.TestCase):
         bullet = self.game.bullets[-1]
 
         target = Player("Target", "prop", self.game)
-        target.update = MagicMock()
 
         bullet.impact(target)
+        self.game.damage.resolve()
 
         self.assertEqual(target.health, 100 - AR_15.damage)
-        target.update.assert_called_once_with(
-            f"BONK! Yeet strength: {AR_15.damage * 1.0}"
-        )
+        self.assertEqual(target.velocity, (AR_15.damage * 1.0, 0.0))
+        self.assertTrue(self.game.physics.is_active(target))
         self.assertFalse(bullet.alive)
 
     def test_shot_and_movement_effects_work_independently(self):
@@ -0,0 +1,176 @@
+"""Tests for the typed per-tick event stream."""
+
+import unittest
+from unittest.mock import MagicMock, call
+
+from core.event_stream import EventStream
+from core.events import (
+    ActionDenied,
+    PlayerDied,
+    ShotFired,
+    SlotSwitched,
+    WeaponPickedUp,
+)
+from core.game import Game
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+
+class TestEventStream(unittest.TestCase):
+    def test_buffer_is_reused_and_grows_only_when_full(self):
+        stream = EventStream(capacity=2)
+        received = []
+        stream.subscribe(lambda events: received.append(list(events)))
+
+        for i in range(3):
+            stream.emit(i)
+        stream.flush()
+        stream.emit("next")
+        stream.flush()
+
+        self.assertEqual(received, [[0, 1, 2], ["next"]])
+        self.assertEqual(len(stream), 0)
+
+    def test_sinks_see_the_time_of_each_event(self):
+        stream = EventStream(capacity=1)
+        received = []
+        stream.subscribe(lambda events: received.append(list(zip(stream.times, events))))
+
+        stream.emit("first", 1.0)
+        stream.emit("second", 1.25)
+        stream.flush()
+
+        self.assertEqual(received, [[(1.0, "first"), (1.25, "second")]])
+
+    def test_flush_hands_sinks_a_view_and_clears_the_slots(self):
+        stream = EventStream(capacity=4)
+        seen = []
+        stream.subscribe(lambda events: seen.append(events))
+        stream.subscribe(lambda events: seen.append(events[-1]))
+
+        stream.emit("first")
+        stream.emit("second")
+        stream.flush()
+
+        view, last = seen
+        self.assertIs(view, stream._events)
+        self.assertEqual(last, "second")
+        self.assertEqual(len(view), 0)
+        self.assertEqual(stream._buffer, [None] * 4)
+
+    def test_events_emitted_by_a_sink_wait_for_the_next_flush(self):
+        stream = EventStream(capacity=2)
+        received = []
+
+        def sink(events):
+            received.append(list(events))
+            if "first" in events:
+                stream.emit("echo", 2.0)
+
+        stream.subscribe(sink)
+        stream.emit("first", 1.0)
+        stream.flush()
+        stream.flush()
+
+        self.assertEqual(received, [["first"], ["echo"]])
+        self.assertEqual(stream._buffer[:2], [None, None])
+
+    def test_flush_without_events_does_not_call_sinks(self):
+        stream = EventStream()
+        sink = MagicMock()
+        stream.subscribe(sink)
+
+        stream.flush()
+
+        sink.assert_not_called()
+
+
+class TestGameEvents(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.game.switch_state(self.game.playing_state)
+        self.game.events.flush()
+
+    def test_weapon_actions_emit_typed_events(self):
+        self.hunter.attempt_pickup_weapon(Gun(AR_15))
+        self.hunter.attempt_use_weapon()
+        self.hunter.attempt_switch_slot("secondary")
+        self.hunter.attempt_switch_slot("holster")
+
+        events = list(self.game.events)
+
+        self.assertEqual(
+            events[:3],
+            [
+                WeaponPickedUp(self.hunter, "AR-15", "primary"),
+                ShotFired(self.hunter, "AR-15"),
+                SlotSwitched(self.hunter, "secondary"),
+            ],
+        )
+        self.assertIsInstance(events[3], ActionDenied)
+        self.assertEqual(events[3].render(), "Invalid slot: holster")
+
+    def test_headless_game_never_renders_text(self):
+        self.hunter.update = MagicMock()
+        self.hunter.attempt_pickup_weapon(Gun(AR_15))
+        self.hunter.attempt_use_weapon()
+
+        self.game.update(0.1)
+
+        self.hunter.update.assert_not_called()
+        self.assertEqual(len(self.game.events), 0)
+
+    def test_death_is_reported_once_as_player_died(self):
+        prop = Player("Prop", "prop", self.game)
+        for _ in range(3):
+            self.game.damage.record(prop, 50, "Hunter")
+        events = []
+        self.game.events.subscribe(events.extend)
+
+        self.game.update(0.1)
+
+        deaths = [e for e in events if isinstance(e, PlayerDied)]
+        self.assertEqual(deaths, [PlayerDied(prop, "Hunter")])
+
+
+class TestPlayerTextSink(unittest.TestCase):
+    def test_text_is_rendered_on_flush_for_recipients(self):
+        game = Game()
+        hunter = Player("Hunter", "hunter", game)
+        prop = Player("Prop", "prop", game)
+        game.switch_state(game.playing_state)
+        game.events.flush()
+        hunter.update = MagicMock()
+        prop.update = MagicMock()
+
+        hunter.attempt_pickup_weapon(Gun(AR_15))
+        hunter.attempt_use_weapon()
+        hunter.update.assert_not_called()
+
+        game.update(0.0)
+
+        hunter.update.assert_any_call("Fired AR-15")
+        prop.update.assert_called_once_with(
+            "Hunter picked up AR-15 into primary."
+        )
+
+    def test_broadcasts_reach_the_roster_at_emit_time(self):
+        game = Game()
+        hunter = Player("Hunter", "hunter", game)
+        prop = Player("Prop", "prop", game)
+        hunter.update = MagicMock()
+        prop.update = MagicMock()
+
+        game.events.flush()
+
+        self.assertEqual(
+            hunter.update.call_args_list,
+            [call("Hunter has joined the Hunters!"), call("Prop has joined the Props!")],
+        )
+        prop.update.assert_called_once_with("Prop has joined the Props!")
+
+
+if __name__ == "__main__":
+    unittest.main()
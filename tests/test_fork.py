@@ -0,0 +1,111 @@
+"""Tests for copy-on-write Game forking."""
+
+import unittest
+
+from core.game import Game
+from core.game_pool import GamePool
+from entities.effects.apply_movement_modifier_effect import ApplyMovementModifierEffect
+from entities.movement.modifiers.speed_multiplier import SpeedMultiplier
+from entities.objectives.capture_zone import CaptureZone
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+
+class TestFork(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.game.switch_state(self.game.playing_state)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.prop = Player("Prop", "prop", self.game)
+        self.prop.position = (4.0, 0.0)
+        self.gun = Gun(AR_15)
+        self.hunter.attempt_pickup_weapon(self.gun)
+        self.game.objectives.add_zone(CaptureZone("Base", "Props", (10.0, 10.0), (12.0, 12.0)))
+        self.game.objectives.issue_flags()
+        self.game.update(1 / 30)
+
+    def snapshot(self):
+        return (
+            self.hunter.position,
+            self.prop.position,
+            self.prop.health,
+            self.gun.ammo,
+            self.gun.next_fire_time,
+            len(self.game.bullets),
+            len(self.game.timers),
+            self.game.time,
+            self.game.objectives.flag_of(self.hunter) is not None,
+            self.hunter.status.ragdolled,
+        )
+
+    def test_fork_sees_the_match(self):
+        fork = self.game.fork()
+        hunter = fork.find_player("Hunter")
+        self.assertEqual(hunter.position, self.hunter.position)
+        self.assertEqual(hunter.loadout["primary"].ammo, self.gun.ammo)
+        self.assertIs(fork.state, fork.playing_state)
+        self.assertEqual(fork.time, self.game.time)
+        self.assertIsNotNone(fork.objectives.flag_of(hunter))
+
+    def test_stepping_a_fork_leaves_the_source_untouched(self):
+        before = self.snapshot()
+
+        fork = self.game.fork()
+        hunter = fork.find_player("Hunter")
+        prop = fork.find_player("Prop")
+        hunter.attempt_hold_trigger(True)
+        hunter.attempt_add_effect(ApplyMovementModifierEffect(SpeedMultiplier(3.0)))
+        hunter.attempt_move((0.1, 0.0))
+        prop.attempt_move((4.0, 0.0))
+        for _ in range(30):
+            fork.update(1 / 30)
+
+        self.assertLess(prop.health, 100)
+        self.assertLess(hunter.loadout["primary"].ammo, AR_15.mag_size)
+        self.assertEqual(self.snapshot(), before)
+        self.assertEqual(self.hunter.active_effects._movement_effects, {})
+
+    def test_fork_matches_stepping_the_real_game(self):
+        def step(game):
+            game.find_player("Hunter").attempt_hold_trigger(True)
+            for _ in range(20):
+                game.update(1 / 30)
+            prop = game.find_player("Prop")
+            return prop.health if prop else None, len(game.bullets), game.time
+
+        forked = step(self.game.fork())
+        self.assertEqual(step(self.game), forked)
+
+    def test_timers_follow_into_the_fork(self):
+        self.gun.ammo = 0
+        self.hunter.attempt_reload()
+        fork = self.game.fork()
+        fork.update(AR_15.reload_time + 0.1)
+
+        self.assertEqual(fork.find_player("Hunter").loadout["primary"].ammo, AR_15.mag_size)
+        self.assertEqual(self.gun.ammo, 0)
+        self.assertTrue(self.gun.reloading)
+
+    def test_untouched_players_are_not_copied(self):
+        for i in range(50):
+            Player(f"Bystander{i}", "prop", self.game)
+        fork = self.game.fork()
+        fork.find_player("Hunter").attempt_move((1.0, 1.0))
+
+        bystander = fork.find_player("Bystander7")
+        self.assertNotIn("status", vars(bystander))
+        self.assertNotIn("loadout", vars(bystander))
+        self.assertNotIn("position", vars(bystander))
+
+    def test_fork_from_pool(self):
+        pool = GamePool(size=1)
+        fork = self.game.fork(pool)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(len(fork.hunters), 1)
+        pool.release(fork)
+        self.assertEqual(self.game.find_player("Hunter"), self.hunter)
+
+
+if __name__ == "__main__":
+    unittest.main()
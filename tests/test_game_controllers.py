@@ -91,6 +91,7 @@ class TestGameControllerRefactor(unittest.TestCase):
         player.attempt_pickup_weapon(Gun(AR_15, starting_ammo=2))
 
         player.attempt_use_weapon()
+        game.update(1.0 / AR_15.fire_rate)
         player.attempt_use_weapon()
         dead_bullet, live_bullet = game.bullets
         dead_bullet.ttl = 0.0
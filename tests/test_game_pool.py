@@ -0,0 +1,102 @@
+"""Tests for Game.reset, the pre-warmed GamePool and lazy subsystem imports."""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from core.game import Game
+from core.game_pool import GamePool
+from entities.objectives.capture_zone import CaptureZone
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+
+def play(game):
+    game.switch_state(game.playing_state)
+    hunter = Player("Hunter", "hunter", game)
+    prop = Player("Prop", "prop", game)
+    prop.position = (3.0, 0.0)
+    game.objectives.add_zone(CaptureZone("Base", "Props", (0.0, 0.0), (1.0, 1.0)))
+    game.objectives.issue_flags()
+    game.possession.place([("Crate", (0.0, 0.0))])
+    hunter.attempt_pickup_weapon(Gun(AR_15))
+    hunter.attempt_hold_trigger(True)
+    prop.attempt_move((2.5, 0.0), seq=1)
+    for _ in range(10):
+        game.update(1 / 30)
+    return prop.health, len(game.bullets), game.time
+
+
+class TestGameReset(unittest.TestCase):
+    def test_reset_clears_the_match(self):
+        game = Game(text_output=False)
+        play(game)
+        game.reset()
+
+        self.assertEqual((game.hunters, game.props, game.guardian_angels), ([], [], []))
+        self.assertEqual(game.bullets, [])
+        self.assertIs(game.state, game.preparing_state)
+        self.assertEqual(game.time, 0.0)
+        self.assertEqual(len(game.timers), 0)
+        self.assertEqual(len(game.events), 0)
+        self.assertEqual(game.objectives.flags, [])
+        self.assertEqual(game.objectives.scores, {"Hunters": 0, "Props": 0})
+        self.assertEqual(game.possession.instances, [])
+
+    def test_reset_game_replays_like_a_fresh_one(self):
+        game = Game(text_output=False)
+        first = play(game)
+        game.reset()
+        self.assertEqual(play(game), first)
+        self.assertEqual(play(Game(text_output=False)), first)
+
+    def test_reset_reuses_history_buffers(self):
+        game = Game(text_output=False)
+        play(game)
+        buffers = set(map(id, game.lag._histories.values()))
+        game.reset()
+        play(game)
+        self.assertEqual(set(map(id, game.lag._histories.values())), buffers)
+
+
+class TestGamePool(unittest.TestCase):
+    def test_acquire_reuses_released_games(self):
+        pool = GamePool(size=2)
+        self.assertEqual(len(pool), 2)
+
+        game = pool.acquire()
+        play(game)
+        pool.release(game)
+        self.assertIs(pool.acquire(), game)
+        self.assertEqual(game.hunters, [])
+
+    def test_empty_pool_builds_new_games(self):
+        pool = GamePool()
+        self.assertIsInstance(pool.acquire(), Game)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_rarely_used_subsystems_load_on_demand(self):
+        code = (
+            "import sys, core.game, entities.player\n"
+            "game = core.game.Game(text_output=False)\n"
+            "prop = entities.player.Player('Prop', 'prop', game)\n"
+            "prop.attempt_move((1.0, 0.0))\n"
+            "game.update(0.1)\n"
+            "game.remove_player(prop)\n"
+            "lazy = ['level.level', 'level.distance_field', 'concurrent.futures',"
+            " 'entities.props.prop_catalog', 'entities.props.prop_instance',"
+            " 'core.possession_controller', 'core.navigation_controller']\n"
+            "print(','.join(m for m in lazy if m in sys.modules))\n"
+        )
+        root = Path(__file__).resolve().parent.parent
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(out.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+"""Tests for the asyncio gateway, using in-process stand-in clients."""
+
+import asyncio
+import math
+import unittest
+
+from core.game import Game
+from net import frames
+from net.client_outbox import ClientOutbox
+from net.gateway import Gateway
+
+
+class StandInWriter:
+    """Collects what the gateway writes; drain() can be held to act slow."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+        self.unblocked = asyncio.Event()
+        self.unblocked.set()
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        await self.unblocked.wait()
+
+    def close(self):
+        self.closed = True
+
+    def frames(self):
+        out = []
+        view = bytes(self.data)
+        while view:
+            length, opcode = frames.HEADER.unpack_from(view)
+            start = frames.HEADER.size
+            out.append((opcode, view[start:start + length]))
+            view = view[start + length:]
+        return out
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestFrames(unittest.TestCase):
+    def test_intents_round_trip(self):
+        def decode(frame):
+            length, opcode = frames.HEADER.unpack_from(frame)
+            return frames.decode_intent(opcode, frame[frames.HEADER.size:])
+
+        self.assertEqual(decode(frames.hello("Ann", "prop")), ("join", ("Ann", "prop")))
+        self.assertEqual(decode(frames.move(3, 1.5, -2.0)), ("move", ((1.5, -2.0), 3)))
+        self.assertEqual(decode(frames.use_weapon(4)), ("use_weapon", (None, 4)))
+        self.assertEqual(decode(frames.hold_trigger(True)), ("hold_trigger", (True,)))
+
+    def test_malformed_frames_are_rejected(self):
+        with self.assertRaises(frames.ProtocolError):
+            frames.decode_intent(frames.MOVE, b"\x00")
+        with self.assertRaises(frames.ProtocolError):
+            frames.decode_intent(200, b"")
+        for frame in (frames.move(1, math.nan, 0.0), frames.move(1, 0.0, math.inf),
+                      frames.use_weapon(1, -math.inf)):
+            with self.assertRaises(frames.ProtocolError):
+                frames.decode_intent(frame[frames.HEADER.size - 1], frame[frames.HEADER.size:])
+
+
+class TestClientOutbox(unittest.IsolatedAsyncioTestCase):
+    async def test_state_is_coalesced_and_messages_are_bounded(self):
+        outbox = ClientOutbox(asyncio.get_running_loop(), capacity=4)
+        for i in range(10):
+            outbox.push_message(frames.message(str(i)))
+            outbox.set_state(frames.state(i, 0, 100.0))
+
+        self.assertEqual(outbox.dropped, 6)
+        self.assertEqual(outbox.coalesced, 9)
+
+        batch = await outbox.next_batch()
+        self.assertEqual([f[3:] for f in batch[:4]], [b"6", b"7", b"8", b"9"])
+        self.assertEqual(frames.decode_state(batch[4][3:])[0], 9.0)
+
+        outbox.close()
+        self.assertIsNone(await outbox.next_batch())
+
+
+class TestGateway(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.game = Game(text_output=False)
+        self.game.switch_state(self.game.playing_state)
+        self.gateway = Gateway(self.game)
+
+    def connect(self, *data):
+        reader = asyncio.StreamReader()
+        for frame in data:
+            reader.feed_data(frame)
+        writer = StandInWriter()
+        task = asyncio.create_task(self.gateway.handle_connection(reader, writer))
+        return reader, writer, task
+
+    async def test_client_joins_moves_and_receives_state(self):
+        reader, writer, task = self.connect(frames.hello("Ann", "prop"), frames.move(1, 2.0, 3.0))
+        await settle()
+        self.gateway.tick(0.1)
+        await settle()
+
+        ann = self.game.find_player("Ann")
+        self.assertIn(ann, self.game.props)
+        self.assertEqual(ann.position, (2.0, 3.0))
+
+        received = writer.frames()
+        self.assertIn((frames.MESSAGE, b"Ann has joined the Props!"), received)
+        opcode, payload = received[-1]
+        self.assertEqual(opcode, frames.STATE)
+        _, seq, health = frames.decode_state(payload)
+        self.assertEqual((seq, health), (1, 100.0))
+        # The move landed where the client predicted: acked, not corrected.
+        self.assertNotIn(frames.CORRECTION, [opcode for opcode, _ in received])
+
+        reader.feed_eof()
+        await task
+        self.gateway.apply_intents()
+        self.assertTrue(writer.closed)
+
+    async def test_corrections_are_sent_only_when_the_client_is_off(self):
+        reader, writer, task = self.connect(frames.hello("Ann", "prop"), frames.move(1, 2.0, 3.0))
+        await settle()
+        self.gateway.tick(0.1)
+        await settle()
+        ann = self.game.find_player("Ann")
+
+        def corrections():
+            sent = [frames.decode_correction(p) for o, p in writer.frames() if o == frames.CORRECTION]
+            writer.data.clear()
+            return sent
+
+        self.assertEqual(corrections(), [])
+
+        ann.status.ragdolled = True
+        reader.feed_data(frames.move(2, 4.0, 3.0))
+        await settle()
+        self.gateway.tick(0.1)
+        await settle()
+        self.assertEqual(corrections(), [(2, 2.0, 3.0)])
+
+        ann.status.ragdolled = False
+        ann.position = (5.0, 3.0)  # pushed by the server, not by an input
+        self.gateway.tick(0.1)
+        await settle()
+        self.assertEqual(corrections(), [(2, 5.0, 3.0)])
+
+        self.gateway.tick(0.1)
+        await settle()
+        self.assertEqual(corrections(), [])
+
+        reader.feed_eof()
+        await task
+
+    async def test_slow_client_does_not_stall_ticks(self):
+        reader, writer, task = self.connect(frames.hello("Slow", "hunter"))
+        await settle()
+        self.gateway.tick(0.1)
+        await settle()
+
+        writer.unblocked.clear()
+        writer.data.clear()
+        for _ in range(100):
+            self.game.notify_all("spam")
+            self.gateway.tick(0.1)
+        await settle()
+
+        session = next(iter(self.gateway._sessions.values()))
+        self.assertLessEqual(len(session.outbox), self.gateway.send_capacity + 1)
+        self.assertGreater(session.outbox.coalesced, 0)
+        self.assertGreater(session.outbox.dropped, 0)
+
+        writer.unblocked.set()
+        reader.feed_eof()
+        await task
+
+    async def test_leaving_removes_the_player(self):
+        reader, writer, task = self.connect(frames.hello("Carrier", "prop"))
+        other_reader, other_writer, other_task = self.connect(frames.hello("Stays", "hunter"))
+        await settle()
+        self.gateway.tick(0.1)
+        carrier = self.game.find_player("Carrier")
+        carrier.attempt_hold_trigger(True)
+        self.game.lag.record_all(self.game.time)
+
+        reader.feed_eof()
+        await task
+        self.gateway.tick(0.1)
+        await settle()
+
+        self.assertIsNone(self.game.find_player("Carrier"))
+        self.assertNotIn(carrier, self.game.props)
+        self.assertNotIn(carrier, self.game.guardian_angels)
+        self.assertEqual(self.game.weapons.held_triggers(), [])
+        self.assertNotIn(carrier, self.game.lag._histories)
+        self.assertIn((frames.MESSAGE, b"Carrier has left the game."), other_writer.frames())
+
+        other_reader.feed_eof()
+        await other_task
+
+    async def test_protocol_error_disconnects(self):
+        reader, writer, task = self.connect(frames.hello("Bad", "hunter"), frames.encode_frame(99))
+        await task
+        self.gateway.apply_intents()
+        self.assertTrue(writer.closed)
+        self.assertEqual(self.gateway._sessions, {})
+
+    async def test_non_finite_move_disconnects_without_stopping_the_match(self):
+        reader, writer, task = self.connect(
+            frames.hello("Bad", "prop"), frames.move(1, math.nan, 0.0)
+        )
+        await task
+        for _ in range(3):
+            self.gateway.tick(0.1)
+
+        self.assertTrue(writer.closed)
+        self.assertIsNone(self.game.find_player("Bad"))
+        self.assertAlmostEqual(self.game.time, 0.3)
+
+    async def test_tcp_loopback(self):
+        server = await self.gateway.serve_tcp()
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(frames.hello("Net", "hunter"))
+        await writer.drain()
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            self.gateway.tick(0.0)
+            if self.game.find_player("Net"):
+                break
+        opcode, payload = await asyncio.wait_for(frames.read_frame(reader), 1.0)
+        self.assertEqual(opcode, frames.MESSAGE)
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for the data-driven gun catalog."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from entities.weapons.gun import Gun
+from entities.weapons.gun_catalog import GunCatalog
+from entities.weapons.gun_library import AR_15, GLOCK_17
+from entities.weapons.gun_spec import GunSpec
+from entities.weapons.impact.explosion_impact import ExplosionImpact
+from entities.weapons.travel.ballistic_travel import BallisticTravel
+
+
+def gun_entry(name="Test Gun", damage=10, **extra):
+    entry = {
+        "name": name,
+        "mag_size": 5,
+        "damage": damage,
+        "bullet_speed": 20.0,
+        "spread_deg": 1.0,
+    }
+    entry.update(extra)
+    return entry
+
+
+class TestGunCatalog(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def write(self, *entries, mtime=None):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"guns": list(entries)}, f)
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_library_specs_have_small_interned_ids(self):
+        self.assertEqual({GLOCK_17.spec_id, AR_15.spec_id}, {0, 1})
+
+    def test_guns_share_the_spec_prototype(self):
+        first = Gun(AR_15)
+        second = Gun(AR_15)
+        first.owner = second.owner = object()
+
+        self.assertIs(first.use(), second.use())
+        self.assertEqual(first.spec_id, AR_15.spec_id)
+
+    def test_behaviors_are_built_from_data(self):
+        self.write(gun_entry(
+            travel={"type": "ballistic", "gravity": [0.0, -1.0]},
+            impacts=[{"type": "explosion", "radius": 3.0, "knockback": {}}],
+        ))
+
+        spec = GunCatalog(self.path).by_name("Test Gun")
+
+        self.assertIsInstance(spec.travel_behavior, BallisticTravel)
+        self.assertIsInstance(spec.impact_behaviors[0], ExplosionImpact)
+        self.assertIsNotNone(spec.impact_behaviors[0].knockback)
+
+    def test_hot_reload_keeps_ids_and_updates_existing_guns(self):
+        self.write(gun_entry(damage=10), mtime=1_000)
+        catalog = GunCatalog(self.path)
+        gun = Gun(catalog.by_name("Test Gun"), catalog=catalog)
+        gun.owner = object()
+
+        self.assertFalse(catalog.reload_if_changed())
+        self.write(gun_entry("New Gun"), gun_entry(damage=99), mtime=2_000)
+        self.assertTrue(catalog.reload_if_changed())
+
+        self.assertEqual(catalog.id_of("Test Gun"), 0)
+        self.assertEqual(catalog.id_of("New Gun"), 1)
+        self.assertEqual(gun.use().damage, 99)
+
+    def test_bad_reload_leaves_table_intact(self):
+        self.write(gun_entry(damage=10))
+        catalog = GunCatalog(self.path)
+        self.write({"name": "Broken"})
+
+        with self.assertRaises(KeyError):
+            catalog.reload()
+
+        self.assertEqual(catalog.by_name("Test Gun").damage, 10)
+
+    def test_guns_resolve_against_the_catalog_their_spec_came_from(self):
+        self.write(gun_entry(damage=10), mtime=1_000)
+        catalog = GunCatalog(self.path)
+        # Id 0 in this catalog is a different gun from id 0 in the default one.
+        gun = Gun(catalog.by_name("Test Gun"))
+        gun.owner = object()
+
+        self.write(gun_entry(damage=42), mtime=2_000)
+        catalog.reload()
+
+        self.assertIs(gun.spec.catalog, catalog)
+        self.assertEqual(gun.use().name, "Test Gun")
+        self.assertEqual(gun.use().damage, 42)
+
+    def test_spec_from_another_catalog_is_rejected(self):
+        self.write(gun_entry())
+        other = GunCatalog(self.path)
+
+        with self.assertRaises(ValueError):
+            Gun(AR_15, catalog=other)
+
+    def test_server_tick_hot_reloads_the_catalog(self):
+        from core.game import Game
+        from net.gateway import Gateway
+
+        self.write(gun_entry(damage=10), mtime=1_000)
+        catalog = GunCatalog(self.path)
+        gateway = Gateway(Game(text_output=False), catalog=catalog)
+        gateway.tick(0.1)
+
+        self.write({"name": "Broken"}, mtime=2_000)
+        gateway.tick(gateway.catalog_check_interval)
+        self.assertEqual(gateway.catalog_reload_errors, 1)
+        self.assertEqual(catalog.by_name("Test Gun").damage, 10)
+
+        self.write(gun_entry(damage=99), mtime=3_000)
+        gateway.tick(gateway.catalog_check_interval)
+        self.assertEqual(catalog.by_name("Test Gun").damage, 99)
+
+    def test_ad_hoc_specs_still_work(self):
+        spec = GunSpec(
+            name="Prototype",
+            damage=1,
+            bullet_speed=1.0,
+            spread_deg=0.0,
+            mag_size=1,
+        )
+        gun = Gun(spec)
+        gun.owner = object()
+
+        self.assertIsNone(gun.spec_id)
+        self.assertEqual(gun.use().name, "Prototype")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for client input sequence numbers and move reconciliation."""
+
+import unittest
+
+from core.game import Game
+from entities.effects.apply_movement_modifier_effect import (
+    ApplyMovementModifierEffect,
+)
+from entities.movement.modifiers.speed_multiplier import SpeedMultiplier
+from entities.movement.move_correction import MoveCorrection
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+
+class TestInputSequencing(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.player = Player("Hunter", "hunter", self.game)
+        self.game.switch_state(self.game.playing_state)
+
+    def test_unsequenced_move_keeps_old_return_value(self):
+        self.assertIs(self.player.attempt_move((1, 0)), True)
+        self.assertIsNone(self.game.inputs.last_processed(self.player))
+
+    def test_matching_prediction_is_acknowledged_without_correction(self):
+        result = self.player.attempt_move((1, 0), seq=1)
+
+        self.assertIs(result, True)
+        self.assertEqual(self.game.inputs.last_processed(self.player), 1)
+        self.assertEqual(self.game.inputs.drain_corrections(), [])
+
+    def test_divergent_move_returns_compact_correction(self):
+        self.player.attempt_add_effect(
+            ApplyMovementModifierEffect(SpeedMultiplier(2.0))
+        )
+
+        result = self.player.attempt_move((1, 0), seq=7)
+
+        self.assertEqual(result, MoveCorrection(seq=7, position=(2.0, 0.0)))
+        self.assertEqual(
+            self.game.inputs.drain_corrections(), [(self.player, result)]
+        )
+        self.assertEqual(self.game.inputs.drain_corrections(), [])
+
+    def test_undrained_corrections_do_not_pile_up(self):
+        self.player.status.ragdolled = True
+        for seq in range(1, 101):
+            self.player.attempt_move((1, 0), seq=seq)
+            self.game.update(0.01)
+        self.player.attempt_move((1, 0), seq=101)
+
+        # Only the last update's and this tick's corrections are kept.
+        self.assertEqual(
+            [c.seq for _, c in self.game.inputs.drain_corrections()], [100, 101]
+        )
+
+    def test_denied_move_corrects_client_back_to_server_position(self):
+        self.player.status.ragdolled = True
+
+        result = self.player.attempt_move((5, 5), seq=1)
+
+        self.assertEqual(result, MoveCorrection(seq=1, position=(0, 0)))
+
+    def test_stale_and_duplicate_inputs_are_dropped(self):
+        self.player.attempt_move((3, 0), seq=5)
+
+        self.assertIsNone(self.player.attempt_move((1, 0), seq=4))
+        self.assertIsNone(self.player.attempt_move((1, 0), seq=5))
+        self.assertEqual(self.player.position, (3, 0))
+
+    def test_fire_intents_share_the_sequence(self):
+        self.player.attempt_pickup_weapon(Gun(AR_15))
+        self.player.attempt_move((1, 0), seq=1)
+
+        self.assertTrue(self.player.attempt_use_weapon(seq=2))
+        self.assertIsNone(self.player.attempt_use_weapon(seq=2))
+        self.assertEqual(len(self.game.bullets), 1)
+        self.assertEqual(self.game.inputs.last_processed(self.player), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for position history, lag-compensated rewinds and bullet hits."""
+
+import unittest
+
+from core.game import Game
+from core.position_history import PositionHistory
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+
+class TestPositionHistory(unittest.TestCase):
+    def test_sample_interpolates_between_records(self):
+        history = PositionHistory(4)
+        history.record(0.0, 0.0, 0.0)
+        history.record(1.0, 10.0, 20.0)
+
+        self.assertEqual(history.sample(0.25), (2.5, 5.0))
+
+    def test_ring_overwrites_oldest_and_clamps(self):
+        history = PositionHistory(3)
+        for i in range(5):
+            history.record(float(i), float(i), 0.0)
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.oldest_time(), 2.0)
+        self.assertEqual(history.sample(0.0), (2.0, 0.0))
+        self.assertEqual(history.sample(99.0), (4.0, 0.0))
+        self.assertEqual(history.sample(3.5), (3.5, 0.0))
+
+    def test_memory_is_fixed_by_capacity(self):
+        history = PositionHistory(16)
+
+        self.assertEqual(history.nbytes, 16 * 24)
+
+
+class TestLagCompensatedHits(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.prop = Player("Prop", "prop", self.game)
+        self.game.switch_state(self.game.playing_state)
+        self.hunter.attempt_pickup_weapon(Gun(AR_15))
+
+        # Prop stood at (5, 0) for a while, then stepped out of the line.
+        self.prop.position = (5.0, 0.0)
+        for _ in range(5):
+            self.game.update(0.02)
+        self.shot_seen_at = self.game.time
+        self.prop.position = (5.0, 3.0)
+        self.game.update(0.02)
+
+    def test_current_time_shot_misses_target_that_moved(self):
+        self.hunter.attempt_use_weapon()
+        self.game.update(0.2)
+
+        self.assertEqual(self.prop.health, 100)
+
+    def test_rewound_shot_hits_where_client_saw_target(self):
+        self.hunter.attempt_use_weapon(client_time=self.shot_seen_at)
+        self.game.update(0.2)
+
+        self.assertEqual(self.prop.health, 100 - AR_15.damage)
+        self.assertEqual(self.game.bullets, [])
+
+    def test_rewind_is_capped(self):
+        lag = self.game.lag
+
+        self.assertEqual(lag.rewind_for(self.game.time - 10.0), lag.max_rewind)
+        self.assertEqual(lag.rewind_for(self.game.time + 1.0), 0.0)
+        self.assertEqual(lag.rewind_for(None), 0.0)
+
+    def test_bullets_do_not_hit_teammates(self):
+        teammate = Player("Other Hunter", "hunter", self.game)
+        teammate.position = (3.0, 0.0)
+
+        self.hunter.attempt_use_weapon()
+        self.game.update(0.2)
+
+        self.assertEqual(teammate.health, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
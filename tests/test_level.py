@@ -0,0 +1,144 @@
+"""Tests for level loading, the BVH and level collision."""
+
+import os
+import tempfile
+import unittest
+
+from core.game import Game
+from entities.player import Player
+from entities.weapons.bullet import Bullet
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+from entities.weapons.impact.damage_impact import DamageImpact
+from entities.weapons.travel.ricochet_travel import RicochetTravel
+from entities.weapons.travel.straight_travel import StraightTravel
+from level.bvh import BVH
+from level.level import Level, LevelFormatError, write_level
+
+# A wall box at x in [10, 12] and a thin diagonal wall further out.
+BOXES = [(10.0, -5.0, 12.0, 5.0)]
+SEGMENTS = [(20.0, -5.0, 25.0, 5.0)]
+
+
+def temp_path(test, suffix=".ctpl"):
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    os.close(handle)
+    test.addCleanup(os.remove, path)
+    return path
+
+
+def make_bullet(travel_behavior, x=0.0, vx=100.0, owner_id="Hunter"):
+    return Bullet(
+        x=x,
+        y=0.0,
+        vx=vx,
+        vy=0.0,
+        owner_id=owner_id,
+        damage=10,
+        travel_behavior=travel_behavior,
+        impact_behaviors=(DamageImpact(),),
+    )
+
+
+class TestBVH(unittest.TestCase):
+    def test_query_box_matches_brute_force(self):
+        boxes = [(float(i), float(i % 7), i + 1.0, i % 7 + 1.0) for i in range(100)]
+        bvh = BVH(boxes)
+
+        found = sorted(bvh.query_box(20.0, 2.0, 40.0, 4.0))
+        expected = [
+            i for i, b in enumerate(boxes)
+            if b[0] <= 40.0 and b[2] >= 20.0 and b[1] <= 4.0 and b[3] >= 2.0
+        ]
+
+        self.assertEqual(found, expected)
+
+
+class TestLevel(unittest.TestCase):
+    def setUp(self):
+        self.path = temp_path(self)
+        write_level(self.path, BOXES, SEGMENTS)
+        self.level = Level.load(self.path)
+
+    def test_load_reads_geometry(self):
+        self.assertEqual(self.level.box(0), BOXES[0])
+        self.assertEqual(self.level.segment(0), SEGMENTS[0])
+        self.assertEqual(self.level.bounds, (10.0, -5.0, 25.0, 5.0))
+
+    def test_bad_magic_is_rejected(self):
+        with open(self.path, "r+b") as f:
+            f.write(b"NOPE")
+
+        with self.assertRaises(LevelFormatError):
+            Level.load(self.path)
+
+    def test_batched_raycasts_find_first_wall(self):
+        hits = self.level.raycast_batch(
+            [(0.0, 0.0), (15.0, 0.0), (0.0, 8.0)],
+            [(30.0, 0.0), (30.0, 0.0), (30.0, 8.0)],
+        )
+
+        t, nx, ny = hits[0]
+        self.assertAlmostEqual(t * 30.0, 10.0)
+        self.assertEqual((nx, ny), (-1.0, 0.0))
+        self.assertAlmostEqual(15.0 + hits[1][0] * 15.0, 22.5)
+        self.assertIsNone(hits[2])
+
+    def test_resolve_move_stops_at_wall_and_slides(self):
+        x, y = self.level.resolve_move((0.0, 0.0), (20.0, 3.0), radius=0.5)
+
+        self.assertAlmostEqual(x, 9.5, places=2)
+        self.assertAlmostEqual(y, 3.0, places=6)
+
+
+class TestLevelCollisionInGame(unittest.TestCase):
+    def setUp(self):
+        path = temp_path(self)
+        write_level(path, BOXES, SEGMENTS)
+        self.game = Game(text_output=False)
+        self.game.load_level(path)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.prop = Player("Prop", "prop", self.game)
+        self.prop.position = (15.0, 0.0)
+
+    def test_players_cannot_walk_through_walls(self):
+        self.hunter.attempt_move((15.0, 0.0))
+
+        self.assertLess(self.hunter.position[0], 10.0)
+
+    def test_walls_stop_bullets_before_players_behind_them(self):
+        bullet = make_bullet(StraightTravel())
+        self.game.bullets.append(bullet)
+
+        self.game.update(0.2)
+
+        self.assertEqual(self.prop.health, 100)
+        self.assertFalse(bullet.alive)
+        self.assertAlmostEqual(bullet.x, 10.0)
+
+    def test_held_trigger_shots_fired_mid_tick_stop_at_walls(self):
+        self.game.switch_state(self.game.playing_state)
+        self.hunter.position = (8.0, 0.0)
+        self.prop.position = (12.6, 0.0)
+        self.hunter.attempt_pickup_weapon(Gun(AR_15))
+        # Offset the clock so every shot comes due partway through a tick.
+        self.game.update(0.005)
+        self.hunter.attempt_hold_trigger(True)
+        for _ in range(10):
+            self.game.update(0.1)
+
+        self.assertEqual(self.prop.health, 100)
+
+    def test_ricochet_bounces_off_walls(self):
+        bullet = make_bullet(RicochetTravel())
+        self.game.bullets.append(bullet)
+
+        self.game.update(0.2)
+
+        self.assertTrue(bullet.alive)
+        self.assertEqual(bullet.vx, -100.0)
+        self.assertEqual(bullet.bounces, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Smoke tests for the headless load generator."""
+
+import unittest
+
+from core.game import Game
+from tools import loadgen
+
+
+class TestLoadGen(unittest.TestCase):
+    def test_spawns_every_role(self):
+        game = Game(text_output=False)
+        bots = loadgen.spawn_bots(game, hunters=3, props=4, guardians=2)
+        self.assertEqual(len(bots), 9)
+        self.assertEqual((len(game.hunters), len(game.props), len(game.guardian_angels)), (3, 4, 2))
+        self.assertTrue(all(bot.gun is not None for bot in bots[:3]))
+
+    def test_run_reports_timings_and_memory(self):
+        for policy in loadgen.POLICIES:
+            report = loadgen.run(
+                hunters=5, props=10, guardians=2, ticks=20, warmup=5, policy=policy,
+                trace_memory=True,
+            )
+            self.assertEqual(report.bots, 17)
+            self.assertEqual(len(report.tick_times), 20)
+            self.assertGreater(report.ticks_per_second, 0)
+            self.assertLessEqual(report.percentile(50), report.percentile(99))
+            self.assertGreater(report.memory_peak, 0)
+            self.assertIn("ticks/sec", report.format())
+
+    def test_same_seed_same_match(self):
+        def final_positions():
+            game = Game(text_output=False)
+            bots = loadgen.spawn_bots(game, hunters=2, props=2, guardians=0, seed=3)
+            for _ in range(10):
+                for bot in bots:
+                    bot.act()
+                game.update(1 / 60)
+            return [bot.player.position for bot in bots]
+
+        self.assertEqual(final_positions(), final_positions())
+
+
+if __name__ == "__main__":
+    unittest.main()
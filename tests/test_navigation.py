@@ -0,0 +1,105 @@
+"""Tests for the nav grid, flow fields and bot steering."""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from core.game import Game
+from entities.player import Player
+from level.flow_field import UNREACHABLE, FlowField
+from level.level import write_level
+
+# A wall between the bots and the goal, with gaps above and below.
+BOXES = [(4.0, -4.0, 5.0, 4.0)]
+SEGMENTS = [(-2.0, -8.0, 12.0, -8.0), (-2.0, 8.0, 12.0, 8.0)]
+
+
+class TestNavigation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        path = os.path.join(self.tmp, "arena.ctpl")
+        write_level(path, BOXES, SEGMENTS)
+
+        self.game = Game(text_output=False)
+        self.game.load_level(path)
+        self.nav = self.game.navigation
+        self.bot = Player("Bot", "hunter", self.game)
+        self.bot.position = (0.0, 0.0)
+
+    def walk(self, goal, steps=200, speed=0.25):
+        grid = self.nav.grid
+        for _ in range(steps):
+            dx, dy = self.nav.steer(self.bot, goal)
+            x, y = self.bot.position
+            self.bot.position = (x + dx * speed, y + dy * speed)
+            self.assertTrue(grid.is_walkable(*self.bot.position), self.bot.position)
+            if grid.index_of(*self.bot.position) == grid.index_of(*goal):
+                return True
+        return False
+
+    def test_grid_blocks_walls_with_clearance(self):
+        grid = self.nav.grid
+        self.assertFalse(grid.is_walkable(4.5, 0.0))
+        self.assertFalse(grid.is_walkable(3.8, 0.0))
+        self.assertTrue(grid.is_walkable(3.0, 0.0))
+        self.assertFalse(grid.is_walkable(0.0, 8.0))
+
+    def test_bot_paths_around_wall(self):
+        self.assertTrue(self.walk((8.0, 0.0)))
+
+    def test_field_distances_grow_away_from_goal(self):
+        field = self.nav.field_for((8.0, 0.0))
+        self.assertEqual(field.distance_at(8.0, 0.0), 0)
+        self.assertGreater(field.distance_at(0.0, 0.0), field.distance_at(3.0, 5.0))
+        self.assertEqual(field.distance_at(4.5, 0.0), UNREACHABLE)
+
+    def test_goals_in_one_cell_share_a_field(self):
+        first = self.nav.field_for((8.1, 0.1))
+        self.assertIs(self.nav.field_for((8.2, 0.2)), first)
+
+        other = Player("Other", "hunter", self.game)
+        other.position = (0.0, 2.0)
+        self.assertEqual(len(self.nav.steer_many([self.bot, other], (8.1, 0.1))), 2)
+        self.assertEqual(len(self.nav._fields), 1)
+
+    def test_tracked_goal_changing_cell_drops_old_field(self):
+        first = self.nav.track("flag", (8.0, 0.0))
+        self.assertIs(self.nav.track("flag", (8.1, 0.1)), first)
+
+        moved = self.nav.track("flag", (8.0, 3.0))
+        self.assertIsNot(moved, first)
+        self.assertNotIn(first.goal, self.nav._fields)
+
+    def test_cache_is_bounded(self):
+        self.nav.max_fields = 2
+        for y in (-3.0, 0.0, 3.0):
+            self.nav.field_for((8.0, y))
+        self.assertEqual(len(self.nav._fields), 2)
+
+    def test_executor_computes_off_thread_with_straight_fallback(self):
+        busy = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(busy.wait)
+            self.nav.executor = executor
+            self.assertIsNone(self.nav.field_for((8.0, 0.0)))
+            self.assertEqual(self.nav.steer(self.bot, (8.0, 0.0)), (1.0, 0.0))
+            busy.set()
+            self.nav._pending[self.nav.grid.index_of(8.0, 0.0)].result()
+            self.assertIsInstance(self.nav.field_for((8.0, 0.0)), FlowField)
+
+    def test_new_level_rebakes_and_no_level_steers_straight(self):
+        grid = self.nav.grid
+        self.nav.field_for((8.0, 0.0))
+        self.game.level = None
+        self.assertIsNone(self.nav.grid)
+        self.assertEqual(self.nav._fields, {})
+        self.assertEqual(self.nav.steer(self.bot, (0.0, 5.0)), (0.0, 1.0))
+        self.assertIsNotNone(grid)
+
+
+if __name__ == "__main__":
+    unittest.main()
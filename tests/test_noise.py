@@ -0,0 +1,67 @@
+"""Tests for footstep noise propagation to hunters."""
+
+import unittest
+
+from core.events import NoiseHeard
+from core.game import Game
+from entities.effects.apply_movement_modifier_effect import ApplyMovementModifierEffect
+from entities.movement.modifiers.speed_multiplier import SpeedMultiplier
+from entities.player import Player
+
+
+class TestNoise(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.game.switch_state(self.game.playing_state)
+        self.near = Player("Near", "hunter", self.game)
+        self.near.position = (5.0, 0.0)
+        self.far = Player("Far", "hunter", self.game)
+        self.far.position = (100.0, 0.0)
+
+        self.heard = []
+        self.game.events.subscribe(
+            lambda events: self.heard.extend(e for e in events if isinstance(e, NoiseHeard))
+        )
+
+    def add_prop(self, name):
+        prop = Player(name, "prop", self.game)
+        prop.position = (0.0, 0.0)
+        return prop
+
+    def test_moving_prop_is_heard_only_in_range(self):
+        prop = self.add_prop("Prop")
+        prop.attempt_move((1.0, 0.0))
+        self.game.update(0.0)
+
+        self.assertEqual([e.player for e in self.heard], [self.near])
+        self.assertEqual(self.heard[0].position, (1.0, 0.0))
+
+    def test_noises_are_coalesced_per_listener(self):
+        for i in range(5):
+            self.add_prop(f"Prop{i}").attempt_move((0.0, 1.0))
+        self.game.update(0.0)
+
+        self.assertEqual(len(self.heard), 1)
+        self.assertEqual(self.heard[0].count, 5)
+
+    def test_faster_movement_is_louder(self):
+        slow = self.add_prop("Slow")
+        slow.attempt_move((0.0, 0.5))
+        self.game.update(0.0)
+        quiet = self.heard.pop().intensity
+
+        fast = self.add_prop("Fast")
+        fast.attempt_add_effect(ApplyMovementModifierEffect(SpeedMultiplier(2.0)))
+        fast.attempt_move((0.0, 0.5))
+        self.game.update(0.0)
+        self.assertGreater(self.heard.pop().intensity, quiet)
+
+    def test_hunters_and_standing_still_are_silent(self):
+        self.near.attempt_move((6.0, 0.0))
+        self.add_prop("Prop").attempt_move((0.0, 0.0))
+        self.game.update(0.0)
+        self.assertEqual(self.heard, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
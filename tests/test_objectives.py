@@ -0,0 +1,117 @@
+"""Tests for flags, capture zones and team scores."""
+
+import unittest
+
+from core.events import ActionDenied, FlagCaptured, FlagStolen, ZoneEntered, ZoneExited
+from core.game import Game
+from core.trigger_grid import TriggerGrid
+from entities.objectives.capture_zone import CaptureZone
+from entities.player import Player
+
+
+class TestTriggerGrid(unittest.TestCase):
+    def test_volumes_snap_to_whole_cells(self):
+        grid = TriggerGrid(1.0)
+        grid.add("zone", (0.5, 0.5), (2.0, 1.0))
+        self.assertEqual(grid.volumes_at((0, 0)), ("zone",))
+        self.assertEqual(grid.volumes_at((1, 0)), ("zone",))
+        self.assertEqual(grid.volumes_at((2, 0)), ())
+        self.assertEqual(grid.volumes_at((0, 1)), ())
+
+
+class TestObjectives(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.game.switch_state(self.game.playing_state)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.hunter.position = (0.0, 0.0)
+        self.hunter.direction = (1.0, 0.0)
+        self.prop = Player("Prop", "prop", self.game)
+        self.objectives = self.game.objectives
+        self.objectives.add_zone(CaptureZone("Prop Base", "Props", (10.0, 10.0), (12.0, 12.0)))
+        self.flag = self.objectives.issue_flags()[0]
+        self.game.events.flush()
+
+        self.received = []
+        self.game.events.subscribe(self.received.extend)
+
+    def events(self, kind):
+        seen = self.received + list(self.game.events)
+        return [e for e in seen if isinstance(e, kind)]
+
+    def test_hunters_carry_flags(self):
+        self.assertIs(self.objectives.flag_of(self.hunter), self.flag)
+        self.assertEqual(self.objectives.issue_flags(), [])
+
+    def test_steal_from_behind(self):
+        self.prop.position = (-1.0, 0.0)
+        self.assertTrue(self.prop.attempt_steal())
+        self.assertIs(self.flag.carrier, self.prop)
+        self.assertIsNone(self.objectives.flag_of(self.hunter))
+        self.assertIs(self.events(FlagStolen)[0].victim, self.hunter)
+
+    def test_cannot_steal_from_the_front_or_far_away(self):
+        self.prop.position = (1.0, 0.0)
+        self.assertFalse(self.prop.attempt_steal())
+        self.prop.position = (-5.0, 0.0)
+        self.assertFalse(self.prop.attempt_steal())
+        self.assertFalse(self.hunter.attempt_steal())
+        self.assertIs(self.flag.carrier, self.hunter)
+        self.assertEqual(len(self.events(ActionDenied)), 3)
+
+    def test_steal_denied_while_preparing(self):
+        self.game.switch_state(self.game.preparing_state)
+        self.prop.position = (-1.0, 0.0)
+        self.assertFalse(self.prop.attempt_steal())
+
+    def test_carrying_flag_into_base_scores(self):
+        self.prop.position = (-1.0, 0.0)
+        self.prop.attempt_steal()
+
+        self.prop.position = (11.0, 11.0)
+        self.game.update(0.0)
+        self.assertTrue(self.flag.captured)
+        self.assertIsNone(self.flag.carrier)
+        self.assertEqual(self.objectives.scores, {"Hunters": 0, "Props": 1})
+        self.assertEqual(self.events(FlagCaptured)[0].zone_name, "Prop Base")
+
+    def test_zone_triggers_fire_once_on_cell_change(self):
+        self.prop.position = (11.0, 11.0)
+        self.game.update(0.0)
+        self.prop.position = (11.5, 11.5)
+        self.game.update(0.0)
+        self.prop.position = (30.0, 30.0)
+        self.game.update(0.0)
+
+        self.assertEqual(len(self.events(ZoneEntered)), 1)
+        self.assertEqual(len(self.events(ZoneExited)), 1)
+        self.assertEqual(self.objectives.zones_of(self.prop), ())
+
+    def test_unmoved_players_are_skipped(self):
+        self.game.update(0.0)
+
+        lookups = []
+        grid = self.objectives._grid
+        volumes_at = grid.volumes_at
+        grid.volumes_at = lambda cell: lookups.append(cell) or volumes_at(cell)
+
+        self.prop.position = (0.25, 0.25)  # same cell as before
+        self.game.update(0.0)
+        self.assertEqual(lookups, [])
+
+        self.prop.position = (50.0, 50.0)
+        self.game.update(0.0)
+        self.assertEqual(lookups, [(50, 50)])
+
+    def test_killing_the_carrier_drops_the_flag(self):
+        self.prop.position = (-1.0, 0.0)
+        self.prop.attempt_steal()
+        self.game._handle_player_death(self.prop, killer="Hunter")
+
+        self.assertIsNone(self.flag.carrier)
+        self.assertEqual(self.flag.position, (-1.0, 0.0))
+        self.assertEqual(self.objectives.scores["Hunters"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for knockback integration and ragdoll state."""
+
+import unittest
+
+from core.game import Game
+from entities.player import Player
+
+
+class TestPhysicsController(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.player = Player("Prop", "prop", self.game)
+        self.physics = self.game.physics
+
+    def test_idle_players_are_not_integrated(self):
+        self.game.update(0.1)
+
+        self.assertFalse(self.physics.is_active(self.player))
+        self.assertEqual(self.player.position, (0, 0))
+
+    def test_impulse_moves_player_and_friction_brings_it_to_rest(self):
+        self.physics.apply_impulse(self.player, (5.0, 0.0))
+
+        self.game.update(0.1)
+        self.assertGreater(self.player.position[0], 0.0)
+        self.assertLess(self.player.velocity[0], 5.0)
+
+        for _ in range(100):
+            self.game.update(0.05)
+
+        self.assertEqual(self.player.velocity, (0.0, 0.0))
+        self.assertFalse(self.physics.is_active(self.player))
+
+    def test_vertical_impulse_rises_then_lands(self):
+        self.physics.apply_impulse(self.player, (0.0, 0.0), vertical=10.0)
+
+        self.game.update(0.1)
+        self.assertGreater(self.player.height, 0.0)
+
+        for _ in range(30):
+            self.game.update(0.05)
+
+        self.assertEqual(self.player.height, 0.0)
+        self.assertEqual(self.player.vertical_velocity, 0.0)
+
+    def test_strong_impulse_ragdolls_until_recovery_timer_expires(self):
+        self.physics.apply_impulse(self.player, (30.0, 0.0))
+
+        self.assertTrue(self.player.status.ragdolled)
+        self.assertTrue(self.player.status.blocks("move"))
+
+        self.game.update(self.physics.ragdoll_duration / 2)
+        self.assertTrue(self.player.status.ragdolled)
+
+        self.game.update(self.physics.ragdoll_duration)
+        self.assertFalse(self.player.status.ragdolled)
+
+    def test_weak_impulse_does_not_ragdoll(self):
+        self.physics.apply_impulse(self.player, (1.0, 0.0))
+
+        self.assertFalse(self.player.status.ragdolled)
+
+
+if __name__ == "__main__":
+    unittest.main()
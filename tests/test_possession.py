@@ -0,0 +1,140 @@
+"""Tests for the prop catalog, the placed-object index and possession."""
+
+import random
+import unittest
+
+from core.events import ActionDenied, PropPossessed
+from core.game import Game
+from core.kd_tree import KDTree
+from entities.hitbox import BoxHitbox, CircleHitbox
+from entities.player import DEFAULT_HITBOX, Player
+from entities.props.prop_catalog import default_catalog
+from entities.weapons.bullet import Bullet
+from entities.weapons.impact.damage_impact import DamageImpact
+from entities.weapons.travel.straight_travel import StraightTravel
+
+
+class TestKDTree(unittest.TestCase):
+    def test_nearest_matches_brute_force(self):
+        rng = random.Random(7)
+        points = [(i, rng.uniform(-50, 50), rng.uniform(-50, 50)) for i in range(300)]
+        tree = KDTree(points)
+        self.assertEqual(len(tree), 300)
+
+        for _ in range(100):
+            x, y = rng.uniform(-60, 60), rng.uniform(-60, 60)
+            expected = min(points, key=lambda p: (p[1] - x) ** 2 + (p[2] - y) ** 2)
+            item, _ = tree.nearest(x, y)
+            self.assertEqual(item, expected[0])
+
+    def test_max_distance(self):
+        tree = KDTree([("a", 0.0, 0.0)])
+        self.assertIsNone(tree.nearest(5.0, 0.0, max_distance=4.0))
+        self.assertEqual(tree.nearest(3.0, 4.0, max_distance=5.0), ("a", 5.0))
+        self.assertIsNone(KDTree([]).nearest(0.0, 0.0))
+
+
+class TestPossession(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.prop = Player("Prop", "prop", self.game)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.game.possession.place([
+            ("Crate", (1.0, 0.0)),
+            ("Barrel", (2.0, 0.0)),
+            ("Crate", (20.0, 0.0)),
+        ])
+        self.game.events.flush()
+
+    def events(self, kind):
+        return [e for e in self.game.events if isinstance(e, kind)]
+
+    def test_catalog_loads_shapes(self):
+        catalog = default_catalog()
+        self.assertIsInstance(catalog.by_name("Crate").hitbox, BoxHitbox)
+        self.assertIsInstance(catalog.by_name("Barrel").hitbox, CircleHitbox)
+        self.assertEqual(catalog.get(catalog.id_of("Barrel")).name, "Barrel")
+
+    def test_possess_nearest_named_object_in_reach(self):
+        self.assertTrue(self.prop.attempt_possess("Barrel"))
+        self.assertEqual(self.prop.possessed.name, "Barrel")
+        self.assertEqual(self.prop.possessed.position, (2.0, 0.0))
+        self.assertIs(self.prop.hitbox, default_catalog().by_name("Barrel").hitbox)
+        self.assertEqual(self.events(PropPossessed)[0].render(), "Prop possessed Barrel (PREPARING)")
+
+    def test_possess_without_name_takes_nearest(self):
+        self.assertTrue(self.prop.attempt_possess(None))
+        self.assertEqual(self.prop.possessed.position, (1.0, 0.0))
+
+    def test_out_of_reach_unknown_and_hunters_are_denied(self):
+        self.prop.position = (10.0, 10.0)
+        self.assertFalse(self.prop.attempt_possess("Crate"))
+        self.prop.position = (0.0, 0.0)
+        self.assertFalse(self.prop.attempt_possess("Piano"))
+        self.assertFalse(self.hunter.attempt_possess("Crate"))
+
+        self.assertIsNone(self.prop.possessed)
+        self.assertIs(self.prop.hitbox, DEFAULT_HITBOX)
+        self.assertEqual(len(self.events(ActionDenied)), 3)
+
+    def test_speed_modifier_scales_movement(self):
+        self.prop.attempt_possess("Barrel")
+        self.prop.attempt_move((1.0, 0.0))
+        self.assertAlmostEqual(self.prop.position[0], 0.8)
+
+    def test_bullets_hit_the_possessed_shape(self):
+        self.game.switch_state(self.game.playing_state)
+        self.prop.attempt_possess("Crate")
+
+        # The diagonal x + y = 0.9 clips the crate's corner but passes
+        # ~0.64 from the center, clear of the default 0.5 circle.
+        self.game.bullets.append(Bullet(
+            x=-1.0, y=1.9, vx=10.0, vy=-10.0, owner_id="Hunter", damage=10,
+            travel_behavior=StraightTravel(), impact_behaviors=(DamageImpact(),),
+        ))
+        self.game.update(0.2)
+        self.assertLess(self.prop.health, 100)
+
+    def test_an_object_hides_one_prop_at_a_time(self):
+        other = Player("Other", "prop", self.game)
+        self.assertTrue(self.prop.attempt_possess("Crate"))
+
+        self.assertFalse(other.attempt_possess("Crate"))
+        self.assertIsNone(other.possessed)
+        self.assertTrue(other.attempt_possess(None))
+        self.assertEqual(other.possessed.name, "Barrel")
+
+        self.game._handle_player_death(self.prop)
+        self.assertTrue(other.attempt_possess("Crate"))
+        self.assertEqual(other.possessed.position, (1.0, 0.0))
+        # Switching freed the barrel for anyone else.
+        self.assertIsNone(self.game.possession.nearest((2.0, 0.0), "Crate", 1.5))
+        self.assertEqual(self.game.possession.nearest((2.0, 0.0), "Barrel").name, "Barrel")
+
+    def test_failed_switch_keeps_the_current_object(self):
+        self.prop.attempt_possess("Barrel")
+        self.assertFalse(self.prop.attempt_possess("Traffic Cone"))
+        self.assertEqual(self.prop.possessed.name, "Barrel")
+        self.assertIsNone(self.game.possession.nearest((2.0, 0.0), "Barrel"))
+
+    def test_heavy_objects_soak_up_knockback(self):
+        self.game.possession.place([("Vending Machine", (0.0, 1.0))])
+        self.prop.attempt_possess("Vending Machine")
+        self.game.physics.apply_impulse(self.prop, (30.0, 0.0))
+        self.assertAlmostEqual(self.prop.velocity[0], 4.0)
+        self.assertFalse(self.prop.status.ragdolled)
+
+        self.prop.velocity = (0.0, 0.0)
+        self.prop.attempt_possess("Crate")
+        self.game.physics.apply_impulse(self.prop, (30.0, 0.0))
+        self.assertAlmostEqual(self.prop.velocity[0], 30.0)
+
+    def test_death_releases_the_disguise(self):
+        self.prop.attempt_possess("Crate")
+        self.game._handle_player_death(self.prop)
+        self.assertIsNone(self.prop.possessed)
+        self.assertIs(self.prop.hitbox, DEFAULT_HITBOX)
+
+
+if __name__ == "__main__":
+    unittest.main()
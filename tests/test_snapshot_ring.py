@@ -0,0 +1,139 @@
+"""Tests for the shared-memory spectator snapshot ring."""
+
+import multiprocessing
+import unittest
+
+from core.game import Game
+from entities.player import Player
+from net import frames
+from net.gateway import Gateway
+from net.snapshot_ring import Lapped, SnapshotReader, SnapshotRing
+
+
+def read_latest(name, queue):
+    ring = SnapshotRing.attach(name)
+    try:
+        queue.put(SnapshotReader(ring).latest())
+    finally:
+        ring.close()
+
+
+class TestSnapshotRing(unittest.TestCase):
+    def setUp(self):
+        self.ring = SnapshotRing.create(slots=4, slot_size=64)
+        self.addCleanup(self.ring.unlink)
+        self.addCleanup(self.ring.close)
+
+    def test_publish_and_read(self):
+        self.assertIsNone(self.ring.read(1))
+        self.assertEqual(self.ring.publish(b"one"), 1)
+        self.assertEqual(self.ring.publish(b"two"), 2)
+        self.assertEqual(self.ring.head, 2)
+        self.assertEqual(self.ring.read(1), b"one")
+        self.assertEqual(self.ring.read(2), b"two")
+        self.assertIsNone(self.ring.read(3))
+
+    def test_overwritten_snapshot_raises_lapped(self):
+        for i in range(5):
+            self.ring.publish(bytes([i]))
+        with self.assertRaises(Lapped) as raised:
+            self.ring.read(1)
+        self.assertEqual(raised.exception.head, 5)
+        self.assertEqual(self.ring.read(2), bytes([1]))
+
+    def test_slot_rewritten_mid_read_is_detected(self):
+        self.ring.publish(b"old")
+        # What a reader sees while the writer is reusing the slot.
+        offset = self.ring._slot_offset(1)
+        self.ring._buf[offset:offset + 8] = bytes(8)
+        with self.assertRaises(Lapped):
+            self.ring.read(1)
+
+    def test_oversized_snapshot_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.ring.publish(bytes(self.ring.capacity + 1))
+
+    def test_reader_skips_ahead_when_lapped(self):
+        reader = SnapshotReader(self.ring, from_latest=False)
+        self.ring.publish(b"a")
+        self.assertEqual(reader.poll(), [b"a"])
+
+        for i in range(10):
+            self.ring.publish(bytes([i]))
+        snapshots = reader.poll()
+        self.assertEqual(snapshots[-1], bytes([9]))
+        self.assertLess(len(snapshots), self.ring.slots)
+        self.assertEqual(reader.missed + len(snapshots), 10)
+        self.assertEqual(reader.poll(), [])
+
+    def test_other_process_reads_by_name(self):
+        self.ring.publish(b"hello")
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=read_latest, args=(self.ring.name, queue))
+        process.start()
+        try:
+            self.assertEqual(queue.get(timeout=30), b"hello")
+        finally:
+            process.join(30)
+
+
+class TestWorldSnapshots(unittest.TestCase):
+    def test_gateway_publishes_one_snapshot_per_tick(self):
+        ring = SnapshotRing.create(slots=4)
+        self.addCleanup(ring.unlink)
+        self.addCleanup(ring.close)
+
+        game = Game(text_output=False)
+        hunter = Player("Hunter", "hunter", game)
+        hunter.position = (1.0, 2.0)
+        Player("Prop", "prop", game)
+        gateway = Gateway(game, snapshots=ring)
+
+        gateway.tick(0.1)
+        gateway.tick(0.1)
+        self.assertEqual(ring.head, 2)
+
+        _, opcode = frames.HEADER.unpack_from(ring.read(2))
+        self.assertEqual(opcode, frames.WORLD)
+        time, players, bullets = frames.read_world(ring.read(2))
+        self.assertAlmostEqual(time, 0.2)
+        self.assertEqual(players[0], ("hunters", "Hunter", 1.0, 2.0, 100.0))
+        self.assertEqual(players[1][:2], ("props", "Prop"))
+        self.assertEqual(bullets, [])
+
+    def big_match(self, props):
+        game = Game(text_output=False)
+        for i in range(props):
+            Player(f"Prop-{i:05d}", "prop", game).position = (float(i), 0.0)
+        return game
+
+    def test_large_match_spans_several_frames(self):
+        ring = SnapshotRing.create(slots=2)
+        self.addCleanup(ring.unlink)
+        self.addCleanup(ring.close)
+        gateway = Gateway(self.big_match(4000), snapshots=ring)
+
+        gateway.tick(0.1)
+        _, players, _ = frames.read_world(ring.read(1))
+        self.assertEqual(len(players), 4000)
+        self.assertEqual(players[-1][1:3], ("Prop-03999", 3999.0))
+
+    def test_long_multibyte_names_are_cut_on_a_character(self):
+        name = "é" * 200
+        _, players, _ = frames.read_world(frames.world(0.0, [(0, name, 0.0, 0.0, 1.0)], []))
+        self.assertEqual(players[0][1], "é" * 127)
+
+    def test_snapshot_too_big_for_ring_is_skipped(self):
+        ring = SnapshotRing.create(slots=2, slot_size=1024)
+        self.addCleanup(ring.unlink)
+        self.addCleanup(ring.close)
+        gateway = Gateway(self.big_match(200), snapshots=ring)
+
+        gateway.tick(0.1)
+        self.assertEqual(ring.head, 0)
+        self.assertEqual(gateway.snapshots_dropped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
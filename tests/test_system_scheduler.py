@@ -0,0 +1,116 @@
+"""Tests for the component-aware system scheduler."""
+
+import sys
+import unittest
+
+from core.game import Game
+from core.system_scheduler import SystemScheduler, free_threaded
+from entities.player import Player
+from entities.weapons.bullet import Bullet
+from entities.weapons.impact.damage_impact import DamageImpact
+from entities.weapons.travel.straight_travel import StraightTravel
+
+
+class TestSystemScheduler(unittest.TestCase):
+    def test_waves_follow_conflicts_in_program_order(self):
+        scheduler = SystemScheduler(parallel=False)
+        noop = lambda dt: None
+        scheduler.add("move", noop, writes={"positions"})
+        scheduler.add("see", noop, reads={"positions"}, writes={"visibility"})
+        scheduler.add("hear", noop, reads={"positions"}, writes={"noise"})
+        scheduler.add("ai", noop, reads={"visibility", "noise"}, writes={"intents"})
+        scheduler.add("tick", noop, writes={"clock"})
+
+        names = [[s.name for s in wave] for wave in scheduler.waves()]
+        self.assertEqual(names, [["move", "tick"], ["see", "hear"], ["ai"]])
+
+    def test_systems_may_share_a_name(self):
+        scheduler = SystemScheduler(parallel=False)
+        noop = lambda dt: None
+        scheduler.add("move", noop, writes={"positions"})
+        scheduler.add("step", noop, reads={"positions"}, writes={"x"})
+        scheduler.add("step", noop, writes={"y"})
+        scheduler.add("use", noop, reads={"x"})
+
+        waves = [[s.writes or s.reads for s in wave] for wave in scheduler.waves()]
+        self.assertEqual(waves, [[{"positions"}, {"y"}], [{"x"}], [{"x"}]])
+
+    def test_serial_fallback_runs_in_program_order(self):
+        scheduler = SystemScheduler(parallel=False)
+        order = []
+        scheduler.add("b", lambda dt: order.append("b"), writes={"x"})
+        scheduler.add("a", lambda dt: order.append("a"), writes={"y"})
+        scheduler.add("chunks", lambda dt, start, stop: order.append((start, stop)), size=lambda: 5)
+        scheduler.run(0.1)
+        self.assertEqual(order, ["b", "a", (0, 5)])
+
+    def test_parallel_partitions_cover_every_item(self):
+        scheduler = SystemScheduler(max_workers=4, parallel=True)
+        scheduler.min_chunk = 10
+        self.addCleanup(scheduler.close)
+
+        seen = [0] * 95
+
+        def visit(dt, start, stop):
+            for i in range(start, stop):
+                seen[i] += 1
+
+        scheduler.add("visit", visit, writes={"items"}, size=lambda: len(seen))
+        scheduler.add("other", lambda dt: None, writes={"elsewhere"})
+        scheduler.run(0.1)
+        self.assertEqual(seen, [1] * 95)
+
+    def test_errors_propagate_from_workers(self):
+        scheduler = SystemScheduler(max_workers=2, parallel=True)
+        self.addCleanup(scheduler.close)
+
+        def boom(dt):
+            raise RuntimeError("boom")
+
+        scheduler.add("ok", lambda dt: None, writes={"a"})
+        scheduler.add("boom", boom, writes={"b"})
+        with self.assertRaises(RuntimeError):
+            scheduler.run(0.1)
+
+    def test_gil_builds_default_to_serial(self):
+        gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+        self.assertEqual(free_threaded(), not gil)
+        self.assertEqual(SystemScheduler().parallel, free_threaded())
+
+
+class TestParallelGameTick(unittest.TestCase):
+    def simulate(self, parallel):
+        game = Game(text_output=False)
+        game.systems.parallel = parallel
+        game.systems.min_chunk = 4
+        self.addCleanup(game.systems.close)
+        game.switch_state(game.playing_state)
+
+        hunter = Player("Hunter", "hunter", game)
+        prop = Player("Prop", "prop", game)
+        prop.position = (5.0, 0.0)
+        for i in range(30):
+            game.bullets.append(Bullet(
+                x=0.0, y=(i - 15) * 0.1, vx=20.0, vy=0.0, owner_id=hunter.name, damage=1,
+                travel_behavior=StraightTravel(), impact_behaviors=(DamageImpact(),),
+            ))
+        for _ in range(10):
+            game.update(1 / 30)
+        return prop.health, len(game.bullets), game.time
+
+    def test_parallel_tick_matches_serial(self):
+        self.assertEqual(self.simulate(parallel=True), self.simulate(parallel=False))
+
+    def test_parallel_tick_without_bullets(self):
+        game = Game(text_output=False)
+        game.systems.parallel = True
+        self.addCleanup(game.systems.close)
+        Player("Hunter", "hunter", game)
+
+        game.update(1 / 60)
+        game.update(1 / 60)
+        self.assertAlmostEqual(game.time, 2 / 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
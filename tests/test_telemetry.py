@@ -0,0 +1,116 @@
+"""Tests for the columnar telemetry writer and its memory-mapped reader."""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+
+from core.game import Game
+from entities.effects.apply_shot_value_modifier_effect import ApplyShotValueModifierEffect
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+from entities.weapons.shot_values.damage_multiplier import DamageMultiplier
+from telemetry import npy
+from telemetry.reader import TelemetryReader
+from telemetry.writer import NO_STRING, TelemetryWriter
+
+
+def play_match(writer):
+    game = Game(text_output=False)
+    match = writer.attach(game)
+    game.switch_state(game.playing_state)
+    hunter = Player("Hunter", "hunter", game)
+    prop = Player("Prop", "prop", game)
+    prop.position = (2.0, 0.0)
+    hunter.attempt_pickup_weapon(Gun(AR_15))
+    hunter.attempt_add_effect(ApplyShotValueModifierEffect(DamageMultiplier(2.0)))
+    while prop in game.props:
+        hunter.attempt_use_weapon()
+        game.update(1.0 / AR_15.fire_rate)
+    return match
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_match_round_trips_through_segments(self):
+        with TelemetryWriter(self.tmp, chunk_rows=2) as writer:
+            play_match(writer)
+
+        with TelemetryReader(self.tmp) as reader:
+            self.assertEqual(reader.rows("shots"), 2)
+            self.assertEqual(reader.rows("hits"), 2)
+            self.assertEqual(reader.rows("pickups"), 1)
+            self.assertEqual(reader.rows("effects"), 1)
+
+            self.assertEqual(reader.column("hits", "damage"), [50.0, 50.0])
+            self.assertEqual(
+                [reader.string(code) for code in reader.column("hits", "source")],
+                ["Hunter", "Hunter"],
+            )
+            deaths = next(reader.segments("deaths"))
+            self.assertEqual(reader.string(deaths["player"][0]), "Prop")
+            self.assertEqual(reader.string(deaths["killer"][0]), "Hunter")
+            self.assertEqual(reader.string(reader.column("effects", "effect")[0]),
+                             "ApplyShotValueModifierEffect")
+            times = reader.column("shots", "time")
+            self.assertLess(times[0], times[1])
+            del deaths
+
+    def test_rows_carry_each_events_own_time(self):
+        with TelemetryWriter(self.tmp) as writer:
+            game = Game(text_output=False)
+            writer.attach(game)
+            game.switch_state(game.playing_state)
+            hunter = Player("Hunter", "hunter", game)
+            hunter.attempt_pickup_weapon(Gun(AR_15))
+            game.update(0.1)
+            hunter.attempt_hold_trigger(True)
+            # One long tick: the held trigger fires several times inside it.
+            game.update(5 / AR_15.fire_rate)
+
+        with TelemetryReader(self.tmp) as reader:
+            times = reader.column("shots", "time")
+            self.assertGreater(len(times), 2)
+            self.assertEqual(times, sorted(set(times)))
+            for earlier, later in zip(times, times[1:]):
+                self.assertAlmostEqual(later - earlier, 1 / AR_15.fire_rate)
+
+    def test_rows_carry_their_match(self):
+        with TelemetryWriter(self.tmp) as writer:
+            first = play_match(writer)
+            second = play_match(writer)
+
+        with TelemetryReader(self.tmp) as reader:
+            self.assertEqual(reader.column("deaths", "match"), [first, second])
+            self.assertEqual(reader.column("deaths", "killer")[0], reader.column("deaths", "killer")[1])
+            self.assertNotIn(NO_STRING, reader.column("pickups", "slot"))
+
+    def test_segments_are_aligned_npy(self):
+        path = os.path.join(self.tmp, "column.npy")
+        with open(path, "wb") as f:
+            npy.write(f, array("d", [1.5, 2.5, 3.5]))
+        with open(path, "rb") as f:
+            data = f.read()
+        fmt, rows, offset = npy.parse_header(data)
+        self.assertEqual((fmt, rows), ("d", 3))
+        self.assertEqual(offset % npy.ALIGNMENT, 0)
+        self.assertEqual(len(data), offset + 24)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_segments_load_with_numpy(self):
+        import numpy
+
+        with TelemetryWriter(self.tmp) as writer:
+            play_match(writer)
+        column = numpy.load(os.path.join(self.tmp, "hits", "damage-00000.npy"), mmap_mode="r")
+        self.assertEqual(column.tolist(), [50.0, 50.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
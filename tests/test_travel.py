@@ -0,0 +1,120 @@
+"""Tests for travel behaviors and the batched bullet tick."""
+
+import math
+import unittest
+
+from core.game import Game
+from entities.player import Player
+from entities.weapons.bullet import Bullet
+from entities.weapons.impact.damage_impact import DamageImpact
+from entities.weapons.travel.ballistic_travel import BallisticTravel
+from entities.weapons.travel.homing_travel import HomingTravel
+from entities.weapons.travel.ricochet_travel import RicochetTravel
+from entities.weapons.travel.straight_travel import StraightTravel
+from entities.weapons.travel.travel_behavior import TravelBehavior
+
+
+def make_bullet(travel_behavior, x=0.0, y=0.0, vx=10.0, vy=0.0, owner_id="Hunter"):
+    return Bullet(
+        x=x,
+        y=y,
+        vx=vx,
+        vy=vy,
+        owner_id=owner_id,
+        damage=10,
+        travel_behavior=travel_behavior,
+        impact_behaviors=(DamageImpact(),),
+    )
+
+
+class CountingTravel(TravelBehavior):
+    """Records how many batch calls the world tick makes."""
+
+    batch_calls = 0
+
+    def update(self, bullet, world, dt):
+        pass
+
+    @classmethod
+    def update_batch(cls, bullets, world, dt):
+        cls.batch_calls += 1
+
+
+class TestTravelKernels(unittest.TestCase):
+    def setUp(self):
+        self.game = Game()
+        self.hunter = Player("Hunter", "hunter", self.game)
+
+    def test_ballistic_travel_accelerates_velocity_then_position(self):
+        bullet = make_bullet(BallisticTravel(gravity=(0.0, -10.0)))
+
+        BallisticTravel.update_batch([bullet], self.game, 0.5)
+
+        self.assertEqual((bullet.vx, bullet.vy), (10.0, -5.0))
+        self.assertEqual((bullet.x, bullet.y), (5.0, -2.5))
+
+    def test_homing_travel_turns_toward_nearest_enemy_and_keeps_speed(self):
+        prop = Player("Prop", "prop", self.game)
+        prop.position = (0.0, 10.0)
+        bullet = make_bullet(HomingTravel(turn_rate=math.pi, max_range=50.0))
+
+        HomingTravel.update_batch([bullet], self.game, 0.5)
+
+        self.assertAlmostEqual(bullet.vx, 0.0, places=6)
+        self.assertAlmostEqual(bullet.vy, 10.0, places=6)
+
+    def test_homing_travel_ignores_teammates(self):
+        teammate = Player("Other Hunter", "hunter", self.game)
+        teammate.position = (0.0, 10.0)
+        bullet = make_bullet(HomingTravel())
+
+        HomingTravel.update_batch([bullet], self.game, 0.1)
+
+        self.assertEqual((bullet.vx, bullet.vy), (10.0, 0.0))
+
+    def test_ricochet_travel_reflects_off_bounds(self):
+        bullet = make_bullet(RicochetTravel(bounds=(-10, -10, 2, 10)), x=1.0)
+
+        RicochetTravel.update_batch([bullet], self.game, 0.2)
+
+        self.assertAlmostEqual(bullet.x, 1.0)
+        self.assertEqual(bullet.vx, -10.0)
+        self.assertEqual(bullet.bounces, 1)
+        self.assertTrue(bullet.alive)
+
+    def test_ricochet_travel_kills_bullet_after_max_bounces(self):
+        bullet = make_bullet(
+            RicochetTravel(bounds=(-10, -10, 2, 10), max_bounces=0),
+            x=1.0,
+        )
+
+        RicochetTravel.update_batch([bullet], self.game, 0.2)
+
+        self.assertFalse(bullet.alive)
+
+
+class TestBatchedWorldTick(unittest.TestCase):
+    def test_world_tick_makes_one_batch_call_per_behavior_type(self):
+        game = Game()
+        CountingTravel.batch_calls = 0
+        game.bullets = [make_bullet(CountingTravel()) for _ in range(5)]
+        game.bullets.append(make_bullet(StraightTravel()))
+
+        game.update(0.1)
+
+        self.assertEqual(CountingTravel.batch_calls, 1)
+        self.assertEqual(game.bullets[-1].x, 1.0)
+
+    def test_expired_bullets_are_not_advanced(self):
+        game = Game()
+        bullet = make_bullet(StraightTravel())
+        bullet.ttl = 0.05
+
+        game.update(0.1)
+
+        self.assertEqual(bullet.x, 0.0)
+        self.assertEqual(game.bullets, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
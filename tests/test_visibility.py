@@ -0,0 +1,59 @@
+"""Tests for batched hunter -> prop visibility."""
+
+import os
+import tempfile
+import unittest
+
+from core.game import Game
+from entities.player import Player
+from level.level import write_level
+
+
+class TestVisibility(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.hunter.position = (0.0, 0.0)
+        self.hunter.direction = (1.0, 0.0)
+        self.prop = Player("Prop", "prop", self.game)
+
+    def see(self, position):
+        self.prop.position = position
+        self.game.update(0.0)
+        return self.game.visibility.can_see(self.hunter, self.prop)
+
+    def test_prop_in_front_and_in_range_is_visible(self):
+        self.assertTrue(self.see((10.0, 2.0)))
+        self.assertEqual(self.game.visibility.visible_to(self.hunter), {self.prop})
+        self.assertEqual(self.game.visibility.seen_by(self.prop), {self.hunter})
+
+    def test_prop_behind_hunter_is_not_visible(self):
+        self.assertFalse(self.see((-10.0, 0.0)))
+
+    def test_prop_out_of_range_is_not_visible(self):
+        self.assertFalse(self.see((self.game.visibility.view_distance + 1, 0.0)))
+
+    def test_walls_occlude(self):
+        handle, path = tempfile.mkstemp(suffix=".ctpl")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        write_level(path, boxes=[(4.0, -1.0, 5.0, 1.0)])
+        self.game.load_level(path)
+
+        self.assertFalse(self.see((10.0, 0.0)))
+        self.assertTrue(self.see((10.0, 5.0)))
+
+    def test_results_are_cached_between_refreshes(self):
+        self.game.visibility.interval = 1.0
+        self.assertTrue(self.see((10.0, 0.0)))
+
+        self.prop.position = (-10.0, 0.0)
+        self.game.update(0.5)
+        self.assertTrue(self.game.visibility.can_see(self.hunter, self.prop))
+
+        self.game.update(0.5)
+        self.assertFalse(self.game.visibility.can_see(self.hunter, self.prop))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for fire rate, timed reloads, held triggers and the timing wheel."""
+
+import unittest
+
+from core.game import Game
+from core.timing_wheel import TimingWheel
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15, GLOCK_17
+
+
+class TestTimingWheel(unittest.TestCase):
+    def test_due_timers_come_out_in_time_order(self):
+        wheel = TimingWheel(resolution=0.01, slots=4, levels=2)
+        for time in (5.0, 0.015, 0.3, 0.012):
+            wheel.schedule(time, time)
+
+        self.assertEqual(wheel.advance(0.1), [(0.012, 0.012), (0.015, 0.015)])
+        self.assertEqual(wheel.advance(1.0), [(0.3, 0.3)])
+        self.assertEqual(wheel.advance(10.0), [(5.0, 5.0)])
+        self.assertEqual(len(wheel), 0)
+
+    def test_timer_later_in_current_slot_waits(self):
+        wheel = TimingWheel(resolution=1.0)
+        wheel.schedule(0.75, "late")
+
+        self.assertEqual(wheel.advance(0.5), [])
+        self.assertEqual(wheel.advance(0.75), [(0.75, "late")])
+
+    def test_cancelled_timer_is_skipped(self):
+        wheel = TimingWheel()
+        handle = wheel.schedule(0.1, "cancelled")
+        wheel.schedule(0.2, "kept")
+        wheel.cancel(handle)
+
+        self.assertEqual(wheel.advance(1.0), [(0.2, "kept")])
+
+
+class TestWeaponTiming(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(text_output=False)
+        self.hunter = Player("Hunter", "hunter", self.game)
+        self.game.switch_state(self.game.playing_state)
+
+    def equip(self, spec, **kwargs):
+        gun = Gun(spec, **kwargs)
+        self.hunter.attempt_pickup_weapon(gun)
+        return gun
+
+    def test_fire_rate_limits_manual_shots(self):
+        self.equip(AR_15)
+
+        self.assertTrue(self.hunter.attempt_use_weapon())
+        self.assertIsNone(self.hunter.attempt_use_weapon())
+
+        self.game.update(1.0 / AR_15.fire_rate)
+        self.assertTrue(self.hunter.attempt_use_weapon())
+
+    def test_held_trigger_fires_at_rate_with_sub_tick_bullets(self):
+        gun = self.equip(AR_15)
+        self.hunter.attempt_hold_trigger()
+
+        self.game.update(0.25)
+
+        # Shots at t = 0.0, 0.1, 0.2.
+        self.assertEqual(AR_15.mag_size - gun.ammo, 3)
+        xs = sorted(round(b.x, 6) for b in self.game.bullets)
+        speed = AR_15.bullet_speed
+        self.assertEqual(xs, [round(speed * t, 6) for t in (0.05, 0.15, 0.25)])
+
+    def test_releasing_trigger_stops_automatic_fire(self):
+        gun = self.equip(AR_15)
+        self.hunter.attempt_hold_trigger()
+        self.game.update(0.05)
+        self.hunter.attempt_hold_trigger(False)
+
+        self.game.update(1.0)
+
+        self.assertEqual(AR_15.mag_size - gun.ammo, 1)
+
+    def test_semi_automatic_fires_once_per_press(self):
+        gun = self.equip(GLOCK_17)
+        self.hunter.attempt_hold_trigger()
+
+        self.game.update(1.0)
+
+        self.assertEqual(GLOCK_17.mag_size - gun.ammo, 1)
+
+    def test_reload_completes_after_reload_time(self):
+        gun = self.equip(AR_15, starting_ammo=0)
+
+        self.assertTrue(self.hunter.attempt_reload())
+        self.assertIsNone(self.hunter.attempt_reload())
+        self.game.update(AR_15.reload_time / 2)
+        self.assertEqual(gun.ammo, 0)
+        self.assertIsNone(self.hunter.attempt_use_weapon())
+
+        self.game.update(AR_15.reload_time)
+        self.assertEqual(gun.ammo, AR_15.mag_size)
+        self.assertFalse(gun.reloading)
+
+    def test_lobby_denies_trigger_and_reload(self):
+        self.equip(AR_15, starting_ammo=0)
+        self.game.switch_state(self.game.lobby_state)
+
+        self.assertFalse(self.hunter.attempt_hold_trigger())
+        self.assertFalse(self.hunter.attempt_reload())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+"""
+Monte-Carlo weapon balance simulator.
+
+Runs many seeded, headless duels between two loadouts through the real
+firing pipeline (Gun.use -> ActiveEffects.modify_shot -> bullet -> impact)
+and reports win rates and time-to-kill distributions. A sweep is split into
+batches that run on a process pool; each worker reuses one Game through
+Game.reset().
+
+    python -m tools.balance --duels 20000 --multipliers 1.0 1.25 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from core.game import Game
+from entities.effects.apply_shot_value_modifier_effect import ApplyShotValueModifierEffect
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_catalog import default_catalog
+from entities.weapons.shot_values.damage_multiplier import DamageMultiplier
+
+
+@dataclass(frozen=True)
+class Loadout:
+    gun: str
+    damage_multiplier: float = 1.0
+
+    @property
+    def label(self) -> str:
+        if self.damage_multiplier == 1.0:
+            return self.gun
+        return f"{self.gun} x{self.damage_multiplier:g}"
+
+
+@dataclass(frozen=True)
+class Matchup:
+    a: Loadout
+    b: Loadout
+
+    @property
+    def label(self) -> str:
+        return f"{self.a.label} vs {self.b.label}"
+
+
+@dataclass(frozen=True)
+class DuelSettings:
+    min_distance: float = 5.0
+    max_distance: float = 40.0
+    # Seconds before each side starts shooting, drawn per duel.
+    min_reaction: float = 0.15
+    max_reaction: float = 0.35
+    tick_rate: float = 60.0
+    time_limit: float = 15.0
+
+
+@dataclass
+class BatchResult:
+    duels: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    draws: int = 0
+    ttk_a: array = field(default_factory=lambda: array("d"))
+    ttk_b: array = field(default_factory=lambda: array("d"))
+
+    def merge(self, other: "BatchResult") -> None:
+        self.duels += other.duels
+        self.wins_a += other.wins_a
+        self.wins_b += other.wins_b
+        self.draws += other.draws
+        self.ttk_a.extend(other.ttk_a)
+        self.ttk_b.extend(other.ttk_b)
+
+
+@dataclass
+class MatchupReport:
+    matchup: Matchup
+    result: BatchResult
+
+    @property
+    def win_rate_a(self) -> float:
+        return self.result.wins_a / self.result.duels if self.result.duels else 0.0
+
+    @property
+    def win_rate_b(self) -> float:
+        return self.result.wins_b / self.result.duels if self.result.duels else 0.0
+
+    @staticmethod
+    def ttk_stats(samples: Sequence[float]) -> Optional[dict[str, float]]:
+        """Mean, spread and deciles of a time-to-kill sample, in seconds."""
+        if not samples:
+            return None
+        deciles = statistics.quantiles(samples, n=10) if len(samples) > 1 else [samples[0]] * 9
+        return {
+            "mean": statistics.fmean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "p10": deciles[0],
+            "p50": deciles[4],
+            "p90": deciles[8],
+        }
+
+    def format(self) -> str:
+        result = self.result
+        lines = [
+            f"{self.matchup.label}: {result.duels} duels, "
+            f"win {self.win_rate_a:.1%} / {self.win_rate_b:.1%}, draws {result.draws}"
+        ]
+        for loadout, samples in ((self.matchup.a, result.ttk_a), (self.matchup.b, result.ttk_b)):
+            stats = self.ttk_stats(samples)
+            if stats is None:
+                lines.append(f"  {loadout.label}: no kills")
+                continue
+            lines.append(
+                f"  {loadout.label}: ttk mean {stats['mean']:.3f}s  sd {stats['stdev']:.3f}  "
+                f"p10 {stats['p10']:.3f}  p50 {stats['p50']:.3f}  p90 {stats['p90']:.3f}"
+            )
+        return "\n".join(lines)
+
+
+# ============================================================
+# Duels (run inside workers)
+# ============================================================
+
+_game: Optional[Game] = None
+
+
+def _fresh_game() -> Game:
+    # One Game per process, reset between duels rather than rebuilt.
+    global _game
+    if _game is None:
+        _game = Game(text_output=False)
+    else:
+        _game.reset()
+    return _game
+
+
+def _arm(game: Game, player: Player, loadout: Loadout) -> Gun:
+    gun = Gun(default_catalog().by_name(loadout.gun))
+    player.attempt_pickup_weapon(gun)
+    if loadout.damage_multiplier != 1.0:
+        player.attempt_add_effect(
+            ApplyShotValueModifierEffect(DamageMultiplier(loadout.damage_multiplier))
+        )
+    return gun
+
+
+def duel(matchup: Matchup, rng: random.Random, settings: DuelSettings = DuelSettings()):
+    """
+    One duel at a random range. Side a is a hunter and side b a prop, both
+    facing each other with the same hitbox. Returns ("a" | "b" | None, time).
+    """
+    game = _fresh_game()
+    game.weapons.rng = rng
+
+    distance = rng.uniform(settings.min_distance, settings.max_distance)
+    a = Player("a", "hunter", game)
+    b = Player("b", "prop", game)
+    a.position, a.direction = (0.0, 0.0), (1.0, 0.0)
+    b.position, b.direction = (distance, 0.0), (-1.0, 0.0)
+    game.switch_state(game.playing_state)
+
+    sides = []
+    for player, loadout in ((a, matchup.a), (b, matchup.b)):
+        gun = _arm(game, player, loadout)
+        sides.append((player, gun, rng.uniform(settings.min_reaction, settings.max_reaction)))
+
+    dt = 1.0 / settings.tick_rate
+    while game.time < settings.time_limit:
+        horizon = game.time + dt
+        for player, gun, reaction in sides:
+            if horizon < reaction:
+                continue
+            if gun.ammo == 0:
+                if not gun.reloading:
+                    player.attempt_reload()
+            elif not gun.reloading and gun.next_fire_time < horizon:
+                # Held triggers fire at the gun's exact sub-tick fire time.
+                player.attempt_hold_trigger(True)
+        game.update(dt)
+
+        a_dead = a not in game.hunters
+        b_dead = b not in game.props
+        if a_dead or b_dead:
+            if a_dead and b_dead:
+                return None, game.time
+            return ("b" if a_dead else "a"), game.time
+    return None, game.time
+
+
+def simulate(
+    matchup: Matchup, seed: str, duels: int, settings: DuelSettings = DuelSettings()
+) -> BatchResult:
+    """A batch of duels drawn from one seed; the unit of work sent to the pool."""
+    rng = random.Random(seed)
+    result = BatchResult(duels=duels)
+    for _ in range(duels):
+        winner, ttk = duel(matchup, rng, settings)
+        if winner == "a":
+            result.wins_a += 1
+            result.ttk_a.append(ttk)
+        elif winner == "b":
+            result.wins_b += 1
+            result.ttk_b.append(ttk)
+        else:
+            result.draws += 1
+    return result
+
+
+# ============================================================
+# Sweeps
+# ============================================================
+
+
+def default_matchups(multipliers: Sequence[float] = (1.0,)) -> list[Matchup]:
+    """Every catalog gun against every other, at each damage multiplier for side a."""
+    catalog = default_catalog()
+    names = [catalog.get(i).name for i in range(len(catalog))]
+    return [
+        Matchup(Loadout(a, multiplier), Loadout(b))
+        for a, b in itertools.product(names, repeat=2)
+        for multiplier in multipliers
+    ]
+
+
+def sweep(
+    matchups: Sequence[Matchup],
+    duels: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    batch_size: int = 500,
+    settings: DuelSettings = DuelSettings(),
+) -> list[MatchupReport]:
+    """
+    Run duels per matchup split into batches of batch_size. Each batch is
+    seeded from (seed, matchup, batch), so results don't depend on the
+    worker count. workers=1 runs in this process.
+    """
+    jobs = []
+    for index, matchup in enumerate(matchups):
+        for batch, start in enumerate(range(0, duels, batch_size)):
+            count = min(batch_size, duels - start)
+            jobs.append((index, (matchup, f"{seed}:{index}:{batch}", count, settings)))
+
+    results = [BatchResult() for _ in matchups]
+    if workers == 1:
+        for index, args in jobs:
+            results[index].merge(simulate(*args))
+    else:
+        # Imported on use; single-process runs never start a pool.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(index, pool.submit(simulate, *args)) for index, args in jobs]
+            for index, future in futures:
+                results[index].merge(future.result())
+
+    return [MatchupReport(matchup, result) for matchup, result in zip(matchups, results)]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duels", type=int, default=10000, help="duels per matchup")
+    parser.add_argument("--multipliers", type=float, nargs="+", default=[1.0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-distance", type=float, default=DuelSettings.min_distance)
+    parser.add_argument("--max-distance", type=float, default=DuelSettings.max_distance)
+    parser.add_argument("--tick-rate", type=float, default=DuelSettings.tick_rate)
+    args = parser.parse_args(argv)
+
+    settings = DuelSettings(
+        min_distance=args.min_distance,
+        max_distance=args.max_distance,
+        tick_rate=args.tick_rate,
+    )
+    matchups = default_matchups(args.multipliers)
+    started = time.perf_counter()
+    reports = sweep(matchups, args.duels, args.seed, args.workers, args.batch_size, settings)
+    seconds = time.perf_counter() - started
+
+    for report in reports:
+        print(report.format())
+    total = sum(report.result.duels for report in reports)
+    print(f"{total} duels in {seconds:.1f}s ({total / seconds:.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Headless load generator.
+
+Fills a real Game with scripted bots and steps it at a fixed tick,
+reporting sustained ticks/sec, tick-time percentiles and memory growth.
+Text output is disabled, so Player.update printing never runs.
+
+    python -m tools.loadgen --hunters 200 --props 400 --guardians 50 --ticks 1200
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Optional
+
+from core.game import Game
+from entities.effects.apply_movement_modifier_effect import ApplyMovementModifierEffect
+from entities.effects.apply_shot_value_modifier_effect import ApplyShotValueModifierEffect
+from entities.movement.modifiers.speed_multiplier import SpeedMultiplier
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15, GLOCK_17
+from entities.weapons.shot_values.damage_multiplier import DamageMultiplier
+
+
+@dataclass
+class LoadReport:
+    bots: int
+    ticks: int
+    seconds: float
+    tick_times: list[float] = field(repr=False)
+    memory_start: int = 0
+    memory_end: int = 0
+    memory_peak: int = 0
+    memory_source: str = "rss"
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds else float("inf")
+
+    @property
+    def memory_growth(self) -> int:
+        return self.memory_end - self.memory_start
+
+    def percentile(self, p: float) -> float:
+        """Tick time in milliseconds at percentile p (0-100)."""
+        ordered = sorted(self.tick_times)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index] * 1000.0
+
+    def format(self) -> str:
+        return "\n".join([
+            f"bots:          {self.bots}",
+            f"ticks:         {self.ticks} in {self.seconds:.2f}s",
+            f"ticks/sec:     {self.ticks_per_second:.1f}",
+            f"tick ms:       p50 {self.percentile(50):.3f}  p90 {self.percentile(90):.3f}  "
+            f"p99 {self.percentile(99):.3f}  max {max(self.tick_times) * 1000:.3f}  "
+            f"mean {statistics.fmean(self.tick_times) * 1000:.3f}",
+            self._format_memory(),
+        ])
+
+    def _format_memory(self) -> str:
+        if not self.memory_peak:
+            return "memory:        unavailable"
+        return (
+            f"memory ({self.memory_source}): {self.memory_start / 1024:.0f} KiB -> "
+            f"{self.memory_end / 1024:.0f} KiB (growth {self.memory_growth / 1024:+.0f} KiB, "
+            f"peak {self.memory_peak / 1024:.0f} KiB)"
+        )
+
+
+# ============================================================
+# Bot policies
+# ============================================================
+
+class RandomWalkBot:
+    """Wanders, and if armed fires, reloads and picks up buffs at random."""
+
+    step = 0.2
+    fire_chance = 0.02
+    effect_chance = 0.005
+
+    def __init__(self, player: Player, rng: random.Random, arena: float):
+        self.player = player
+        self.rng = rng
+        self.arena = arena
+        self.heading = rng.uniform(0.0, math.tau)
+        self.seq = 0
+        self.gun: Optional[Gun] = None
+
+    def next_position(self) -> tuple[float, float]:
+        self.heading += self.rng.uniform(-0.5, 0.5)
+        x, y = self.player.position
+        x += math.cos(self.heading) * self.step
+        y += math.sin(self.heading) * self.step
+        if not (-self.arena <= x <= self.arena and -self.arena <= y <= self.arena):
+            self.heading += math.pi
+            x = max(-self.arena, min(self.arena, x))
+            y = max(-self.arena, min(self.arena, y))
+        return (x, y)
+
+    def act(self) -> None:
+        player = self.player
+        if player.health <= 0:
+            return
+
+        x, y = next_position = self.next_position()
+        dx = x - player.position[0]
+        dy = y - player.position[1]
+        if dx or dy:
+            player.direction = (dx, dy)
+        self.seq += 1
+        player.attempt_move(next_position, seq=self.seq)
+
+        rng = self.rng
+        gun = self.gun
+        if gun is not None:
+            # Shots leave from where this tick's move put the bot.
+            player.game.movement.settle(player)
+            if gun.ammo == 0:
+                if not gun.reloading:
+                    player.attempt_reload()
+            elif rng.random() < self.fire_chance:
+                self.seq += 1
+                player.attempt_use_weapon(seq=self.seq)
+
+        if rng.random() < self.effect_chance:
+            if rng.random() < 0.5:
+                player.attempt_add_effect(ApplyMovementModifierEffect(SpeedMultiplier(1.5)))
+            else:
+                player.attempt_add_effect(ApplyShotValueModifierEffect(DamageMultiplier(1.5)))
+
+
+class PatrolBot(RandomWalkBot):
+    """Walks a fixed circle around its spawn point."""
+
+    def __init__(self, player: Player, rng: random.Random, arena: float):
+        super().__init__(player, rng, arena)
+        self.center = player.position
+        self.radius = rng.uniform(2.0, 10.0)
+
+    def next_position(self) -> tuple[float, float]:
+        self.heading += self.step / self.radius
+        cx, cy = self.center
+        return (cx + math.cos(self.heading) * self.radius, cy + math.sin(self.heading) * self.radius)
+
+
+POLICIES = {
+    "random": RandomWalkBot,
+    "patrol": PatrolBot,
+}
+
+
+def spawn_bots(
+    game: Game,
+    hunters: int,
+    props: int,
+    guardians: int,
+    policy: str = "random",
+    seed: int = 0,
+    arena: float = 100.0,
+) -> list[RandomWalkBot]:
+    rng = random.Random(seed)
+    bot_type = POLICIES[policy]
+    bots = []
+    for role, count in (("hunter", hunters), ("prop", props), ("guardian", guardians)):
+        for i in range(count):
+            player = Player(f"{role}-{i}", role, game)
+            player.position = (rng.uniform(-arena, arena), rng.uniform(-arena, arena))
+            bot = bot_type(player, random.Random(rng.random()), arena)
+            if role == "hunter":
+                bot.gun = Gun(AR_15 if rng.random() < 0.5 else GLOCK_17)
+                player.attempt_pickup_weapon(bot.gun)
+            bots.append(bot)
+    return bots
+
+
+def run(
+    hunters: int = 100,
+    props: int = 200,
+    guardians: int = 20,
+    ticks: int = 600,
+    tick_rate: float = 60.0,
+    warmup: int = 60,
+    policy: str = "random",
+    seed: int = 0,
+    trace_memory: bool = False,
+) -> LoadReport:
+    """
+    Run a match for warmup + ticks ticks and measure the last ticks of them.
+
+    Memory is process RSS by default. trace_memory measures the Python heap
+    with tracemalloc instead, which is exact but makes every tick several
+    times slower, so tick times from such a run are not representative.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        game = Game(text_output=False)
+        bots = spawn_bots(game, hunters, props, guardians, policy, seed)
+        game.switch_state(game.playing_state)
+        dt = 1.0 / tick_rate
+
+        def step() -> None:
+            with game.movement.batch():
+                for bot in bots:
+                    bot.act()
+            game.update(dt)
+            # Stand in for the network layer that would deliver these.
+            game.inputs.drain_corrections()
+
+        for _ in range(warmup):
+            step()
+
+        if trace_memory:
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        else:
+            memory_start = _rss_bytes()
+
+        clock = time.perf_counter
+        tick_times = []
+        started = clock()
+        for _ in range(ticks):
+            tick_start = clock()
+            step()
+            tick_times.append(clock() - tick_start)
+        seconds = clock() - started
+
+        if trace_memory:
+            memory_end, memory_peak = tracemalloc.get_traced_memory()
+        else:
+            memory_end = _rss_bytes()
+            memory_peak = max(memory_start, memory_end)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return LoadReport(
+        bots=len(bots),
+        ticks=ticks,
+        seconds=seconds,
+        tick_times=tick_times,
+        memory_start=memory_start,
+        memory_end=memory_end,
+        memory_peak=memory_peak,
+        memory_source="tracemalloc" if trace_memory else "rss",
+    )
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process, or 0 where it can't be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # Peak rather than current, but still shows growth across a long run.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hunters", type=int, default=100)
+    parser.add_argument("--props", type=int, default=200)
+    parser.add_argument("--guardians", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--tick-rate", type=float, default=60.0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="measure Python heap growth with tracemalloc (slows every tick)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(
+        hunters=args.hunters,
+        props=args.props,
+        guardians=args.guardians,
+        ticks=args.ticks,
+        tick_rate=args.tick_rate,
+        warmup=args.warmup,
+        policy=args.policy,
+        seed=args.seed,
+        trace_memory=args.tracemalloc,
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Match startup benchmark.
+
+Measures the costs on the lobby-fill path: importing core.game in a fresh
+interpreter, building a Game, resetting a used one, and taking one from a
+pre-warmed GamePool.
+
+    python -m tools.startup_bench --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from core.game import Game
+from core.game_pool import GamePool
+from entities.player import Player
+from entities.weapons.gun import Gun
+from entities.weapons.gun_library import AR_15
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def cold_import_seconds(runs: int = 5) -> float:
+    """Median wall time of `import core.game` in a fresh interpreter, minus a bare start."""
+    def median_run(code: str) -> float:
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+            samples.append(time.perf_counter() - started)
+        return statistics.median(samples)
+
+    return max(0.0, median_run("import core.game") - median_run("pass"))
+
+
+def play_a_little(game: Game, players: int = 20) -> None:
+    """Dirty a Game the way a short match would, so reset has work to do."""
+    game.switch_state(game.playing_state)
+    for i in range(players):
+        player = Player(f"p{i}", "hunter" if i % 2 else "prop", game)
+        player.position = (float(i), 0.0)
+        if i % 2:
+            player.attempt_pickup_weapon(Gun(AR_15))
+            player.attempt_hold_trigger(True)
+    for _ in range(30):
+        game.update(1 / 60)
+
+
+def time_each(setup: Callable[[], object], action: Callable[[object], object], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        subject = setup()
+        started = time.perf_counter()
+        action(subject)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run(repeat: int = 200, import_runs: int = 5) -> dict[str, list[float]]:
+    def used_game():
+        game = Game(text_output=False)
+        play_a_little(game)
+        return game
+
+    pool = GamePool(text_output=False)
+
+    def warmed_pool():
+        pool.prewarm(1 - len(pool))
+        return pool
+
+    results = {
+        "cold import": [cold_import_seconds(import_runs)] if import_runs else [],
+        "Game()": time_each(lambda: None, lambda _: Game(text_output=False), repeat),
+        "Game.reset() after play": time_each(used_game, Game.reset, repeat),
+        "GamePool.acquire()": time_each(warmed_pool, GamePool.acquire, repeat),
+    }
+    return {name: samples for name, samples in results.items() if samples}
+
+
+def format_results(results: dict[str, list[float]]) -> str:
+    lines = []
+    for name, samples in results.items():
+        ordered = sorted(samples)
+        p50 = ordered[len(ordered) // 2] * 1e6
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6
+        lines.append(f"{name:<26} p50 {p50:10.1f} us   p99 {p99:10.1f} us")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--import-runs", type=int, default=5, help="0 skips the cold import test")
+    args = parser.parse_args(argv)
+    print(format_results(run(args.repeat, args.import_runs)))
+
+
+if __name__ == "__main__":
+    main()